@@ -4,6 +4,14 @@ import React, { useState, useEffect, useMemo, useRef, useCallback } from 'react'
 import { PrefixGroup, ScreenData, WbsTask, TestCase, WbsStatus, QAStatus, QAProgress, QAPriority, QAPosition, Comment } from '../types';
 import { CoverThumbnail } from './CoverThumbnail';
 import { StatusSelect, UserSelect } from './ui';
+import {
+  getWbsTasksByScreens,
+  getTestCasesByScreens,
+  putWbsTask,
+  putTestCase,
+  removeWbsTask,
+  removeTestCase,
+} from '../services/screenDataStore';
 
 const WBS_STATUS_OPTIONS = ['Planning', 'In Progress', 'Done'] as const;
 const QA_STATUS_OPTIONS = ['Reviewing', 'DevError', 'ProdError', 'DevDone', 'ProdDone', 'Hold'] as const;
@@ -71,55 +79,38 @@ const DetailModal: React.FC<DetailModalProps> = ({ group, onClose }) => {
     }
   }, [activeScreenId, activeScreen, allScreens]);
 
-  const getKeys = (screenId: string) => ({
-    wbs: `wbs_${screenId}`,
-    qa: `qa_${screenId}`
-  });
-
   useEffect(() => {
     // Load WBS/QA data for active screen(s)
-    let aggregatedWbs: WbsTask[] = [];
-    let aggregatedQa: TestCase[] = [];
-
-    activeScreensForData.forEach(s => {
-      const savedWbs = localStorage.getItem(`wbs_${s.figmaId}`);
-      const savedQa = localStorage.getItem(`qa_${s.figmaId}`);
-      if (savedWbs) {
-        const tasks = JSON.parse(savedWbs).map((t: WbsTask) => ({ ...t, originScreenId: s.figmaId }));
-        aggregatedWbs = [...aggregatedWbs, ...tasks];
-      }
-      if (savedQa) {
-        const cases = JSON.parse(savedQa).map((c: TestCase) => ({ ...c, originScreenId: s.figmaId }));
-        aggregatedQa = [...aggregatedQa, ...cases];
-      }
-    });
+    let cancelled = false;
+    const screenIds = activeScreensForData.map(s => s.figmaId);
+
+    Promise.all([getWbsTasksByScreens(screenIds), getTestCasesByScreens(screenIds)])
+      .then(([tasks, cases]) => {
+        if (cancelled) return;
+        setWbsTasks(tasks);
+        setTestCases(cases);
+      })
+      .catch(error => console.error('Failed to load WBS/QA data:', error));
 
-    setWbsTasks(aggregatedWbs);
-    setTestCases(aggregatedQa);
     setEditingQAId(null);
+    return () => {
+      cancelled = true;
+    };
   }, [activeScreenId, activeScreensForData]);
 
-  const saveToStorage = (tasks: WbsTask[], cases: TestCase[]) => {
-    // Partition by originScreenId
-    activeScreensForData.forEach(s => {
-      const screenTasks = tasks.filter(t => t.originScreenId === s.figmaId || (!t.originScreenId && s === activeScreensForData[0]));
-      const screenCases = cases.filter(c => c.originScreenId === s.figmaId || (!c.originScreenId && s === activeScreensForData[0]));
-      const { wbs, qa } = getKeys(s.figmaId);
-      localStorage.setItem(wbs, JSON.stringify(screenTasks));
-      localStorage.setItem(qa, JSON.stringify(screenCases));
-    });
-  };
-
+  // Only the changed item is persisted
   const updateWbsTask = (id: string, updates: Partial<WbsTask>) => {
     const next = wbsTasks.map(t => t.id === id ? { ...t, ...updates } : t);
     setWbsTasks(next);
-    saveToStorage(next, testCases);
+    const updated = next.find(t => t.id === id);
+    if (updated) putWbsTask(updated);
   };
 
   const updateTestCase = (id: string, updates: Partial<TestCase>) => {
     const next = testCases.map(t => t.id === id ? { ...t, ...updates } : t);
     setTestCases(next);
-    saveToStorage(wbsTasks, next);
+    const updated = next.find(t => t.id === id);
+    if (updated) putTestCase(updated);
   };
 
   const qaProgress = useMemo(() => {
@@ -163,9 +154,8 @@ const DetailModal: React.FC<DetailModalProps> = ({ group, onClose }) => {
       endDate: today,
       originScreenId: activeScreensForData[0]?.figmaId || ''
     };
-    const next = [...wbsTasks, newTask];
-    setWbsTasks(next);
-    saveToStorage(next, testCases);
+    setWbsTasks([...wbsTasks, newTask]);
+    putWbsTask(newTask);
   };
 
   const addTestCase = () => {
@@ -185,9 +175,8 @@ const DetailModal: React.FC<DetailModalProps> = ({ group, onClose }) => {
       comments: [],
       originScreenId: activeScreensForData[0]?.figmaId || ''
     };
-    const next = [...testCases, newTC];
-    setTestCases(next);
-    saveToStorage(wbsTasks, next);
+    setTestCases([...testCases, newTC]);
+    putTestCase(newTC);
     setEditingQAId(newTC.id);
   };
 
@@ -675,9 +664,8 @@ const DetailModal: React.FC<DetailModalProps> = ({ group, onClose }) => {
                             {!isMasterView && (
                               <td className="px-8 py-5 text-right">
                                  <button onClick={() => {
-                                   const next = wbsTasks.filter(t => t.id !== task.id);
-                                   setWbsTasks(next);
-                                   saveToStorage(next, testCases);
+                                   setWbsTasks(wbsTasks.filter(t => t.id !== task.id));
+                                   removeWbsTask(task.id);
                                  }} className="text-slate-300 hover:text-red-600 text-2xl font-black transition-colors">×</button>
                               </td>
                             )}
@@ -961,9 +949,8 @@ const DetailModal: React.FC<DetailModalProps> = ({ group, onClose }) => {
 
                   <div className="pt-12 flex justify-between items-center">
                     <button onClick={() => {
-                      const next = testCases.filter(t => t.id !== editingQA.id);
-                      setTestCases(next);
-                      saveToStorage(wbsTasks, next);
+                      setTestCases(testCases.filter(t => t.id !== editingQA.id));
+                      removeTestCase(editingQA.id);
                       setEditingQAId(null);
                     }} className="text-[11px] font-black text-red-600 hover:text-red-800 uppercase tracking-widest transition-colors">기록 삭제</button>
                     <button onClick={() => setEditingQAId(null)} className="px-10 py-4 bg-slate-900 text-white rounded-2xl text-[11px] font-black uppercase tracking-widest shadow-xl shadow-slate-400">변경사항 저장</button>
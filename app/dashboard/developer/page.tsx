@@ -4,6 +4,8 @@ import React, { useState, useEffect, useMemo } from 'react';
 import { useRouter } from 'next/navigation';
 import { WbsTask, TestCase, QAProgress } from '../../types';
 import { UserSelect } from '../../components/ui';
+import { queryWbsTasks, queryTestCases, getDashboardSummary } from '../../services/screenDataStore';
+import { DashboardSummary } from '../../services/dashboardSummary';
 
 const TEAM_MEMBERS = ['테스', '잭', '멜러리', '이리나', '미쉘', '션', '키요'];
 
@@ -18,41 +20,33 @@ const PROGRESS_COLUMNS: { key: QAProgress; label: string; color: string }[] = [
 export default function DeveloperDashboard() {
   const router = useRouter();
   const [currentUser, setCurrentUser] = useState(TEAM_MEMBERS[0]);
-  const [allWbsTasks, setAllWbsTasks] = useState<WbsTask[]>([]);
-  const [allTestCases, setAllTestCases] = useState<TestCase[]>([]);
+  const [myWbsTasks, setMyWbsTasks] = useState<WbsTask[]>([]);
+  const [myTestCases, setMyTestCases] = useState<TestCase[]>([]);
+  const [summary, setSummary] = useState<DashboardSummary | null>(null);
 
-  // Load all data from localStorage
+  // Stat cards render from the precomputed summary
   useEffect(() => {
-    const wbsTasks: WbsTask[] = [];
-    const testCases: TestCase[] = [];
-
-    // Scan all localStorage keys for wbs_ and qa_ prefixes
-    for (let i = 0; i < localStorage.length; i++) {
-      const key = localStorage.key(i);
-      if (key?.startsWith('wbs_')) {
-        const data = JSON.parse(localStorage.getItem(key) || '[]');
-        wbsTasks.push(...data.map((t: WbsTask) => ({ ...t, originScreenId: key.replace('wbs_', '') })));
-      }
-      if (key?.startsWith('qa_')) {
-        const data = JSON.parse(localStorage.getItem(key) || '[]');
-        testCases.push(...data.map((t: TestCase) => ({ ...t, originScreenId: key.replace('qa_', '') })));
-      }
-    }
-
-    setAllWbsTasks(wbsTasks);
-    setAllTestCases(testCases);
+    getDashboardSummary()
+      .then(setSummary)
+      .catch(error => console.error('Failed to load dashboard summary:', error));
   }, []);
 
-  // Filter by current user
-  const myWbsTasks = useMemo(() =>
-    allWbsTasks.filter(t => t.assignee === currentUser),
-    [allWbsTasks, currentUser]
-  );
-
-  const myTestCases = useMemo(() =>
-    allTestCases.filter(t => t.assignee === currentUser),
-    [allTestCases, currentUser]
-  );
+  // Full records only for the selected user, through the assignee index
+  useEffect(() => {
+    let cancelled = false;
+
+    Promise.all([queryWbsTasks('assignee', currentUser), queryTestCases('assignee', currentUser)])
+      .then(([wbsTasks, testCases]) => {
+        if (cancelled) return;
+        setMyWbsTasks(wbsTasks);
+        setMyTestCases(testCases);
+      })
+      .catch(error => console.error('Failed to load dashboard data:', error));
+
+    return () => {
+      cancelled = true;
+    };
+  }, [currentUser]);
 
   // Group test cases by progress for Kanban
   const tcByProgress = useMemo(() => {
@@ -72,14 +66,18 @@ export default function DeveloperDashboard() {
   }, [myTestCases]);
 
   // Stats
-  const stats = useMemo(() => ({
-    totalWbs: myWbsTasks.length,
-    wbsInProgress: myWbsTasks.filter(t => t.status === 'In Progress').length,
-    wbsDone: myWbsTasks.filter(t => t.status === 'Done').length,
-    totalTc: myTestCases.length,
-    tcResolved: myTestCases.filter(t => t.status === 'DevDone' || t.status === 'ProdDone').length,
-    tcErrors: myTestCases.filter(t => t.status === 'DevError' || t.status === 'ProdError').length,
-  }), [myWbsTasks, myTestCases]);
+  const stats = useMemo(() => {
+    const wbs = summary?.wbs.byAssignee[currentUser];
+    const tc = summary?.tc.byAssignee[currentUser];
+    return {
+      totalWbs: wbs?.total ?? 0,
+      wbsInProgress: wbs?.inProgress ?? 0,
+      wbsDone: wbs?.done ?? 0,
+      totalTc: tc?.total ?? 0,
+      tcResolved: tc?.resolved ?? 0,
+      tcErrors: tc?.errors ?? 0,
+    };
+  }, [summary, currentUser]);
 
   return (
     <div className="min-h-screen bg-slate-100">
@@ -2,7 +2,9 @@
 
 import React, { useState, useEffect, useMemo } from 'react';
 import { useRouter } from 'next/navigation';
-import { TestCase, QAStatus, QAPriority } from '../../types';
+import { QAStatus } from '../../types';
+import { getDashboardSummary, rebuildDashboardSummary } from '../../services/screenDataStore';
+import { DashboardSummary, createEmptySummary } from '../../services/dashboardSummary';
 
 const TEAM_MEMBERS = ['테스', '잭', '멜러리', '이리나', '미쉘', '션', '키요'];
 
@@ -17,106 +19,41 @@ const STATUS_CONFIG: { key: QAStatus; label: string; color: string; bgColor: str
 
 export default function QADashboard() {
   const router = useRouter();
-  const [allTestCases, setAllTestCases] = useState<TestCase[]>([]);
-  const [screenNames, setScreenNames] = useState<Record<string, string>>({});
+  const [summary, setSummary] = useState<DashboardSummary>(() => createEmptySummary());
+  const [isRebuilding, setIsRebuilding] = useState(false);
 
-  // Load all TC data from localStorage
+  // Everything on this page comes from the precomputed summary; no TC records are read
   useEffect(() => {
-    const testCases: TestCase[] = [];
-    const names: Record<string, string> = {};
-
-    for (let i = 0; i < localStorage.length; i++) {
-      const key = localStorage.key(i);
-      if (key?.startsWith('qa_')) {
-        const screenId = key.replace('qa_', '');
-        const data = JSON.parse(localStorage.getItem(key) || '[]');
-        testCases.push(...data.map((t: TestCase) => ({ ...t, originScreenId: screenId })));
-      }
-      // Try to get screen names from group data
-      if (key?.startsWith('group_')) {
-        try {
-          const group = JSON.parse(localStorage.getItem(key) || '{}');
-          Object.values(group.baseIds || {}).flat().forEach((screen: any) => {
-            if (screen.figmaId && screen.name) {
-              names[screen.figmaId] = screen.name;
-            }
-          });
-        } catch (e) {}
-      }
-    }
-
-    setAllTestCases(testCases);
-    setScreenNames(names);
+    getDashboardSummary()
+      .then(setSummary)
+      .catch(error => console.error('Failed to load dashboard summary:', error));
   }, []);
 
-  // Stats by status
-  const statusStats = useMemo(() => {
-    const stats: Record<QAStatus, number> = {
-      'Reviewing': 0,
-      'DevError': 0,
-      'ProdError': 0,
-      'DevDone': 0,
-      'ProdDone': 0,
-      'Hold': 0,
-      'Rejected': 0,
-      'Duplicate': 0,
-    };
-    allTestCases.forEach(tc => {
-      stats[tc.status]++;
-    });
-    return stats;
-  }, [allTestCases]);
-
-  // Stats by priority
-  const priorityStats = useMemo(() => {
-    const stats: Record<QAPriority, number> = {
-      'High': 0,
-      'Medium': 0,
-      'Low': 0,
-    };
-    allTestCases.forEach(tc => {
-      stats[tc.priority]++;
-    });
-    return stats;
-  }, [allTestCases]);
+  const handleRebuild = async () => {
+    setIsRebuilding(true);
+    try {
+      setSummary(await rebuildDashboardSummary());
+    } catch (error) {
+      console.error('Failed to rebuild dashboard summary:', error);
+    } finally {
+      setIsRebuilding(false);
+    }
+  };
 
-  // Stats by screen (coverage)
-  const screenStats = useMemo(() => {
-    const stats: Record<string, { total: number; resolved: number; errors: number }> = {};
-    allTestCases.forEach(tc => {
-      const screenId = tc.originScreenId || 'unknown';
-      if (!stats[screenId]) {
-        stats[screenId] = { total: 0, resolved: 0, errors: 0 };
-      }
-      stats[screenId].total++;
-      if (tc.status === 'DevDone' || tc.status === 'ProdDone') {
-        stats[screenId].resolved++;
-      }
-      if (tc.status === 'DevError' || tc.status === 'ProdError') {
-        stats[screenId].errors++;
-      }
-    });
-    return stats;
-  }, [allTestCases]);
+  const statusStats = summary.tc.byStatus;
+  const priorityStats = summary.tc.byPriority;
+  const screenStats = summary.tc.byScreen;
+  const screenNames = summary.screenNames;
 
   // Stats by assignee
   const assigneeStats = useMemo(() => {
     const stats: Record<string, { total: number; resolved: number; inProgress: number }> = {};
     TEAM_MEMBERS.forEach(m => {
-      stats[m] = { total: 0, resolved: 0, inProgress: 0 };
-    });
-    allTestCases.forEach(tc => {
-      if (stats[tc.assignee]) {
-        stats[tc.assignee].total++;
-        if (tc.status === 'DevDone' || tc.status === 'ProdDone') {
-          stats[tc.assignee].resolved++;
-        } else if (tc.progress === 'Working' || tc.progress === 'Checking') {
-          stats[tc.assignee].inProgress++;
-        }
-      }
+      const { total = 0, resolved = 0, inProgress = 0 } = summary.tc.byAssignee[m] || {};
+      stats[m] = { total, resolved, inProgress };
     });
     return stats;
-  }, [allTestCases]);
+  }, [summary]);
 
   // TC by date (last 14 days trend)
   const dateTrend = useMemo(() => {
@@ -125,17 +62,13 @@ export default function QADashboard() {
     for (let i = 13; i >= 0; i--) {
       const date = new Date(today);
       date.setDate(date.getDate() - i);
-      trend[date.toISOString().split('T')[0]] = 0;
+      const key = date.toISOString().split('T')[0];
+      trend[key] = summary.tc.byDate[key] || 0;
     }
-    allTestCases.forEach(tc => {
-      if (trend[tc.date] !== undefined) {
-        trend[tc.date]++;
-      }
-    });
     return trend;
-  }, [allTestCases]);
+  }, [summary]);
 
-  const totalTC = allTestCases.length;
+  const totalTC = summary.tc.total;
   const resolvedTC = statusStats['DevDone'] + statusStats['ProdDone'];
   const errorTC = statusStats['DevError'] + statusStats['ProdError'];
   const resolutionRate = totalTC > 0 ? Math.round((resolvedTC / totalTC) * 100) : 0;
@@ -157,6 +90,14 @@ export default function QADashboard() {
         </div>
 
         <div className="flex items-center gap-3">
+          <button
+            onClick={handleRebuild}
+            disabled={isRebuilding}
+            className="text-[9px] font-bold text-slate-400 hover:text-white uppercase tracking-wide transition-colors disabled:opacity-50"
+            title="저장된 TC/WBS 데이터로 통계를 다시 계산합니다"
+          >
+            {isRebuilding ? '재집계 중...' : '통계 재집계'}
+          </button>
           <button
             onClick={() => router.push('/dashboard/developer')}
             className="text-[9px] font-bold text-slate-400 hover:text-white uppercase tracking-wide transition-colors"
@@ -1,11 +1,13 @@
 'use client';
 
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useRef } from 'react';
 import { useRouter } from 'next/navigation';
 import SetupForm from './components/SetupForm';
 import { CoverThumbnail } from './components/CoverThumbnail';
 import { FigmaAuth, PrefixGroup } from './types';
-import { fetchFigmaFile } from './services/figmaService';
+import { FigmaParseProgress } from './services/figmaService';
+import { loadFigmaFile } from './services/figmaLoader';
+import { rememberLoadedPages } from './services/figmaCache';
 
 export default function Home() {
   const router = useRouter();
@@ -20,11 +22,25 @@ export default function Home() {
   });
 
   const [searchQuery, setSearchQuery] = useState('');
+  const [progress, setProgress] = useState<FigmaParseProgress | null>(null);
+  // Background updates from an earlier sync must not overwrite a later one
+  const syncIdRef = useRef(0);
 
   const handleSync = async (auth: FigmaAuth) => {
+    const syncId = ++syncIdRef.current;
     setState(prev => ({ ...prev, loading: true, error: null }));
+    setProgress(null);
+
+    // A cached file is shown first; a newer version found in the background replaces it
+    const handleUpdate = (pages: Record<string, Record<string, PrefixGroup>>) => {
+      if (syncId !== syncIdRef.current) return;
+      rememberLoadedPages(pages);
+      setState(prev => ({ ...prev, pages }));
+    };
+
     try {
-      const pages = await fetchFigmaFile(auth);
+      // Fetch + parse run in a worker; the UI only receives progress and the final groups
+      const pages = await loadFigmaFile(auth, setProgress, handleUpdate);
       console.log(pages);
       const groupCount = Object.values(pages).reduce((acc, groups) => acc + Object.keys(groups).length, 0);
 
@@ -32,6 +48,7 @@ export default function Home() {
         throw new Error("연결에 성공했으나, 명명 규칙(예: AUTO_0001)에 맞는 프레임을 찾을 수 없습니다. 피그마 프레임 이름을 확인해주세요.");
       }
 
+      rememberLoadedPages(pages);
       setState({ pages, loading: false, error: null });
     } catch (err: unknown) {
       const errorMessage = err instanceof Error ? err.message : '동기화 실패';
@@ -64,6 +81,13 @@ export default function Home() {
     return Object.values(state.pages).reduce((acc, groups) => acc + Object.keys(groups).length, 0);
   }, [state.pages]);
 
+  const progressSummary = useMemo(() => {
+    if (!progress) return null;
+    const pageCount = Object.keys(progress.pages).length;
+    const prefixCount = Object.values(progress.pages).reduce((acc, prefixes) => acc + prefixes.length, 0);
+    return { pageCount, prefixCount, prefixes: Object.values(progress.pages).flat() };
+  }, [progress]);
+
   return (
     <div className="min-h-screen flex flex-col selection:bg-yellow-200 text-slate-900 bg-[#F1F5F9]">
       <header className="bg-[#0F172A] border-b border-slate-800 h-20 flex items-center justify-between px-10 sticky top-0 z-40 backdrop-blur-md shadow-lg">
@@ -145,7 +169,16 @@ export default function Home() {
              <div className="w-20 h-20 border-[6px] border-slate-800 rounded-full animate-spin border-t-yellow-400"></div>
              <div className="text-center">
                <p className="text-2xl font-black text-white tracking-tight uppercase">디자인 트리 분석 중</p>
-               <p className="text-sm text-slate-400 mt-2 font-medium">컴포넌트 및 문서 정보를 추출하고 있습니다...</p>
+               <p className="text-sm text-slate-400 mt-2 font-medium">
+                 {progress?.phase === 'fetching' || !progressSummary
+                   ? '디자인 파일을 불러오고 있습니다...'
+                   : `페이지 ${progressSummary.pageCount}개 · 섹션 ${progressSummary.prefixCount}개 · 화면 ${progress?.screenCount ?? 0}개 발견`}
+               </p>
+               {progressSummary && progressSummary.prefixes.length > 0 && (
+                 <p className="text-[10px] text-slate-500 mt-3 font-bold uppercase tracking-widest max-w-xl mx-auto truncate">
+                   {progressSummary.prefixes.join(' · ')}
+                 </p>
+               )}
              </div>
           </div>
         ) : (
@@ -167,11 +200,7 @@ export default function Home() {
                     return (
                       <div
                         key={prefix}
-                        onClick={() => {
-                          // Store group data for the detail page
-                          localStorage.setItem(`group_${prefix}`, JSON.stringify(group));
-                          router.push(`/screen/${prefix}`);
-                        }}
+                        onClick={() => router.push(`/screen/${prefix}`)}
                         className="group bg-white rounded-[2rem] border border-slate-200 overflow-hidden hover:border-yellow-500 hover:shadow-2xl hover:shadow-yellow-500/10 transition-all duration-500 cursor-pointer flex flex-col relative"
                       >
                         <div className="aspect-[1.5/1] w-full bg-slate-50 overflow-hidden border-b border-slate-100 flex items-center justify-center relative">
@@ -1,15 +1,16 @@
 'use client';
 
 import React from 'react';
-import { useScreen } from '../context/ScreenContext';
+import { useScreen, useScreenEntities } from '../context/ScreenContext';
 import { TabType } from '../config/constants';
 
 export function ContentTabs() {
-  const { activeTab, setActiveTab, testCases } = useScreen();
+  const { activeTab, setActiveTab } = useScreen();
+  const { testCaseIds } = useScreenEntities();
 
   const tabs: { key: TabType; label: string; count?: number }[] = [
     { key: 'wbs', label: '기획/개발 (WBS)' },
-    { key: 'qa', label: '품질관리 (TC)', count: testCases.length },
+    { key: 'qa', label: '품질관리 (TC)', count: testCaseIds.length },
   ];
 
   return (
@@ -39,7 +39,7 @@ export function DeveloperView({
     if (statusFilter !== 'all') {
       tasks = tasks.filter(t => t.status === statusFilter);
     }
-    return tasks.sort((a, b) => new Date(a.endDate).getTime() - new Date(b.endDate).getTime());
+    return [...tasks].sort((a, b) => new Date(a.endDate).getTime() - new Date(b.endDate).getTime());
   }, [wbsTasks, currentUser, showOnlyMine, statusFilter]);
 
   const filteredTestCases = useMemo(() => {
@@ -51,7 +51,8 @@ const REJECT_REASONS: { key: RejectReason; label: string }[] = [
   { key: 'out_of_scope', label: '범위 외' },
 ];
 
-export function ExpandableTestCaseCard({
+// 목록에서 다른 TC 가 수정돼도 이 카드는 다시 렌더링되지 않도록 메모이제이션
+export const ExpandableTestCaseCard = React.memo(function ExpandableTestCaseCard({
   tc,
   isMasterView,
   getScreenNameById,
@@ -860,4 +861,4 @@ export function ExpandableTestCaseCard({
       )}
     </div>
   );
-}
+});
@@ -1,40 +1,225 @@
 'use client';
 
-import React, { useMemo } from 'react';
+import React, { useState, useRef, useMemo, useCallback, useEffect } from 'react';
 import { WbsTask } from '../../../types';
+import {
+  GANTT_DAY_WIDTH,
+  GANTT_ROW_HEIGHT,
+  GANTT_NAME_WIDTH,
+  GANTT_MAX_HEIGHT,
+  GANTT_OVERSCAN
+} from '../config/constants';
+import { TimelineRange, getTimelineDay } from '../hooks/useTimelineRange';
+import { DragPreview } from '../hooks/useGanttDrag';
+
+type DragMode = 'move' | 'resize-start' | 'resize-end';
 
 interface GanttChartProps {
   wbsTasks: WbsTask[];
+  timelineRange: TimelineRange | null;
   isMasterView: boolean;
   dragState: { taskId: string } | null;
-  onMouseDown: (e: React.MouseEvent, taskId: string, mode: 'move' | 'resize-start' | 'resize-end') => void;
+  dragPreview: DragPreview | null;
+  onMouseDown: (e: React.MouseEvent, taskId: string, mode: DragMode) => void;
+}
+
+interface TimelineDay {
+  idx: number;
+  date: Date;
+  isToday: boolean;
+  isWeekend: boolean;
+  isFirstOfMonth: boolean;
+}
+
+interface Viewport {
+  left: number;
+  top: number;
+  width: number;
+  height: number;
 }
 
-export function GanttChart({ wbsTasks, isMasterView, dragState, onMouseDown }: GanttChartProps) {
-  const timelineRange = useMemo(() => {
-    if (wbsTasks.length === 0) return null;
-    const startDates = wbsTasks.map(t => new Date(t.startDate).getTime()).filter(d => !isNaN(d));
-    const endDates = wbsTasks.map(t => new Date(t.endDate).getTime()).filter(d => !isNaN(d));
-    if (startDates.length === 0) return null;
-
-    const minTime = Math.min(...startDates);
-    const maxTime = Math.max(...endDates, minTime + 86400000 * 7);
-
-    const startDate = new Date(minTime);
-    startDate.setDate(startDate.getDate() - 3);
-    const endDate = new Date(maxTime);
-    endDate.setDate(endDate.getDate() + 10);
-
-    const days: Date[] = [];
-    const current = new Date(startDate);
-    while (current <= endDate) {
-      days.push(new Date(current));
-      current.setDate(current.getDate() + 1);
+const WEEKDAY_LABELS = ['일', '월', '화', '수', '목', '금', '토'];
+
+interface GanttRowProps {
+  task: WbsTask;
+  taskIdx: number;
+  days: TimelineDay[];
+  rangeStart: Date;
+  trackWidth: number;
+  startDate: string;
+  endDate: string;
+  isDragging: boolean;
+  isEditable: boolean;
+  onMouseDown: (e: React.MouseEvent, taskId: string, mode: DragMode) => void;
+}
+
+/**
+ * One task row; only the visible day cells are rendered
+ * Memoized so a drag preview re-renders just the dragged row
+ */
+const GanttRow = React.memo(function GanttRow({
+  task,
+  taskIdx,
+  days,
+  rangeStart,
+  trackWidth,
+  startDate,
+  endDate,
+  isDragging,
+  isEditable,
+  onMouseDown
+}: GanttRowProps) {
+  const taskStart = new Date(startDate);
+  const taskEnd = new Date(endDate);
+  const rowBg = taskIdx % 2 === 0 ? 'bg-white' : 'bg-slate-50';
+
+  const startOffset = Math.max(0, Math.floor((taskStart.getTime() - rangeStart.getTime()) / 86400000));
+  const duration = Math.max(1, Math.floor((taskEnd.getTime() - taskStart.getTime()) / 86400000) + 1);
+  const barColor = task.status === 'Done'
+    ? 'bg-green-500'
+    : task.status === 'In Progress'
+      ? 'bg-blue-500'
+      : 'bg-slate-400';
+
+  return (
+    <div
+      className={`flex absolute left-0 border-b border-slate-100 ${rowBg}`}
+      style={{ top: taskIdx * GANTT_ROW_HEIGHT, height: GANTT_ROW_HEIGHT, width: GANTT_NAME_WIDTH + trackWidth }}
+    >
+      <div className={`w-36 shrink-0 px-2 py-1.5 border-r border-slate-200 sticky left-0 z-20 ${rowBg}`}>
+        <p className="text-[10px] font-bold text-slate-900 truncate" title={task.name}>{task.name}</p>
+        <p className="text-[9px] text-slate-500">{task.assignee}</p>
+      </div>
+      <div className="relative" style={{ width: trackWidth }}>
+        {days.map(day => (
+          <div
+            key={day.idx}
+            className={`absolute top-0 w-6 h-8 border-r border-slate-100 ${day.isWeekend ? 'bg-slate-50' : ''} ${day.isToday ? 'bg-yellow-50' : ''}`}
+            style={{ left: day.idx * GANTT_DAY_WIDTH }}
+          />
+        ))}
+        {/* Task Bar */}
+        <div
+          className={`absolute top-1.5 h-5 ${barColor} rounded flex items-center justify-center transition-shadow group/bar ${
+            isDragging ? 'shadow-lg scale-105 z-10' : 'hover:shadow-md'
+          } ${isEditable ? 'cursor-grab active:cursor-grabbing' : 'cursor-default'}`}
+          style={{
+            left: `${startOffset * GANTT_DAY_WIDTH}px`,
+            width: `${Math.max(duration * GANTT_DAY_WIDTH - 2, 22)}px`,
+          }}
+          title={`${task.name}: ${startDate} ~ ${endDate}${isEditable ? '\n드래그: 이동 | 양쪽 끝: 기간 조절' : ''}`}
+          onMouseDown={(e) => onMouseDown(e, task.id, 'move')}
+        >
+          {/* Resize handle - Start */}
+          {isEditable && (
+            <div
+              className="absolute left-0 top-0 w-1.5 h-full cursor-ew-resize hover:bg-white/30 rounded-l transition-colors"
+              onMouseDown={(e) => {
+                e.stopPropagation();
+                onMouseDown(e, task.id, 'resize-start');
+              }}
+            />
+          )}
+
+          <span className="text-[8px] font-bold text-white truncate px-1.5 select-none">
+            {duration > 2 ? task.name : ''}
+          </span>
+
+          {/* Resize handle - End */}
+          {isEditable && (
+            <div
+              className="absolute right-0 top-0 w-1.5 h-full cursor-ew-resize hover:bg-white/30 rounded-r transition-colors"
+              onMouseDown={(e) => {
+                e.stopPropagation();
+                onMouseDown(e, task.id, 'resize-end');
+              }}
+            />
+          )}
+        </div>
+      </div>
+    </div>
+  );
+});
+
+export function GanttChart({ wbsTasks, timelineRange, isMasterView, dragState, dragPreview, onMouseDown }: GanttChartProps) {
+  const scrollRef = useRef<HTMLDivElement>(null);
+  const frameRef = useRef<number | null>(null);
+  const [viewport, setViewport] = useState<Viewport>({ left: 0, top: 0, width: 1200, height: GANTT_MAX_HEIGHT });
+
+  // Scroll position is sampled at most once per animation frame
+  const measureViewport = useCallback(() => {
+    frameRef.current = null;
+    const el = scrollRef.current;
+    if (!el) return;
+    setViewport(prev => (
+      prev.left === el.scrollLeft && prev.top === el.scrollTop &&
+      prev.width === el.clientWidth && prev.height === el.clientHeight
+    ) ? prev : { left: el.scrollLeft, top: el.scrollTop, width: el.clientWidth, height: el.clientHeight });
+  }, []);
+
+  const scheduleMeasure = useCallback(() => {
+    if (frameRef.current === null) {
+      frameRef.current = requestAnimationFrame(measureViewport);
+    }
+  }, [measureViewport]);
+
+  const hasTimeline = timelineRange !== null;
+  useEffect(() => {
+    const el = scrollRef.current;
+    if (!el) return;
+    measureViewport();
+
+    let observer: ResizeObserver | null = null;
+    if (typeof ResizeObserver !== 'undefined') {
+      observer = new ResizeObserver(scheduleMeasure);
+      observer.observe(el);
+    } else {
+      window.addEventListener('resize', scheduleMeasure);
+    }
+    return () => {
+      observer?.disconnect();
+      window.removeEventListener('resize', scheduleMeasure);
+      if (frameRef.current !== null) {
+        cancelAnimationFrame(frameRef.current);
+        frameRef.current = null;
+      }
+    };
+  }, [hasTimeline, measureViewport, scheduleMeasure]);
+
+  // Visible day window (the sticky name column hides GANTT_NAME_WIDTH of the viewport)
+  const dayCount = timelineRange?.dayCount ?? 0;
+  const firstDay = Math.max(0, Math.floor(viewport.left / GANTT_DAY_WIDTH) - GANTT_OVERSCAN);
+  const lastDay = Math.min(
+    dayCount,
+    Math.ceil((viewport.left + viewport.width - GANTT_NAME_WIDTH) / GANTT_DAY_WIDTH) + GANTT_OVERSCAN
+  );
+
+  const visibleDays = useMemo(() => {
+    if (!timelineRange) return [];
+    const todayKey = new Date().toDateString();
+    const days: TimelineDay[] = [];
+    for (let idx = firstDay; idx < lastDay; idx++) {
+      const date = getTimelineDay(timelineRange, idx);
+      days.push({
+        idx,
+        date,
+        isToday: date.toDateString() === todayKey,
+        isWeekend: date.getDay() === 0 || date.getDay() === 6,
+        isFirstOfMonth: date.getDate() === 1,
+      });
     }
-    return { days };
-  }, [wbsTasks]);
+    return days;
+  }, [timelineRange, firstDay, lastDay]);
+
+  // Visible row window
+  const firstRow = Math.max(0, Math.floor(viewport.top / GANTT_ROW_HEIGHT) - GANTT_OVERSCAN);
+  const lastRow = Math.min(
+    wbsTasks.length,
+    Math.ceil((viewport.top + viewport.height) / GANTT_ROW_HEIGHT) + GANTT_OVERSCAN
+  );
 
   if (!timelineRange) return null;
+  const trackWidth = timelineRange.dayCount * GANTT_DAY_WIDTH;
 
   return (
     <div className="bg-white border border-slate-200 rounded-lg overflow-hidden mb-4">
@@ -46,119 +231,62 @@ export function GanttChart({ wbsTasks, isMasterView, dragState, onMouseDown }: G
           타임라인 차트
         </h3>
       </div>
-      <div className="overflow-x-auto">
-        <div className="min-w-max">
+      <div
+        ref={scrollRef}
+        onScroll={scheduleMeasure}
+        className="overflow-auto"
+        style={{ maxHeight: GANTT_MAX_HEIGHT }}
+      >
+        <div style={{ width: GANTT_NAME_WIDTH + trackWidth }}>
           {/* Timeline Header */}
-          <div className="flex border-b border-slate-200 bg-slate-50">
-            <div className="w-36 shrink-0 px-2 py-1.5 border-r border-slate-200">
+          <div className="flex border-b border-slate-200 bg-slate-50 sticky top-0 z-30">
+            <div className="w-36 shrink-0 px-2 py-1.5 border-r border-slate-200 sticky left-0 z-10 bg-slate-50">
               <span className="text-[9px] font-bold text-slate-600 uppercase">작업명</span>
             </div>
-            <div className="flex">
-              {timelineRange.days.map((day, idx) => {
-                const isToday = new Date().toDateString() === day.toDateString();
-                const isWeekend = day.getDay() === 0 || day.getDay() === 6;
-                const isFirstOfMonth = day.getDate() === 1;
-                return (
-                  <div
-                    key={idx}
-                    className={`w-6 shrink-0 text-center py-1 border-r border-slate-100 ${isWeekend ? 'bg-slate-100' : ''} ${isToday ? 'bg-yellow-50' : ''}`}
-                  >
-                    {isFirstOfMonth && (
-                      <div className="text-[7px] font-bold text-slate-500">
-                        {day.toLocaleDateString('ko-KR', { month: 'short' })}
-                      </div>
-                    )}
-                    <div className={`text-[8px] font-medium ${isToday ? 'text-yellow-700 font-bold' : isWeekend ? 'text-slate-400' : 'text-slate-600'}`}>
-                      {day.getDate()}
-                    </div>
-                    <div className={`text-[7px] ${isWeekend ? 'text-slate-400' : 'text-slate-400'}`}>
-                      {['일', '월', '화', '수', '목', '금', '토'][day.getDay()]}
+            <div className="relative h-10" style={{ width: trackWidth }}>
+              {visibleDays.map(day => (
+                <div
+                  key={day.idx}
+                  className={`absolute top-0 w-6 h-full text-center py-1 border-r border-slate-100 ${day.isWeekend ? 'bg-slate-100' : ''} ${day.isToday ? 'bg-yellow-50' : ''}`}
+                  style={{ left: day.idx * GANTT_DAY_WIDTH }}
+                >
+                  {day.isFirstOfMonth && (
+                    <div className="text-[7px] font-bold text-slate-500">
+                      {day.date.toLocaleDateString('ko-KR', { month: 'short' })}
                     </div>
+                  )}
+                  <div className={`text-[8px] font-medium ${day.isToday ? 'text-yellow-700 font-bold' : day.isWeekend ? 'text-slate-400' : 'text-slate-600'}`}>
+                    {day.date.getDate()}
+                  </div>
+                  <div className="text-[7px] text-slate-400">
+                    {WEEKDAY_LABELS[day.date.getDay()]}
                   </div>
-                );
-              })}
+                </div>
+              ))}
             </div>
           </div>
 
           {/* Task Rows */}
-          {wbsTasks.map((task, taskIdx) => {
-            const taskStart = new Date(task.startDate);
-            const taskEnd = new Date(task.endDate);
-            const rangeStart = timelineRange.days[0];
-
-            return (
-              <div key={task.id} className={`flex border-b border-slate-100 ${taskIdx % 2 === 0 ? 'bg-white' : 'bg-slate-50'}`}>
-                <div className="w-36 shrink-0 px-2 py-1.5 border-r border-slate-200">
-                  <p className="text-[10px] font-bold text-slate-900 truncate" title={task.name}>{task.name}</p>
-                  <p className="text-[9px] text-slate-500">{task.assignee}</p>
-                </div>
-                <div className="flex relative">
-                  {timelineRange.days.map((day, dayIdx) => {
-                    const isWeekend = day.getDay() === 0 || day.getDay() === 6;
-                    const isToday = new Date().toDateString() === day.toDateString();
-                    return (
-                      <div
-                        key={dayIdx}
-                        className={`w-6 shrink-0 h-8 border-r border-slate-100 ${isWeekend ? 'bg-slate-50' : ''} ${isToday ? 'bg-yellow-50' : ''}`}
-                      />
-                    );
-                  })}
-                  {/* Task Bar */}
-                  {(() => {
-                    const startOffset = Math.max(0, Math.floor((taskStart.getTime() - rangeStart.getTime()) / 86400000));
-                    const duration = Math.max(1, Math.floor((taskEnd.getTime() - taskStart.getTime()) / 86400000) + 1);
-                    const barColor = task.status === 'Done'
-                      ? 'bg-green-500'
-                      : task.status === 'In Progress'
-                        ? 'bg-blue-500'
-                        : 'bg-slate-400';
-                    const isDragging = dragState?.taskId === task.id;
-                    const isEditable = !isMasterView;
-
-                    return (
-                      <div
-                        className={`absolute top-1.5 h-5 ${barColor} rounded flex items-center justify-center transition-shadow group/bar ${
-                          isDragging ? 'shadow-lg scale-105 z-10' : 'hover:shadow-md'
-                        } ${isEditable ? 'cursor-grab active:cursor-grabbing' : 'cursor-default'}`}
-                        style={{
-                          left: `${startOffset * 24}px`,
-                          width: `${Math.max(duration * 24 - 2, 22)}px`,
-                        }}
-                        title={`${task.name}: ${task.startDate} ~ ${task.endDate}${isEditable ? '\n드래그: 이동 | 양쪽 끝: 기간 조절' : ''}`}
-                        onMouseDown={(e) => onMouseDown(e, task.id, 'move')}
-                      >
-                        {/* Resize handle - Start */}
-                        {isEditable && (
-                          <div
-                            className="absolute left-0 top-0 w-1.5 h-full cursor-ew-resize hover:bg-white/30 rounded-l transition-colors"
-                            onMouseDown={(e) => {
-                              e.stopPropagation();
-                              onMouseDown(e, task.id, 'resize-start');
-                            }}
-                          />
-                        )}
-
-                        <span className="text-[8px] font-bold text-white truncate px-1.5 select-none">
-                          {duration > 2 ? task.name : ''}
-                        </span>
-
-                        {/* Resize handle - End */}
-                        {isEditable && (
-                          <div
-                            className="absolute right-0 top-0 w-1.5 h-full cursor-ew-resize hover:bg-white/30 rounded-r transition-colors"
-                            onMouseDown={(e) => {
-                              e.stopPropagation();
-                              onMouseDown(e, task.id, 'resize-end');
-                            }}
-                          />
-                        )}
-                      </div>
-                    );
-                  })()}
-                </div>
-              </div>
-            );
-          })}
+          <div className="relative" style={{ height: wbsTasks.length * GANTT_ROW_HEIGHT }}>
+            {wbsTasks.slice(firstRow, lastRow).map((task, offset) => {
+              const preview = dragPreview?.taskId === task.id ? dragPreview : null;
+              return (
+                <GanttRow
+                  key={task.id}
+                  task={task}
+                  taskIdx={firstRow + offset}
+                  days={visibleDays}
+                  rangeStart={timelineRange.start}
+                  trackWidth={trackWidth}
+                  startDate={preview ? preview.startDate : task.startDate}
+                  endDate={preview ? preview.endDate : task.endDate}
+                  isDragging={dragState?.taskId === task.id}
+                  isEditable={!isMasterView}
+                  onMouseDown={onMouseDown}
+                />
+              );
+            })}
+          </div>
         </div>
       </div>
 
@@ -6,7 +6,8 @@ import { TestCaseTable } from './TestCaseTable';
 import { TcAddModal } from './TcAddModal';
 
 interface QaTabProps {
-  testCases: TestCase[];
+  testCaseIds: string[];
+  testCasesById: Record<string, TestCase>;
   wbsTasks: WbsTask[];
   isMasterView: boolean;
   qaProgress: number;
@@ -18,7 +19,8 @@ interface QaTabProps {
 }
 
 export function QaTab({
-  testCases,
+  testCaseIds,
+  testCasesById,
   wbsTasks,
   isMasterView,
   qaProgress,
@@ -67,7 +69,8 @@ export function QaTab({
 
       {/* TC 테이블 */}
       <TestCaseTable
-        testCases={testCases}
+        testCaseIds={testCaseIds}
+        testCasesById={testCasesById}
         wbsTasks={wbsTasks}
         isMasterView={isMasterView}
         getScreenNameById={getScreenNameById}
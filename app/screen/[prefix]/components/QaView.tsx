@@ -1,13 +1,90 @@
 'use client';
 
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useCallback } from 'react';
 import { TestCase, QAStatus, QAPriority, QAPosition } from '../../../types';
 import { TEAM_MEMBERS, STATUS_ORDER, STATUS_CONFIG } from '../config/constants';
 import { StatusSelect } from '../../../components/ui';
+import { useWindowedList } from '../hooks/useWindowedList';
 
 const QA_STATUS_OPTIONS = ['Reviewing', 'DevError', 'ProdError', 'DevDone', 'ProdDone', 'Hold'] as const;
 const PRIORITY_OPTIONS = ['High', 'Medium', 'Low'] as const;
 
+// 카드 높이 추정치 (실제 높이는 렌더링 후 측정)
+const ESTIMATED_ITEM_HEIGHT = 64;
+
+interface QaStatusItemProps {
+  tc: TestCase;
+  isMasterView: boolean;
+  onStatusChange: (tcId: string, newStatus: QAStatus) => void;
+}
+
+const QaStatusItem = React.memo(function QaStatusItem({ tc, isMasterView, onStatusChange }: QaStatusItemProps) {
+  return (
+    <div
+      className="bg-white p-2.5 rounded border border-slate-200 flex items-center justify-between group hover:shadow-sm transition-all"
+    >
+      <div className="flex items-center gap-2">
+        <div className={`w-2 h-2 rounded-full shrink-0 ${
+          tc.priority === 'High' ? 'bg-red-500' :
+          tc.priority === 'Medium' ? 'bg-orange-500' : 'bg-green-500'
+        }`} />
+        <div>
+          <div className="flex items-center gap-1.5 mb-0.5">
+            {tc.checkpoint && (
+              <span className="text-[9px] font-bold text-purple-600 bg-purple-100 px-1.5 py-0.5 rounded">
+                {tc.checkpoint}
+              </span>
+            )}
+            <span className="text-[9px] font-medium text-slate-400 bg-slate-100 px-1.5 py-0.5 rounded">
+              {tc.position}
+            </span>
+          </div>
+          <p className="text-[10px] font-bold text-slate-900">{tc.scenario}</p>
+          <div className="flex items-center gap-2 mt-0.5 text-[9px] text-slate-500">
+            <span>담당: {tc.assignee}</span>
+            <span>|</span>
+            <span>{tc.date}</span>
+          </div>
+        </div>
+      </div>
+      {!isMasterView && (
+        <StatusSelect
+          value={tc.status}
+          onChange={(v) => onStatusChange(tc.id, v as QAStatus)}
+          options={QA_STATUS_OPTIONS}
+          size="xs"
+          variant="badge"
+        />
+      )}
+    </div>
+  );
+});
+
+interface QaStatusListProps {
+  testCases: TestCase[];
+  isMasterView: boolean;
+  onStatusChange: (tcId: string, newStatus: QAStatus) => void;
+}
+
+// 상태별 TC 목록 (보이는 카드만 렌더링)
+function QaStatusList({ testCases, isMasterView, onStatusChange }: QaStatusListProps) {
+  const ids = useMemo(() => testCases.map(tc => tc.id), [testCases]);
+  const { listRef, start, end, paddingTop, paddingBottom, measureItem } = useWindowedList<HTMLDivElement>({
+    keys: ids,
+    estimatedItemHeight: ESTIMATED_ITEM_HEIGHT,
+  });
+
+  return (
+    <div ref={listRef} className="p-2" style={{ paddingTop: paddingTop + 8, paddingBottom: paddingBottom + 8 }}>
+      {testCases.slice(start, end).map(tc => (
+        <div key={tc.id} ref={measureItem(tc.id)} className="pb-1.5 last:pb-0">
+          <QaStatusItem tc={tc} isMasterView={isMasterView} onStatusChange={onStatusChange} />
+        </div>
+      ))}
+    </div>
+  );
+}
+
 interface QaViewProps {
   testCases: TestCase[];
   addTestCase: (tc: TestCase) => void;
@@ -105,10 +182,10 @@ export function QaView({
     setQuickAdd({ checkpoint: '', scenario: '', position: 'Front-end', priority: 'Medium' });
   };
 
-  const handleStatusChange = (tcId: string, newStatus: QAStatus) => {
+  const handleStatusChange = useCallback((tcId: string, newStatus: QAStatus) => {
     if (isMasterView) return;
     updateTestCase(tcId, { status: newStatus });
-  };
+  }, [isMasterView, updateTestCase]);
 
   return (
     <div className="space-y-4">
@@ -238,48 +315,11 @@ export function QaView({
                   {config.label} ({tcs.length}건)
                 </h3>
               </div>
-              <div className="p-2 space-y-1.5">
-                {tcs.map(tc => (
-                  <div
-                    key={tc.id}
-                    className="bg-white p-2.5 rounded border border-slate-200 flex items-center justify-between group hover:shadow-sm transition-all"
-                  >
-                    <div className="flex items-center gap-2">
-                      <div className={`w-2 h-2 rounded-full shrink-0 ${
-                        tc.priority === 'High' ? 'bg-red-500' :
-                        tc.priority === 'Medium' ? 'bg-orange-500' : 'bg-green-500'
-                      }`} />
-                      <div>
-                        <div className="flex items-center gap-1.5 mb-0.5">
-                          {tc.checkpoint && (
-                            <span className="text-[9px] font-bold text-purple-600 bg-purple-100 px-1.5 py-0.5 rounded">
-                              {tc.checkpoint}
-                            </span>
-                          )}
-                          <span className="text-[9px] font-medium text-slate-400 bg-slate-100 px-1.5 py-0.5 rounded">
-                            {tc.position}
-                          </span>
-                        </div>
-                        <p className="text-[10px] font-bold text-slate-900">{tc.scenario}</p>
-                        <div className="flex items-center gap-2 mt-0.5 text-[9px] text-slate-500">
-                          <span>담당: {tc.assignee}</span>
-                          <span>|</span>
-                          <span>{tc.date}</span>
-                        </div>
-                      </div>
-                    </div>
-                    {!isMasterView && (
-                      <StatusSelect
-                        value={tc.status}
-                        onChange={(v) => handleStatusChange(tc.id, v as QAStatus)}
-                        options={QA_STATUS_OPTIONS}
-                        size="xs"
-                        variant="badge"
-                      />
-                    )}
-                  </div>
-                ))}
-              </div>
+              <QaStatusList
+                testCases={tcs}
+                isMasterView={isMasterView}
+                onStatusChange={handleStatusChange}
+              />
             </div>
           );
         })}
@@ -1,6 +1,6 @@
 'use client';
 
-import React, { useState } from 'react';
+import React, { useState, useMemo, useCallback } from 'react';
 import {
   TestCase,
   QAStatus,
@@ -13,6 +13,7 @@ import {
 } from '../../../types';
 import { TEAM_MEMBERS } from '../hooks/useScreenData';
 import { StatusSelect, UserSelect } from '../../../components/ui';
+import { useWindowedList } from '../hooks/useWindowedList';
 
 // 상수 정의
 const QA_STATUS_OPTIONS = ['Reviewing', 'DevError', 'ProdError', 'DevDone', 'ProdDone', 'Hold', 'Rejected', 'Duplicate'] as const;
@@ -34,8 +35,324 @@ const PRIORITY_CONFIG: Record<QAPriority, { dot: string }> = {
   Low: { dot: 'bg-green-500' },
 };
 
+// 접힌 행 높이 추정치 (실제 높이는 렌더링 후 측정)
+const ESTIMATED_ROW_HEIGHT = 41;
+
+const isClosed = (status: QAStatus) =>
+  ['DevDone', 'ProdDone', 'Rejected', 'Duplicate'].includes(status);
+
+interface TestCaseRowProps {
+  tc: TestCase;
+  isMasterView: boolean;
+  isExpanded: boolean;
+  columnCount: number;
+  screenName: string;
+  wbsName: string | null;
+  commentDraft?: string;
+  commentAuthor?: string;
+  updateTestCase: (id: string, updates: Partial<TestCase>) => void;
+  deleteTestCase: (id: string) => void;
+  onToggleExpand: (id: string) => void;
+  onCommentDraftChange: (id: string, text: string) => void;
+  onCommentAuthorChange: (id: string, user: string) => void;
+  measureRef: (el: HTMLElement | null) => void;
+}
+
+// 행 단위 메모이제이션: 다른 TC 가 수정돼도 이 행은 다시 렌더링되지 않음
+const TestCaseRow = React.memo(function TestCaseRow({
+  tc,
+  isMasterView,
+  isExpanded,
+  columnCount,
+  screenName,
+  wbsName,
+  commentDraft,
+  commentAuthor,
+  updateTestCase,
+  deleteTestCase,
+  onToggleExpand,
+  onCommentDraftChange,
+  onCommentAuthorChange,
+  measureRef,
+}: TestCaseRowProps) {
+  const closed = isClosed(tc.status);
+  const issueConfig = tc.issueType ? ISSUE_TYPE_CONFIG[tc.issueType] : null;
+  const priorityConfig = PRIORITY_CONFIG[tc.priority];
+
+  const handleAddComment = () => {
+    const text = commentDraft?.trim();
+    if (!text) return;
+    const comment: Comment = {
+      id: crypto.randomUUID(),
+      userName: commentAuthor || TEAM_MEMBERS[0],
+      text,
+      timestamp: new Date().toLocaleString('ko-KR', { hour12: false }),
+    };
+    updateTestCase(tc.id, { comments: [...tc.comments, comment] });
+    onCommentDraftChange(tc.id, '');
+  };
+
+  return (
+    <tbody ref={measureRef} className="divide-y divide-slate-100 border-t border-slate-100">
+      <tr
+        className={`group hover:bg-slate-50 transition-colors cursor-pointer ${isExpanded ? 'bg-blue-50/50' : ''} ${closed ? 'opacity-60' : ''}`}
+        onClick={() => !isMasterView && onToggleExpand(tc.id)}
+      >
+        {!isMasterView && (
+          <td className="px-2 py-2">
+            <svg
+              className={`w-3 h-3 text-slate-400 transition-transform ${isExpanded ? 'rotate-90' : ''}`}
+              fill="none" stroke="currentColor" viewBox="0 0 24 24"
+            >
+              <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2.5" d="M9 5l7 7-7 7" />
+            </svg>
+          </td>
+        )}
+
+        {isMasterView && (
+          <td className="px-2 py-2">
+            <span className="text-[9px] font-bold text-yellow-700 bg-yellow-50 px-1.5 py-0.5 rounded truncate block">
+              {screenName}
+            </span>
+          </td>
+        )}
+
+        <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
+          {isMasterView ? (
+            issueConfig ? (
+              <span className={`text-[9px] font-bold px-1.5 py-0.5 rounded ${issueConfig.color}`}>
+                {issueConfig.icon}
+              </span>
+            ) : <span className="text-slate-300">-</span>
+          ) : (
+            <StatusSelect
+              value={tc.issueType || 'bug'}
+              onChange={(v) => updateTestCase(tc.id, { issueType: v as IssueType })}
+              options={ISSUE_TYPE_OPTIONS}
+              size="xs"
+            />
+          )}
+        </td>
+
+        <td className="px-2 py-2 text-center" onClick={e => e.stopPropagation()}>
+          {isMasterView ? (
+            <span className={`inline-block w-2.5 h-2.5 rounded-full ${priorityConfig.dot}`} />
+          ) : (
+            <StatusSelect
+              value={tc.priority}
+              onChange={(v) => updateTestCase(tc.id, { priority: v as QAPriority })}
+              options={PRIORITY_OPTIONS}
+              size="xs"
+            />
+          )}
+        </td>
+
+        <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
+          {isMasterView ? (
+            <p className={`text-xs font-medium truncate ${closed ? 'line-through text-slate-400' : 'text-slate-800'}`}>
+              {tc.scenario}
+            </p>
+          ) : (
+            <input
+              type="text"
+              value={tc.scenario}
+              onChange={e => updateTestCase(tc.id, { scenario: e.target.value })}
+              className={`w-full bg-transparent text-xs font-medium outline-none border-b border-transparent focus:border-slate-300 ${closed ? 'line-through text-slate-400' : 'text-slate-800'}`}
+            />
+          )}
+        </td>
+
+        <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
+          {isMasterView ? (
+            <span className="text-[9px] font-medium text-slate-500 bg-slate-100 px-1.5 py-0.5 rounded">
+              {tc.position}
+            </span>
+          ) : (
+            <StatusSelect
+              value={tc.position}
+              onChange={(v) => updateTestCase(tc.id, { position: v as QAPosition })}
+              options={POSITION_OPTIONS}
+              size="xs"
+            />
+          )}
+        </td>
+
+        <td className="px-2 py-2">
+          {wbsName ? (
+            <span className="text-[9px] font-bold text-blue-600 bg-blue-50 px-1.5 py-0.5 rounded truncate block max-w-[90px]" title={wbsName}>
+              {wbsName}
+            </span>
+          ) : (
+            <span className="text-[9px] text-slate-300">-</span>
+          )}
+        </td>
+
+        <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
+          <UserSelect
+            value={tc.assignee}
+            onChange={(v) => updateTestCase(tc.id, { assignee: v })}
+            options={TEAM_MEMBERS}
+            size="xs"
+            disabled={isMasterView}
+          />
+        </td>
+
+        <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
+          <StatusSelect
+            value={tc.status}
+            onChange={(v) => updateTestCase(tc.id, { status: v as QAStatus })}
+            options={QA_STATUS_OPTIONS}
+            size="xs"
+            disabled={isMasterView}
+          />
+        </td>
+
+        <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
+          <StatusSelect
+            value={tc.progress}
+            onChange={(v) => updateTestCase(tc.id, { progress: v as QAProgress })}
+            options={QA_PROGRESS_OPTIONS}
+            size="xs"
+            disabled={isMasterView}
+          />
+        </td>
+
+        {!isMasterView && (
+          <td className="px-2 py-2 text-center" onClick={e => e.stopPropagation()}>
+            <button
+              onClick={() => deleteTestCase(tc.id)}
+              className="text-slate-300 hover:text-red-500 transition-colors text-lg leading-none"
+            >
+              ×
+            </button>
+          </td>
+        )}
+      </tr>
+
+      {isExpanded && !isMasterView && (
+        <tr>
+          <td colSpan={columnCount} className="bg-slate-50 border-t border-slate-100">
+            <div className="p-4 grid grid-cols-2 gap-4">
+              <div className="space-y-3">
+                <div>
+                  <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">체크포인트</label>
+                  <input
+                    type="text"
+                    value={tc.checkpoint || ''}
+                    onChange={e => updateTestCase(tc.id, { checkpoint: e.target.value })}
+                    placeholder="예: 로그인 버튼"
+                    className="w-full px-2 py-1.5 rounded border border-slate-200 text-xs outline-none focus:border-slate-400 bg-white"
+                  />
+                </div>
+                <div>
+                  <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">상세 내용</label>
+                  <textarea
+                    value={tc.issueContent}
+                    onChange={e => updateTestCase(tc.id, { issueContent: e.target.value })}
+                    rows={2}
+                    placeholder="이슈에 대한 상세 설명..."
+                    className="w-full px-2 py-1.5 rounded border border-slate-200 text-xs outline-none focus:border-slate-400 resize-none bg-white"
+                  />
+                </div>
+                <div className="grid grid-cols-2 gap-2">
+                  <div>
+                    <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">재현 방법</label>
+                    <textarea
+                      value={tc.reproductionSteps || ''}
+                      onChange={e => updateTestCase(tc.id, { reproductionSteps: e.target.value })}
+                      rows={2}
+                      placeholder="1. 첫 번째 단계..."
+                      className="w-full px-2 py-1.5 rounded border border-slate-200 text-xs outline-none focus:border-slate-400 resize-none bg-white"
+                    />
+                  </div>
+                  <div>
+                    <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">기대 결과</label>
+                    <textarea
+                      value={tc.expectedResult || ''}
+                      onChange={e => updateTestCase(tc.id, { expectedResult: e.target.value })}
+                      rows={2}
+                      placeholder="예상되는 정상 동작..."
+                      className="w-full px-2 py-1.5 rounded border border-slate-200 text-xs outline-none focus:border-slate-400 resize-none bg-white"
+                    />
+                  </div>
+                </div>
+                {tc.environment && (
+                  <div className="bg-slate-100 p-2 rounded text-[10px] text-slate-600">
+                    <span className="font-bold">환경:</span> {tc.environment}
+                  </div>
+                )}
+              </div>
+
+              <div className="space-y-3">
+                <div className="grid grid-cols-2 gap-2 text-[10px]">
+                  <div className="bg-white p-2 rounded border border-slate-200">
+                    <span className="text-slate-500">보고자:</span>{' '}
+                    <span className="font-bold text-slate-700">{tc.reporter}</span>
+                  </div>
+                  <div className="bg-white p-2 rounded border border-slate-200">
+                    <span className="text-slate-500">등록일:</span>{' '}
+                    <span className="font-bold text-slate-700">{tc.date}</span>
+                  </div>
+                </div>
+
+                {wbsName && (
+                  <div className="bg-blue-50 p-2 rounded border border-blue-200">
+                    <label className="text-[9px] font-bold text-blue-600 uppercase block mb-0.5">관련 WBS</label>
+                    <p className="text-xs font-medium text-blue-800">{wbsName}</p>
+                  </div>
+                )}
+
+                <div>
+                  <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">
+                    댓글 ({tc.comments.length})
+                  </label>
+                  <div className="max-h-24 overflow-y-auto space-y-1 mb-2">
+                    {tc.comments.map(c => (
+                      <div key={c.id} className="bg-white p-2 rounded border border-slate-200 text-[10px]">
+                        <span className="font-bold text-slate-700">{c.userName}</span>
+                        <span className="text-slate-400 ml-1">{c.timestamp}</span>
+                        <p className="text-slate-600 mt-0.5">{c.text}</p>
+                      </div>
+                    ))}
+                    {tc.comments.length === 0 && (
+                      <p className="text-[10px] text-slate-400 text-center py-1">댓글 없음</p>
+                    )}
+                  </div>
+                  <div className="flex gap-1">
+                    <UserSelect
+                      value={commentAuthor || TEAM_MEMBERS[0]}
+                      onChange={(v) => onCommentAuthorChange(tc.id, v)}
+                      options={TEAM_MEMBERS}
+                      size="xs"
+                    />
+                    <input
+                      type="text"
+                      value={commentDraft || ''}
+                      onChange={e => onCommentDraftChange(tc.id, e.target.value)}
+                      onKeyDown={e => e.key === 'Enter' && handleAddComment()}
+                      placeholder="댓글..."
+                      className="flex-1 px-2 py-1 rounded border border-slate-200 text-[10px] outline-none focus:border-slate-400 bg-white"
+                    />
+                    <button
+                      onClick={handleAddComment}
+                      className="px-2 py-1 bg-slate-800 text-white rounded text-[10px] font-bold hover:bg-slate-900"
+                    >
+                      추가
+                    </button>
+                  </div>
+                </div>
+              </div>
+            </div>
+          </td>
+        </tr>
+      )}
+    </tbody>
+  );
+});
+
 interface TestCaseTableProps {
-  testCases: TestCase[];
+  testCaseIds: string[];
+  testCasesById: Record<string, TestCase>;
   wbsTasks: WbsTask[];
   isMasterView: boolean;
   getScreenNameById: (figmaId: string | undefined) => string;
@@ -44,7 +361,8 @@ interface TestCaseTableProps {
 }
 
 export function TestCaseTable({
-  testCases,
+  testCaseIds,
+  testCasesById,
   wbsTasks,
   isMasterView,
   getScreenNameById,
@@ -55,41 +373,42 @@ export function TestCaseTable({
   const [newComment, setNewComment] = useState<Record<string, string>>({});
   const [commentUser, setCommentUser] = useState<Record<string, string>>({});
 
-  const toggleExpand = (id: string) => {
+  const toggleExpand = useCallback((id: string) => {
     setExpandedIds(prev => {
       const next = new Set(prev);
       next.has(id) ? next.delete(id) : next.add(id);
       return next;
     });
-  };
+  }, []);
 
-  const getWbsName = (wbsId?: string) => {
-    if (!wbsId) return null;
-    return wbsTasks.find(w => w.id === wbsId)?.name || null;
-  };
+  const handleCommentDraftChange = useCallback((id: string, text: string) => {
+    setNewComment(prev => ({ ...prev, [id]: text }));
+  }, []);
 
-  const handleAddComment = (tcId: string, tc: TestCase) => {
-    const text = newComment[tcId]?.trim();
-    if (!text) return;
-    const comment: Comment = {
-      id: crypto.randomUUID(),
-      userName: commentUser[tcId] || TEAM_MEMBERS[0],
-      text,
-      timestamp: new Date().toLocaleString('ko-KR', { hour12: false }),
-    };
-    updateTestCase(tcId, { comments: [...tc.comments, comment] });
-    setNewComment(prev => ({ ...prev, [tcId]: '' }));
-  };
+  const handleCommentAuthorChange = useCallback((id: string, user: string) => {
+    setCommentUser(prev => ({ ...prev, [id]: user }));
+  }, []);
+
+  const wbsNameById = useMemo(() => {
+    const names: Record<string, string> = {};
+    wbsTasks.forEach(w => {
+      names[w.id] = w.name;
+    });
+    return names;
+  }, [wbsTasks]);
 
-  const isClosed = (status: QAStatus) =>
-    ['DevDone', 'ProdDone', 'Rejected', 'Duplicate'].includes(status);
+  // 보이는 행만 렌더링
+  const { listRef, start, end, paddingTop, paddingBottom, measureItem } = useWindowedList<HTMLTableElement>({
+    keys: testCaseIds,
+    estimatedItemHeight: ESTIMATED_ROW_HEIGHT,
+  });
 
   // 컬럼 수 계산
   const columnCount = isMasterView ? 9 : 10;
 
   return (
     <div className="bg-white border border-slate-200 rounded-lg overflow-x-auto">
-      <table className="w-full text-left min-w-[900px]">
+      <table ref={listRef} className="w-full text-left min-w-[900px]">
         <thead className="bg-slate-50 text-[9px] font-bold text-slate-500 uppercase tracking-wide border-b border-slate-200">
           <tr>
             {!isMasterView && <th className="w-[32px] px-2 py-2.5"></th>}
@@ -105,275 +424,42 @@ export function TestCaseTable({
             {!isMasterView && <th className="w-[32px] px-2 py-2.5"></th>}
           </tr>
         </thead>
-        <tbody className="divide-y divide-slate-100">
-          {testCases.map(tc => {
-            const isExpanded = expandedIds.has(tc.id);
-            const closed = isClosed(tc.status);
-            const issueConfig = tc.issueType ? ISSUE_TYPE_CONFIG[tc.issueType] : null;
-            const priorityConfig = PRIORITY_CONFIG[tc.priority];
-            const wbsName = getWbsName(tc.relatedWbsId);
-
-            return (
-              <React.Fragment key={tc.id}>
-                <tr
-                  className={`group hover:bg-slate-50 transition-colors cursor-pointer ${isExpanded ? 'bg-blue-50/50' : ''} ${closed ? 'opacity-60' : ''}`}
-                  onClick={() => !isMasterView && toggleExpand(tc.id)}
-                >
-                  {!isMasterView && (
-                    <td className="px-2 py-2">
-                      <svg
-                        className={`w-3 h-3 text-slate-400 transition-transform ${isExpanded ? 'rotate-90' : ''}`}
-                        fill="none" stroke="currentColor" viewBox="0 0 24 24"
-                      >
-                        <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2.5" d="M9 5l7 7-7 7" />
-                      </svg>
-                    </td>
-                  )}
-
-                  {isMasterView && (
-                    <td className="px-2 py-2">
-                      <span className="text-[9px] font-bold text-yellow-700 bg-yellow-50 px-1.5 py-0.5 rounded truncate block">
-                        {getScreenNameById(tc.originScreenId)}
-                      </span>
-                    </td>
-                  )}
-
-                  <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
-                    {isMasterView ? (
-                      issueConfig ? (
-                        <span className={`text-[9px] font-bold px-1.5 py-0.5 rounded ${issueConfig.color}`}>
-                          {issueConfig.icon}
-                        </span>
-                      ) : <span className="text-slate-300">-</span>
-                    ) : (
-                      <StatusSelect
-                        value={tc.issueType || 'bug'}
-                        onChange={(v) => updateTestCase(tc.id, { issueType: v as IssueType })}
-                        options={ISSUE_TYPE_OPTIONS}
-                        size="xs"
-                      />
-                    )}
-                  </td>
-
-                  <td className="px-2 py-2 text-center" onClick={e => e.stopPropagation()}>
-                    {isMasterView ? (
-                      <span className={`inline-block w-2.5 h-2.5 rounded-full ${priorityConfig.dot}`} />
-                    ) : (
-                      <StatusSelect
-                        value={tc.priority}
-                        onChange={(v) => updateTestCase(tc.id, { priority: v as QAPriority })}
-                        options={PRIORITY_OPTIONS}
-                        size="xs"
-                      />
-                    )}
-                  </td>
-
-                  <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
-                    {isMasterView ? (
-                      <p className={`text-xs font-medium truncate ${closed ? 'line-through text-slate-400' : 'text-slate-800'}`}>
-                        {tc.scenario}
-                      </p>
-                    ) : (
-                      <input
-                        type="text"
-                        value={tc.scenario}
-                        onChange={e => updateTestCase(tc.id, { scenario: e.target.value })}
-                        className={`w-full bg-transparent text-xs font-medium outline-none border-b border-transparent focus:border-slate-300 ${closed ? 'line-through text-slate-400' : 'text-slate-800'}`}
-                      />
-                    )}
-                  </td>
-
-                  <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
-                    {isMasterView ? (
-                      <span className="text-[9px] font-medium text-slate-500 bg-slate-100 px-1.5 py-0.5 rounded">
-                        {tc.position}
-                      </span>
-                    ) : (
-                      <StatusSelect
-                        value={tc.position}
-                        onChange={(v) => updateTestCase(tc.id, { position: v as QAPosition })}
-                        options={POSITION_OPTIONS}
-                        size="xs"
-                      />
-                    )}
-                  </td>
-
-                  <td className="px-2 py-2">
-                    {wbsName ? (
-                      <span className="text-[9px] font-bold text-blue-600 bg-blue-50 px-1.5 py-0.5 rounded truncate block max-w-[90px]" title={wbsName}>
-                        {wbsName}
-                      </span>
-                    ) : (
-                      <span className="text-[9px] text-slate-300">-</span>
-                    )}
-                  </td>
-
-                  <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
-                    <UserSelect
-                      value={tc.assignee}
-                      onChange={(v) => updateTestCase(tc.id, { assignee: v })}
-                      options={TEAM_MEMBERS}
-                      size="xs"
-                      disabled={isMasterView}
-                    />
-                  </td>
-
-                  <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
-                    <StatusSelect
-                      value={tc.status}
-                      onChange={(v) => updateTestCase(tc.id, { status: v as QAStatus })}
-                      options={QA_STATUS_OPTIONS}
-                      size="xs"
-                      disabled={isMasterView}
-                    />
-                  </td>
-
-                  <td className="px-2 py-2" onClick={e => e.stopPropagation()}>
-                    <StatusSelect
-                      value={tc.progress}
-                      onChange={(v) => updateTestCase(tc.id, { progress: v as QAProgress })}
-                      options={QA_PROGRESS_OPTIONS}
-                      size="xs"
-                      disabled={isMasterView}
-                    />
-                  </td>
-
-                  {!isMasterView && (
-                    <td className="px-2 py-2 text-center" onClick={e => e.stopPropagation()}>
-                      <button
-                        onClick={() => deleteTestCase(tc.id)}
-                        className="text-slate-300 hover:text-red-500 transition-colors text-lg leading-none"
-                      >
-                        ×
-                      </button>
-                    </td>
-                  )}
-                </tr>
-
-                {isExpanded && !isMasterView && (
-                  <tr>
-                    <td colSpan={columnCount} className="bg-slate-50 border-t border-slate-100">
-                      <div className="p-4 grid grid-cols-2 gap-4">
-                        <div className="space-y-3">
-                          <div>
-                            <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">체크포인트</label>
-                            <input
-                              type="text"
-                              value={tc.checkpoint || ''}
-                              onChange={e => updateTestCase(tc.id, { checkpoint: e.target.value })}
-                              placeholder="예: 로그인 버튼"
-                              className="w-full px-2 py-1.5 rounded border border-slate-200 text-xs outline-none focus:border-slate-400 bg-white"
-                            />
-                          </div>
-                          <div>
-                            <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">상세 내용</label>
-                            <textarea
-                              value={tc.issueContent}
-                              onChange={e => updateTestCase(tc.id, { issueContent: e.target.value })}
-                              rows={2}
-                              placeholder="이슈에 대한 상세 설명..."
-                              className="w-full px-2 py-1.5 rounded border border-slate-200 text-xs outline-none focus:border-slate-400 resize-none bg-white"
-                            />
-                          </div>
-                          <div className="grid grid-cols-2 gap-2">
-                            <div>
-                              <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">재현 방법</label>
-                              <textarea
-                                value={tc.reproductionSteps || ''}
-                                onChange={e => updateTestCase(tc.id, { reproductionSteps: e.target.value })}
-                                rows={2}
-                                placeholder="1. 첫 번째 단계..."
-                                className="w-full px-2 py-1.5 rounded border border-slate-200 text-xs outline-none focus:border-slate-400 resize-none bg-white"
-                              />
-                            </div>
-                            <div>
-                              <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">기대 결과</label>
-                              <textarea
-                                value={tc.expectedResult || ''}
-                                onChange={e => updateTestCase(tc.id, { expectedResult: e.target.value })}
-                                rows={2}
-                                placeholder="예상되는 정상 동작..."
-                                className="w-full px-2 py-1.5 rounded border border-slate-200 text-xs outline-none focus:border-slate-400 resize-none bg-white"
-                              />
-                            </div>
-                          </div>
-                          {tc.environment && (
-                            <div className="bg-slate-100 p-2 rounded text-[10px] text-slate-600">
-                              <span className="font-bold">환경:</span> {tc.environment}
-                            </div>
-                          )}
-                        </div>
-
-                        <div className="space-y-3">
-                          <div className="grid grid-cols-2 gap-2 text-[10px]">
-                            <div className="bg-white p-2 rounded border border-slate-200">
-                              <span className="text-slate-500">보고자:</span>{' '}
-                              <span className="font-bold text-slate-700">{tc.reporter}</span>
-                            </div>
-                            <div className="bg-white p-2 rounded border border-slate-200">
-                              <span className="text-slate-500">등록일:</span>{' '}
-                              <span className="font-bold text-slate-700">{tc.date}</span>
-                            </div>
-                          </div>
-
-                          {wbsName && (
-                            <div className="bg-blue-50 p-2 rounded border border-blue-200">
-                              <label className="text-[9px] font-bold text-blue-600 uppercase block mb-0.5">관련 WBS</label>
-                              <p className="text-xs font-medium text-blue-800">{wbsName}</p>
-                            </div>
-                          )}
-
-                          <div>
-                            <label className="text-[9px] font-bold text-slate-500 uppercase block mb-1">
-                              댓글 ({tc.comments.length})
-                            </label>
-                            <div className="max-h-24 overflow-y-auto space-y-1 mb-2">
-                              {tc.comments.map(c => (
-                                <div key={c.id} className="bg-white p-2 rounded border border-slate-200 text-[10px]">
-                                  <span className="font-bold text-slate-700">{c.userName}</span>
-                                  <span className="text-slate-400 ml-1">{c.timestamp}</span>
-                                  <p className="text-slate-600 mt-0.5">{c.text}</p>
-                                </div>
-                              ))}
-                              {tc.comments.length === 0 && (
-                                <p className="text-[10px] text-slate-400 text-center py-1">댓글 없음</p>
-                              )}
-                            </div>
-                            <div className="flex gap-1">
-                              <UserSelect
-                                value={commentUser[tc.id] || TEAM_MEMBERS[0]}
-                                onChange={(v) => setCommentUser(prev => ({ ...prev, [tc.id]: v }))}
-                                options={TEAM_MEMBERS}
-                                size="xs"
-                              />
-                              <input
-                                type="text"
-                                value={newComment[tc.id] || ''}
-                                onChange={e => setNewComment(prev => ({ ...prev, [tc.id]: e.target.value }))}
-                                onKeyDown={e => e.key === 'Enter' && handleAddComment(tc.id, tc)}
-                                placeholder="댓글..."
-                                className="flex-1 px-2 py-1 rounded border border-slate-200 text-[10px] outline-none focus:border-slate-400 bg-white"
-                              />
-                              <button
-                                onClick={() => handleAddComment(tc.id, tc)}
-                                className="px-2 py-1 bg-slate-800 text-white rounded text-[10px] font-bold hover:bg-slate-900"
-                              >
-                                추가
-                              </button>
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    </td>
-                  </tr>
-                )}
-              </React.Fragment>
-            );
-          })}
-        </tbody>
+        {paddingTop > 0 && (
+          <tbody>
+            <tr style={{ height: paddingTop }}><td colSpan={columnCount} /></tr>
+          </tbody>
+        )}
+        {testCaseIds.slice(start, end).map(id => {
+          const tc = testCasesById[id];
+          if (!tc) return null;
+          return (
+            <TestCaseRow
+              key={id}
+              tc={tc}
+              isMasterView={isMasterView}
+              isExpanded={expandedIds.has(id)}
+              columnCount={columnCount}
+              screenName={isMasterView ? getScreenNameById(tc.originScreenId) : ''}
+              wbsName={tc.relatedWbsId ? wbsNameById[tc.relatedWbsId] || null : null}
+              commentDraft={newComment[id]}
+              commentAuthor={commentUser[id]}
+              updateTestCase={updateTestCase}
+              deleteTestCase={deleteTestCase}
+              onToggleExpand={toggleExpand}
+              onCommentDraftChange={handleCommentDraftChange}
+              onCommentAuthorChange={handleCommentAuthorChange}
+              measureRef={measureItem(id)}
+            />
+          );
+        })}
+        {paddingBottom > 0 && (
+          <tbody>
+            <tr style={{ height: paddingBottom }}><td colSpan={columnCount} /></tr>
+          </tbody>
+        )}
       </table>
 
-      {testCases.length === 0 && (
+      {testCaseIds.length === 0 && (
         <div className="p-8 text-center">
           <svg className="w-8 h-8 text-slate-300 mx-auto mb-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
             <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="1.5" d="M9 5H7a2 2 0 00-2 2v12a2 2 0 002 2h10a2 2 0 002-2V7a2 2 0 00-2-2h-2M9 5a2 2 0 002 2h2a2 2 0 002-2M9 5a2 2 0 012-2h2a2 2 0 012 2m-6 9l2 2 4-4" />
@@ -1,15 +1,19 @@
 'use client';
 
-import React, { useMemo, useState } from 'react';
+import React, { useState } from 'react';
 import { WbsTask, ScreenData, TestCase } from '../../../types';
 import { GanttChart } from './GanttChart';
 import { WbsTable } from './WbsTable';
 import { WbsAddModal } from './WbsAddModal';
 import { useGanttDrag } from '../hooks/useGanttDrag';
+import { useTimelineRange } from '../hooks/useTimelineRange';
 
 interface WbsTabProps {
+  wbsTaskIds: string[];
+  wbsTasksById: Record<string, WbsTask>;
   wbsTasks: WbsTask[];
   testCases: TestCase[];
+  testCasesById: Record<string, TestCase>;
   isMasterView: boolean;
   activeScreen: ScreenData | null;
   getScreenNameById: (figmaId: string | undefined) => string;
@@ -19,8 +23,11 @@ interface WbsTabProps {
 }
 
 export function WbsTab({
+  wbsTaskIds,
+  wbsTasksById,
   wbsTasks,
   testCases,
+  testCasesById,
   isMasterView,
   activeScreen,
   getScreenNameById,
@@ -30,30 +37,9 @@ export function WbsTab({
 }: WbsTabProps) {
   const [showAddModal, setShowAddModal] = useState(false);
 
-  const timelineRange = useMemo(() => {
-    if (wbsTasks.length === 0) return null;
-    const startDates = wbsTasks.map(t => new Date(t.startDate).getTime()).filter(d => !isNaN(d));
-    const endDates = wbsTasks.map(t => new Date(t.endDate).getTime()).filter(d => !isNaN(d));
-    if (startDates.length === 0) return null;
+  const timelineRange = useTimelineRange(wbsTasks);
 
-    const minTime = Math.min(...startDates);
-    const maxTime = Math.max(...endDates, minTime + 86400000 * 7);
-
-    const startDate = new Date(minTime);
-    startDate.setDate(startDate.getDate() - 3);
-    const endDate = new Date(maxTime);
-    endDate.setDate(endDate.getDate() + 10);
-
-    const days: Date[] = [];
-    const current = new Date(startDate);
-    while (current <= endDate) {
-      days.push(new Date(current));
-      current.setDate(current.getDate() + 1);
-    }
-    return { days };
-  }, [wbsTasks]);
-
-  const { dragState, handleGanttMouseDown } = useGanttDrag({
+  const { dragState, dragPreview, handleGanttMouseDown } = useGanttDrag({
     wbsTasks,
     updateWbsTask,
     isMasterView,
@@ -96,13 +82,16 @@ export function WbsTab({
         <>
           <GanttChart
             wbsTasks={wbsTasks}
+            timelineRange={timelineRange}
             isMasterView={isMasterView}
             dragState={dragState}
+            dragPreview={dragPreview}
             onMouseDown={handleGanttMouseDown}
           />
           <WbsTable
-            wbsTasks={wbsTasks}
-            testCases={testCases}
+            wbsTaskIds={wbsTaskIds}
+            wbsTasksById={wbsTasksById}
+            testCasesById={testCasesById}
             isMasterView={isMasterView}
             getScreenNameById={getScreenNameById}
             updateWbsTask={updateWbsTask}
@@ -65,3 +65,10 @@ export function isValidViewMode(value: string | null): value is ViewMode {
 export function isValidTabType(value: string | null): value is TabType {
   return value !== null && TAB_TYPES.includes(value as TabType);
 }
+
+// Gantt Chart Layout
+export const GANTT_DAY_WIDTH = 24; // px per day column (w-6)
+export const GANTT_ROW_HEIGHT = 33; // px per task row (h-8 + border)
+export const GANTT_NAME_WIDTH = 144; // px for the task name column (w-36)
+export const GANTT_MAX_HEIGHT = 480; // px before the chart body scrolls vertically
+export const GANTT_OVERSCAN = 8; // extra columns/rows rendered outside the viewport
@@ -1,9 +1,26 @@
 'use client';
 
-import React, { createContext, useContext, useState, useMemo, useEffect, useCallback, ReactNode } from 'react';
+import React, { createContext, useContext, useState, useMemo, useEffect, useCallback, useRef, ReactNode } from 'react';
 import { useParams, useRouter, useSearchParams } from 'next/navigation';
 import { PrefixGroup, ScreenData, WbsTask, TestCase } from '../../../types';
 import { UnifiedTab, isValidUnifiedTab, TEAM_MEMBERS } from '../config/constants';
+import { getPrefixGroup } from '../../../services/figmaCache';
+import {
+  getWbsTasksByScreens,
+  getTestCasesByScreens,
+  putWbsTask,
+  putTestCase,
+  removeWbsTask,
+  removeTestCase,
+} from '../../../services/screenDataStore';
+import {
+  EntityState,
+  EMPTY_ENTITIES,
+  toEntityState,
+  updateEntity,
+  addEntity,
+  removeEntity,
+} from './entityState';
 
 // ============================================
 // Types
@@ -29,28 +46,53 @@ interface ScreenContextValue {
   currentUser: string;
   setCurrentUser: (user: string) => void;
 
-  // WBS Data
+  // Utilities
+  getScreenNameById: (figmaId: string | undefined) => string;
+  handleClose: () => void;
+
+  // Loading State
+  isLoading: boolean;
+}
+
+// WBS/TC data lives in its own context, so edits don't re-render header/navigation consumers
+interface ScreenDataContextValue {
+  // WBS Data (ids keep display order, byId holds the records)
+  wbsTaskIds: string[];
+  wbsTasksById: Record<string, WbsTask>;
   wbsTasks: WbsTask[];
   updateWbsTask: (id: string, updates: Partial<WbsTask>) => void;
   addWbsTask: (task: WbsTask) => void;
   deleteWbsTask: (id: string) => void;
 
   // TC Data
+  testCaseIds: string[];
+  testCasesById: Record<string, TestCase>;
   testCases: TestCase[];
   qaProgress: number;
   updateTestCase: (id: string, updates: Partial<TestCase>) => void;
   addTestCase: (tc: TestCase) => void;
   deleteTestCase: (id: string) => void;
-
-  // Utilities
-  getScreenNameById: (figmaId: string | undefined) => string;
-  handleClose: () => void;
-
-  // Loading State
-  isLoading: boolean;
 }
 
 const ScreenContext = createContext<ScreenContextValue | null>(null);
+const ScreenDataContext = createContext<ScreenDataContextValue | null>(null);
+
+// ============================================
+// Entity Helpers
+// ============================================
+
+// State plus a ref that always holds the latest value. Operations compute the next
+// state (and the record to persist) from the ref, so setState never runs side effects
+// in an updater, and several edits in one event see each other.
+function useEntityState<T>() {
+  const [state, setState] = useState<EntityState<T>>(EMPTY_ENTITIES);
+  const stateRef = useRef(state);
+  const commit = useCallback((next: EntityState<T>) => {
+    stateRef.current = next;
+    setState(next);
+  }, []);
+  return [state, stateRef, commit] as const;
+}
 
 // ============================================
 // Provider
@@ -81,8 +123,8 @@ export function ScreenProvider({ children }: ScreenProviderProps) {
   }, []);
 
   // Data State
-  const [wbsTasks, setWbsTasks] = useState<WbsTask[]>([]);
-  const [testCases, setTestCases] = useState<TestCase[]>([]);
+  const [wbsState, wbsStateRef, commitWbsState] = useEntityState<WbsTask>();
+  const [tcState, tcStateRef, commitTcState] = useEntityState<TestCase>();
 
   const isMasterView = activeScreenId === null;
 
@@ -92,60 +134,63 @@ export function ScreenProvider({ children }: ScreenProviderProps) {
     return Object.values(group.baseIds).flat();
   }, [group]);
 
+  const screensById = useMemo(() => {
+    return new Map(allScreens.map(s => [s.figmaId, s]));
+  }, [allScreens]);
+
   const activeScreen = useMemo(() => {
     if (activeScreenId === null) return null;
-    return allScreens.find(s => s.figmaId === activeScreenId) || null;
-  }, [activeScreenId, allScreens]);
+    return screensById.get(activeScreenId) || null;
+  }, [activeScreenId, screensById]);
 
   const activeScreensForData = useMemo(() => {
     if (activeScreenId === null) return allScreens;
-    const screen = allScreens.find(s => s.figmaId === activeScreenId);
-    return screen ? [screen] : [];
-  }, [activeScreenId, allScreens]);
+    return activeScreen ? [activeScreen] : [];
+  }, [activeScreenId, activeScreen, allScreens]);
+
+  const wbsTasks = useMemo(() => wbsState.ids.map(id => wbsState.byId[id]), [wbsState]);
+  const testCases = useMemo(() => tcState.ids.map(id => tcState.byId[id]), [tcState]);
 
-  // Load Group Data
+  // Load Group Data (from the last sync, or the parsed-file cache after a reload)
   useEffect(() => {
+    let cancelled = false;
     setIsLoading(true);
-    try {
-      const storedGroup = localStorage.getItem(`group_${prefix}`);
-      if (storedGroup) {
-        setGroup(JSON.parse(storedGroup));
-      }
-    } catch (error) {
-      console.error('Failed to load group data:', error);
-    } finally {
-      setIsLoading(false);
-    }
+    getPrefixGroup(prefix)
+      .then(storedGroup => {
+        if (!cancelled && storedGroup) setGroup(storedGroup);
+      })
+      .catch(error => {
+        console.error('Failed to load group data:', error);
+      })
+      .finally(() => {
+        if (!cancelled) setIsLoading(false);
+      });
+    return () => {
+      cancelled = true;
+    };
   }, [prefix]);
 
   // Load WBS & TC Data
   useEffect(() => {
     if (activeScreensForData.length === 0) return;
 
-    let aggregatedWbs: WbsTask[] = [];
-    let aggregatedQa: TestCase[] = [];
-
-    activeScreensForData.forEach(s => {
-      try {
-        const savedWbs = localStorage.getItem(`wbs_${s.figmaId}`);
-        const savedQa = localStorage.getItem(`qa_${s.figmaId}`);
-
-        if (savedWbs) {
-          const tasks = JSON.parse(savedWbs).map((t: WbsTask) => ({ ...t, originScreenId: s.figmaId }));
-          aggregatedWbs = [...aggregatedWbs, ...tasks];
-        }
-        if (savedQa) {
-          const cases = JSON.parse(savedQa).map((c: TestCase) => ({ ...c, originScreenId: s.figmaId }));
-          aggregatedQa = [...aggregatedQa, ...cases];
-        }
-      } catch (error) {
-        console.error(`Failed to load data for screen ${s.figmaId}:`, error);
-      }
-    });
-
-    setWbsTasks(aggregatedWbs);
-    setTestCases(aggregatedQa);
-  }, [activeScreensForData]);
+    let cancelled = false;
+    const screenIds = activeScreensForData.map(s => s.figmaId);
+
+    Promise.all([getWbsTasksByScreens(screenIds), getTestCasesByScreens(screenIds)])
+      .then(([tasks, cases]) => {
+        if (cancelled) return;
+        commitWbsState(toEntityState(tasks));
+        commitTcState(toEntityState(cases));
+      })
+      .catch(error => {
+        console.error('Failed to load WBS/TC data:', error);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [activeScreensForData, commitWbsState, commitTcState]);
 
   // Update URL
   useEffect(() => {
@@ -158,80 +203,55 @@ export function ScreenProvider({ children }: ScreenProviderProps) {
     window.history.replaceState(null, '', `/screen/${prefix}${newUrl}`);
   }, [activeScreenId, activeTab, prefix]);
 
-  // Storage Helper
-  const saveToStorage = useCallback((tasks: WbsTask[], cases: TestCase[]) => {
-    activeScreensForData.forEach(s => {
-      const screenTasks = tasks.filter(t => t.originScreenId === s.figmaId || (!t.originScreenId && s === activeScreensForData[0]));
-      const screenCases = cases.filter(c => c.originScreenId === s.figmaId || (!c.originScreenId && s === activeScreensForData[0]));
-      localStorage.setItem(`wbs_${s.figmaId}`, JSON.stringify(screenTasks));
-      localStorage.setItem(`qa_${s.figmaId}`, JSON.stringify(screenCases));
-    });
-  }, [activeScreensForData]);
-
-  // WBS Operations
+  // WBS Operations (only the changed item is persisted)
   const updateWbsTask = useCallback((id: string, updates: Partial<WbsTask>) => {
-    setWbsTasks(prev => {
-      const next = prev.map(t => t.id === id ? { ...t, ...updates } : t);
-      saveToStorage(next, testCases);
-      return next;
-    });
-  }, [testCases, saveToStorage]);
+    const next = updateEntity(wbsStateRef.current, id, updates);
+    if (next === wbsStateRef.current) return;
+    putWbsTask(next.byId[id]);
+    commitWbsState(next);
+  }, [wbsStateRef, commitWbsState]);
 
   const addWbsTask = useCallback((task: WbsTask) => {
     const taskWithScreen = {
       ...task,
       originScreenId: task.originScreenId || activeScreensForData[0]?.figmaId || ''
     };
-    setWbsTasks(prev => {
-      const next = [...prev, taskWithScreen];
-      saveToStorage(next, testCases);
-      return next;
-    });
-  }, [activeScreensForData, testCases, saveToStorage]);
+    putWbsTask(taskWithScreen);
+    commitWbsState(addEntity(wbsStateRef.current, taskWithScreen));
+  }, [activeScreensForData, wbsStateRef, commitWbsState]);
 
   const deleteWbsTask = useCallback((id: string) => {
-    setWbsTasks(prev => {
-      const next = prev.filter(t => t.id !== id);
-      saveToStorage(next, testCases);
-      return next;
-    });
-  }, [testCases, saveToStorage]);
+    removeWbsTask(id);
+    commitWbsState(removeEntity(wbsStateRef.current, id));
+  }, [wbsStateRef, commitWbsState]);
 
   // TC Operations
   const updateTestCase = useCallback((id: string, updates: Partial<TestCase>) => {
-    setTestCases(prev => {
-      const next = prev.map(t => t.id === id ? { ...t, ...updates } : t);
-      saveToStorage(wbsTasks, next);
-      return next;
-    });
-  }, [wbsTasks, saveToStorage]);
+    const next = updateEntity(tcStateRef.current, id, updates);
+    if (next === tcStateRef.current) return;
+    putTestCase(next.byId[id]);
+    commitTcState(next);
+  }, [tcStateRef, commitTcState]);
 
   const addTestCase = useCallback((tc: TestCase) => {
     const tcWithScreen = {
       ...tc,
       originScreenId: tc.originScreenId || activeScreensForData[0]?.figmaId || ''
     };
-    setTestCases(prev => {
-      const next = [...prev, tcWithScreen];
-      saveToStorage(wbsTasks, next);
-      return next;
-    });
-  }, [activeScreensForData, wbsTasks, saveToStorage]);
+    putTestCase(tcWithScreen);
+    commitTcState(addEntity(tcStateRef.current, tcWithScreen));
+  }, [activeScreensForData, tcStateRef, commitTcState]);
 
   const deleteTestCase = useCallback((id: string) => {
-    setTestCases(prev => {
-      const next = prev.filter(t => t.id !== id);
-      saveToStorage(wbsTasks, next);
-      return next;
-    });
-  }, [wbsTasks, saveToStorage]);
+    removeTestCase(id);
+    commitTcState(removeEntity(tcStateRef.current, id));
+  }, [tcStateRef, commitTcState]);
 
   // Utilities
   const getScreenNameById = useCallback((figmaId: string | undefined): string => {
     if (!figmaId) return '-';
-    const screen = allScreens.find(s => s.figmaId === figmaId);
-    return screen?.name || figmaId;
-  }, [allScreens]);
+    return screensById.get(figmaId)?.name || figmaId;
+  }, [screensById]);
 
   const handleClose = useCallback(() => {
     router.push('/');
@@ -243,7 +263,7 @@ export function ScreenProvider({ children }: ScreenProviderProps) {
     return Math.round((done / testCases.length) * 100);
   }, [testCases]);
 
-  const value: ScreenContextValue = {
+  const value = useMemo<ScreenContextValue>(() => ({
     group,
     allScreens,
     activeScreen,
@@ -256,23 +276,38 @@ export function ScreenProvider({ children }: ScreenProviderProps) {
     toggleSpecPanel,
     currentUser,
     setCurrentUser,
+    getScreenNameById,
+    handleClose,
+    isLoading,
+  }), [
+    group, allScreens, activeScreen, activeScreenId, isMasterView, activeTab,
+    isSpecPanelOpen, toggleSpecPanel, currentUser, getScreenNameById, handleClose, isLoading,
+  ]);
+
+  const dataValue = useMemo<ScreenDataContextValue>(() => ({
+    wbsTaskIds: wbsState.ids,
+    wbsTasksById: wbsState.byId,
     wbsTasks,
     updateWbsTask,
     addWbsTask,
     deleteWbsTask,
+    testCaseIds: tcState.ids,
+    testCasesById: tcState.byId,
     testCases,
     qaProgress,
     updateTestCase,
     addTestCase,
     deleteTestCase,
-    getScreenNameById,
-    handleClose,
-    isLoading,
-  };
+  }), [
+    wbsState, wbsTasks, updateWbsTask, addWbsTask, deleteWbsTask,
+    tcState, testCases, qaProgress, updateTestCase, addTestCase, deleteTestCase,
+  ]);
 
   return (
     <ScreenContext.Provider value={value}>
-      {children}
+      <ScreenDataContext.Provider value={dataValue}>
+        {children}
+      </ScreenDataContext.Provider>
     </ScreenContext.Provider>
   );
 }
@@ -287,3 +322,11 @@ export function useScreen() {
   }
   return context;
 }
+
+export function useScreenEntities() {
+  const context = useContext(ScreenDataContext);
+  if (!context) {
+    throw new Error('useScreenEntities must be used within a ScreenProvider');
+  }
+  return context;
+}
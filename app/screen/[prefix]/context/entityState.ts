@@ -0,0 +1,41 @@
+// ============================================
+// Normalized WBS/TC state: ids keep display order, byId holds the records
+// Pure helpers, so they can run (and be benchmarked) outside React
+// ============================================
+export interface EntityState<T> {
+  ids: string[];
+  byId: Record<string, T>;
+}
+
+export const EMPTY_ENTITIES = { ids: [], byId: {} };
+
+export function toEntityState<T extends { id: string }>(items: T[]): EntityState<T> {
+  const byId: Record<string, T> = {};
+  items.forEach(item => {
+    byId[item.id] = item;
+  });
+  return { ids: items.map(item => item.id), byId };
+}
+
+// Replaces a single record; ids (and every other record) keep their identity
+export function updateEntity<T extends { id: string }>(
+  prev: EntityState<T>,
+  id: string,
+  updates: Partial<T>
+): EntityState<T> {
+  const current = prev.byId[id];
+  if (!current) return prev;
+  return { ids: prev.ids, byId: { ...prev.byId, [id]: { ...current, ...updates } } };
+}
+
+export function addEntity<T extends { id: string }>(prev: EntityState<T>, item: T): EntityState<T> {
+  const ids = prev.byId[item.id] ? prev.ids : [...prev.ids, item.id];
+  return { ids, byId: { ...prev.byId, [item.id]: item } };
+}
+
+export function removeEntity<T extends { id: string }>(prev: EntityState<T>, id: string): EntityState<T> {
+  if (!prev.byId[id]) return prev;
+  const byId = { ...prev.byId };
+  delete byId[id];
+  return { ids: prev.ids.filter(existing => existing !== id), byId };
+}
@@ -1,28 +1,76 @@
 'use client';
 
-import { useState, useCallback, useEffect } from 'react';
+import { useState, useCallback, useEffect, useRef } from 'react';
 import { WbsTask } from '../../../types';
+import { GANTT_DAY_WIDTH } from '../config/constants';
+import { TimelineRange } from './useTimelineRange';
+
+type DragMode = 'move' | 'resize-start' | 'resize-end';
 
 interface DragState {
   taskId: string;
-  mode: 'move' | 'resize-start' | 'resize-end';
+  mode: DragMode;
   startX: number;
   originalStart: string;
   originalEnd: string;
 }
 
+export interface DragPreview {
+  taskId: string;
+  startDate: string;
+  endDate: string;
+}
+
 interface UseGanttDragProps {
   wbsTasks: WbsTask[];
   updateWbsTask: (id: string, updates: Partial<WbsTask>) => void;
   isMasterView: boolean;
-  timelineRange: { days: Date[] } | null;
+  timelineRange: TimelineRange | null;
 }
 
 interface UseGanttDragReturn {
   dragState: DragState | null;
-  handleGanttMouseDown: (e: React.MouseEvent, taskId: string, mode: 'move' | 'resize-start' | 'resize-end') => void;
+  dragPreview: DragPreview | null;
+  handleGanttMouseDown: (e: React.MouseEvent, taskId: string, mode: DragMode) => void;
+}
+
+const formatDate = (d: Date) => d.toISOString().split('T')[0];
+
+/**
+ * New start/end dates for a drag of daysDelta columns
+ */
+function computeDragDates(dragState: DragState, daysDelta: number): { startDate: string; endDate: string } {
+  const originalStart = new Date(dragState.originalStart);
+  const originalEnd = new Date(dragState.originalEnd);
+
+  let newStart = new Date(originalStart);
+  let newEnd = new Date(originalEnd);
+
+  if (dragState.mode === 'move') {
+    newStart.setDate(originalStart.getDate() + daysDelta);
+    newEnd.setDate(originalEnd.getDate() + daysDelta);
+  } else if (dragState.mode === 'resize-start') {
+    newStart.setDate(originalStart.getDate() + daysDelta);
+    if (newStart >= newEnd) {
+      newStart = new Date(newEnd);
+      newStart.setDate(newStart.getDate() - 1);
+    }
+  } else if (dragState.mode === 'resize-end') {
+    newEnd.setDate(originalEnd.getDate() + daysDelta);
+    if (newEnd <= newStart) {
+      newEnd = new Date(newStart);
+      newEnd.setDate(newEnd.getDate() + 1);
+    }
+  }
+
+  return { startDate: formatDate(newStart), endDate: formatDate(newEnd) };
 }
 
+/**
+ * Gantt bar drag/resize
+ * While dragging, only a local preview is updated (at most once per animation frame);
+ * the task itself is updated and persisted once, on mouseup.
+ */
 export function useGanttDrag({
   wbsTasks,
   updateWbsTask,
@@ -30,11 +78,16 @@ export function useGanttDrag({
   timelineRange
 }: UseGanttDragProps): UseGanttDragReturn {
   const [dragState, setDragState] = useState<DragState | null>(null);
+  const [dragPreview, setDragPreview] = useState<DragPreview | null>(null);
+
+  const lastClientXRef = useRef(0);
+  const frameRef = useRef<number | null>(null);
+  const daysDeltaRef = useRef(0);
 
   const handleGanttMouseDown = useCallback((
     e: React.MouseEvent,
     taskId: string,
-    mode: 'move' | 'resize-start' | 'resize-end'
+    mode: DragMode
   ) => {
     if (isMasterView) return;
     e.preventDefault();
@@ -42,6 +95,8 @@ export function useGanttDrag({
     const task = wbsTasks.find(t => t.id === taskId);
     if (!task) return;
 
+    lastClientXRef.current = e.clientX;
+    daysDeltaRef.current = 0;
     setDragState({
       taskId,
       mode,
@@ -49,64 +104,58 @@ export function useGanttDrag({
       originalStart: task.startDate,
       originalEnd: task.endDate
     });
+    setDragPreview({ taskId, startDate: task.startDate, endDate: task.endDate });
   }, [isMasterView, wbsTasks]);
 
-  const handleGanttMouseMove = useCallback((e: MouseEvent) => {
+  useEffect(() => {
     if (!dragState || !timelineRange) return;
 
-    const deltaX = e.clientX - dragState.startX;
-    const daysDelta = Math.round(deltaX / 32); // 32px per day
-
-    const task = wbsTasks.find(t => t.id === dragState.taskId);
-    if (!task) return;
-
-    const originalStart = new Date(dragState.originalStart);
-    const originalEnd = new Date(dragState.originalEnd);
-
-    let newStart = new Date(originalStart);
-    let newEnd = new Date(originalEnd);
+    const getDaysDelta = () => Math.round((lastClientXRef.current - dragState.startX) / GANTT_DAY_WIDTH);
+
+    const flushPreview = () => {
+      frameRef.current = null;
+      const daysDelta = getDaysDelta();
+      // Re-render only when the bar actually crosses a day boundary
+      if (daysDelta === daysDeltaRef.current) return;
+      daysDeltaRef.current = daysDelta;
+      setDragPreview({ taskId: dragState.taskId, ...computeDragDates(dragState, daysDelta) });
+    };
+
+    const handleMouseMove = (e: MouseEvent) => {
+      lastClientXRef.current = e.clientX;
+      if (frameRef.current === null) {
+        frameRef.current = requestAnimationFrame(flushPreview);
+      }
+    };
 
-    if (dragState.mode === 'move') {
-      newStart.setDate(originalStart.getDate() + daysDelta);
-      newEnd.setDate(originalEnd.getDate() + daysDelta);
-    } else if (dragState.mode === 'resize-start') {
-      newStart.setDate(originalStart.getDate() + daysDelta);
-      if (newStart >= newEnd) {
-        newStart = new Date(newEnd);
-        newStart.setDate(newStart.getDate() - 1);
+    const handleMouseUp = () => {
+      if (frameRef.current !== null) {
+        cancelAnimationFrame(frameRef.current);
+        frameRef.current = null;
       }
-    } else if (dragState.mode === 'resize-end') {
-      newEnd.setDate(originalEnd.getDate() + daysDelta);
-      if (newEnd <= newStart) {
-        newEnd = new Date(newStart);
-        newEnd.setDate(newEnd.getDate() + 1);
+      const daysDelta = getDaysDelta();
+      if (daysDelta !== 0) {
+        updateWbsTask(dragState.taskId, computeDragDates(dragState, daysDelta));
       }
-    }
-
-    const formatDate = (d: Date) => d.toISOString().split('T')[0];
-    updateWbsTask(dragState.taskId, {
-      startDate: formatDate(newStart),
-      endDate: formatDate(newEnd)
-    });
-  }, [dragState, timelineRange, wbsTasks, updateWbsTask]);
-
-  const handleGanttMouseUp = useCallback(() => {
-    setDragState(null);
-  }, []);
-
-  useEffect(() => {
-    if (dragState) {
-      window.addEventListener('mousemove', handleGanttMouseMove);
-      window.addEventListener('mouseup', handleGanttMouseUp);
-      return () => {
-        window.removeEventListener('mousemove', handleGanttMouseMove);
-        window.removeEventListener('mouseup', handleGanttMouseUp);
-      };
-    }
-  }, [dragState, handleGanttMouseMove, handleGanttMouseUp]);
+      setDragState(null);
+      setDragPreview(null);
+    };
+
+    window.addEventListener('mousemove', handleMouseMove);
+    window.addEventListener('mouseup', handleMouseUp);
+    return () => {
+      window.removeEventListener('mousemove', handleMouseMove);
+      window.removeEventListener('mouseup', handleMouseUp);
+      if (frameRef.current !== null) {
+        cancelAnimationFrame(frameRef.current);
+        frameRef.current = null;
+      }
+    };
+  }, [dragState, timelineRange, updateWbsTask]);
 
   return {
     dragState,
+    dragPreview,
     handleGanttMouseDown,
   };
 }
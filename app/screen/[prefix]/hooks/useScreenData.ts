@@ -2,6 +2,14 @@
 
 import { useState, useEffect, useMemo, useCallback } from 'react';
 import { ScreenData, WbsTask, TestCase, WbsStatus, QAStatus, QAProgress } from '../../../types';
+import {
+  getWbsTasksByScreens,
+  getTestCasesByScreens,
+  putWbsTask,
+  putTestCase,
+  removeWbsTask,
+  removeTestCase,
+} from '../../../services/screenDataStore';
 
 interface UseScreenDataProps {
   allScreens: ScreenData[];
@@ -44,92 +52,72 @@ export function useScreenData({ allScreens, activeScreenId }: UseScreenDataProps
     return screen?.name || figmaId;
   }, [allScreens]);
 
-  // Load data from localStorage
+  // Load data from the WBS/TC store
   useEffect(() => {
-    let aggregatedWbs: WbsTask[] = [];
-    let aggregatedQa: TestCase[] = [];
-
-    activeScreensForData.forEach(s => {
-      const savedWbs = localStorage.getItem(`wbs_${s.figmaId}`);
-      const savedQa = localStorage.getItem(`qa_${s.figmaId}`);
-      if (savedWbs) {
-        const tasks = JSON.parse(savedWbs).map((t: WbsTask) => ({ ...t, originScreenId: s.figmaId }));
-        aggregatedWbs = [...aggregatedWbs, ...tasks];
-      }
-      if (savedQa) {
-        const cases = JSON.parse(savedQa).map((c: TestCase) => ({ ...c, originScreenId: s.figmaId }));
-        aggregatedQa = [...aggregatedQa, ...cases];
-      }
-    });
-
-    setWbsTasks(aggregatedWbs);
-    setTestCases(aggregatedQa);
+    let cancelled = false;
+    const screenIds = activeScreensForData.map(s => s.figmaId);
+
+    Promise.all([getWbsTasksByScreens(screenIds), getTestCasesByScreens(screenIds)])
+      .then(([tasks, cases]) => {
+        if (cancelled) return;
+        setWbsTasks(tasks);
+        setTestCases(cases);
+      })
+      .catch(error => {
+        console.error('Failed to load WBS/TC data:', error);
+      });
+
+    return () => {
+      cancelled = true;
+    };
   }, [activeScreenId, activeScreensForData]);
 
-  const saveToStorage = useCallback((tasks: WbsTask[], cases: TestCase[]) => {
-    activeScreensForData.forEach(s => {
-      const screenTasks = tasks.filter(t => t.originScreenId === s.figmaId || (!t.originScreenId && s === activeScreensForData[0]));
-      const screenCases = cases.filter(c => c.originScreenId === s.figmaId || (!c.originScreenId && s === activeScreensForData[0]));
-      localStorage.setItem(`wbs_${s.figmaId}`, JSON.stringify(screenTasks));
-      localStorage.setItem(`qa_${s.figmaId}`, JSON.stringify(screenCases));
-    });
-  }, [activeScreensForData]);
-
+  // Only the changed item is persisted
   const updateWbsTask = useCallback((id: string, updates: Partial<WbsTask>) => {
-    setWbsTasks(prev => {
-      const next = prev.map(t => t.id === id ? { ...t, ...updates } : t);
-      saveToStorage(next, testCases);
-      return next;
-    });
-  }, [testCases, saveToStorage]);
-
-  const updateTestCase = useCallback((id: string, updates: Partial<TestCase>) => {
-    setTestCases(prev => {
-      const next = prev.map(t => t.id === id ? { ...t, ...updates } : t);
-      saveToStorage(wbsTasks, next);
-      return next;
-    });
-  }, [wbsTasks, saveToStorage]);
+    setWbsTasks(prev => prev.map(t => {
+      if (t.id !== id) return t;
+      const updated = { ...t, ...updates };
+      putWbsTask(updated);
+      return updated;
+    }));
+  }, []);
 
   const addWbsTask = useCallback((task: WbsTask) => {
     const taskWithScreen = {
       ...task,
       originScreenId: task.originScreenId || activeScreensForData[0]?.figmaId || ''
     };
-    setWbsTasks(prev => {
-      const next = [...prev, taskWithScreen];
-      saveToStorage(next, testCases);
-      return next;
-    });
-  }, [activeScreensForData, testCases, saveToStorage]);
+    putWbsTask(taskWithScreen);
+    setWbsTasks(prev => [...prev, taskWithScreen]);
+  }, [activeScreensForData]);
+
+  const deleteWbsTask = useCallback((id: string) => {
+    removeWbsTask(id);
+    setWbsTasks(prev => prev.filter(t => t.id !== id));
+  }, []);
+
+  const updateTestCase = useCallback((id: string, updates: Partial<TestCase>) => {
+    setTestCases(prev => prev.map(t => {
+      if (t.id !== id) return t;
+      const updated = { ...t, ...updates };
+      putTestCase(updated);
+      return updated;
+    }));
+  }, []);
 
   const addTestCase = useCallback((tc: TestCase) => {
     const tcWithScreen = {
       ...tc,
       originScreenId: tc.originScreenId || activeScreensForData[0]?.figmaId || ''
     };
-    setTestCases(prev => {
-      const next = [...prev, tcWithScreen];
-      saveToStorage(wbsTasks, next);
-      return next;
-    });
-  }, [activeScreensForData, wbsTasks, saveToStorage]);
-
-  const deleteWbsTask = useCallback((id: string) => {
-    setWbsTasks(prev => {
-      const next = prev.filter(t => t.id !== id);
-      saveToStorage(next, testCases);
-      return next;
-    });
-  }, [testCases, saveToStorage]);
+    putTestCase(tcWithScreen);
+    setTestCases(prev => [...prev, tcWithScreen]);
+  }, [activeScreensForData]);
 
   const deleteTestCase = useCallback((id: string) => {
-    setTestCases(prev => {
-      const next = prev.filter(t => t.id !== id);
-      saveToStorage(wbsTasks, next);
-      return next;
-    });
-  }, [wbsTasks, saveToStorage]);
+    removeTestCase(id);
+    setTestCases(prev => prev.filter(t => t.id !== id));
+  }, []);
 
   const qaProgress = useMemo(() => {
     if (testCases.length === 0) return 0;
@@ -0,0 +1,47 @@
+'use client';
+
+import { useMemo } from 'react';
+import { WbsTask } from '../../../types';
+
+const DAY_MS = 86400000;
+
+export interface TimelineRange {
+  start: Date;
+  dayCount: number;
+}
+
+/**
+ * Date of the idx-th day column
+ */
+export function getTimelineDay(range: TimelineRange, idx: number): Date {
+  const day = new Date(range.start);
+  day.setDate(day.getDate() + idx);
+  return day;
+}
+
+/**
+ * Timeline bounds covering every task, padded 3 days before and 10 days after
+ * Only the start date and column count are kept; day columns are derived on demand
+ */
+export function useTimelineRange(wbsTasks: WbsTask[]): TimelineRange | null {
+  return useMemo(() => {
+    let minTime = Infinity;
+    let maxTime = -Infinity;
+    for (const task of wbsTasks) {
+      const start = new Date(task.startDate).getTime();
+      const end = new Date(task.endDate).getTime();
+      if (!isNaN(start) && start < minTime) minTime = start;
+      if (!isNaN(end) && end > maxTime) maxTime = end;
+    }
+    if (minTime === Infinity) return null;
+    maxTime = Math.max(maxTime, minTime + DAY_MS * 7);
+
+    const start = new Date(minTime);
+    start.setDate(start.getDate() - 3);
+    const end = new Date(maxTime);
+    end.setDate(end.getDate() + 10);
+
+    const dayCount = Math.round((end.getTime() - start.getTime()) / DAY_MS) + 1;
+    return { start, dayCount };
+  }, [wbsTasks]);
+}
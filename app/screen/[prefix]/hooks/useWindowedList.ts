@@ -0,0 +1,196 @@
+'use client';
+
+import { useState, useRef, useMemo, useCallback, useEffect, useLayoutEffect } from 'react';
+
+// useLayoutEffect warns during SSR, so only use it in the browser
+const useIsomorphicLayoutEffect = typeof window !== 'undefined' ? useLayoutEffect : useEffect;
+
+interface UseWindowedListProps {
+  keys: string[];
+  estimatedItemHeight: number;
+  overscan?: number;
+}
+
+interface UseWindowedListReturn<T extends HTMLElement> {
+  listRef: React.RefObject<T>;
+  start: number;
+  end: number;
+  paddingTop: number;
+  paddingBottom: number;
+  measureItem: (key: string) => (el: HTMLElement | null) => void;
+}
+
+interface WindowRange {
+  start: number;
+  end: number;
+}
+
+// Nearest ancestor that actually scrolls vertically (null = window)
+// overflow-x: auto also computes overflow-y to auto, so overflowing content is checked too
+function getScrollParent(el: HTMLElement): HTMLElement | null {
+  let node = el.parentElement;
+  while (node) {
+    const { overflowY } = getComputedStyle(node);
+    if ((overflowY === 'auto' || overflowY === 'scroll') && node.scrollHeight > node.clientHeight) return node;
+    node = node.parentElement;
+  }
+  return null;
+}
+
+// Last index whose offset is <= value
+function findIndex(offsets: Float64Array, count: number, value: number): number {
+  let lo = 0;
+  let hi = count;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (offsets[mid] <= value) lo = mid;
+    else hi = mid - 1;
+  }
+  return lo;
+}
+
+/**
+ * Windowed rendering for variable-height lists
+ * - Only items in the viewport (plus overscan) render; the rest become top/bottom padding
+ * - Rendered items are measured with a ResizeObserver, so expand/collapse is picked up
+ * - Scroll is sampled once per frame and only re-renders when the window changes
+ */
+export function useWindowedList<T extends HTMLElement>({
+  keys,
+  estimatedItemHeight,
+  overscan = 8
+}: UseWindowedListProps): UseWindowedListReturn<T> {
+  const listRef = useRef<T>(null);
+  const heightsRef = useRef(new Map<string, number>());
+  const keyByElementRef = useRef(new WeakMap<Element, string>());
+  const elementByKeyRef = useRef(new Map<string, HTMLElement>());
+  const refCallbacksRef = useRef(new Map<string, (el: HTMLElement | null) => void>());
+  const observerRef = useRef<ResizeObserver | null>(null);
+  const frameRef = useRef<number | null>(null);
+
+  const [measureVersion, setMeasureVersion] = useState(0);
+  const [range, setRange] = useState<WindowRange>(() => ({
+    start: 0,
+    end: Math.min(keys.length, overscan * 4),
+  }));
+
+  // Cumulative item positions (offsets[i] = top of item i)
+  const offsets = useMemo(() => {
+    const result = new Float64Array(keys.length + 1);
+    const heights = heightsRef.current;
+    for (let i = 0; i < keys.length; i++) {
+      result[i + 1] = result[i] + (heights.get(keys[i]) ?? estimatedItemHeight);
+    }
+    return result;
+    // measureVersion: recompute when a measured height changes
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [keys, estimatedItemHeight, measureVersion]);
+
+  const offsetsRef = useRef(offsets);
+  offsetsRef.current = offsets;
+  const countRef = useRef(keys.length);
+  countRef.current = keys.length;
+
+  const updateRange = useCallback(() => {
+    frameRef.current = null;
+    const list = listRef.current;
+    if (!list) return;
+
+    const scroller = getScrollParent(list);
+    const viewportTop = scroller ? scroller.getBoundingClientRect().top : 0;
+    const viewportHeight = scroller ? scroller.clientHeight : window.innerHeight;
+    const top = viewportTop - list.getBoundingClientRect().top;
+
+    const count = countRef.current;
+    const start = Math.max(0, findIndex(offsetsRef.current, count, top) - overscan);
+    const end = Math.min(count, findIndex(offsetsRef.current, count, top + viewportHeight) + 1 + overscan);
+
+    setRange(prev => (prev.start === start && prev.end === end ? prev : { start, end }));
+  }, [overscan]);
+
+  const scheduleUpdate = useCallback(() => {
+    if (frameRef.current === null) {
+      frameRef.current = requestAnimationFrame(updateRange);
+    }
+  }, [updateRange]);
+
+  // Scroll/resize subscription
+  // Scroll events don't bubble, so listen in the capture phase to catch whichever ancestor scrolls
+  useEffect(() => {
+    document.addEventListener('scroll', scheduleUpdate, { capture: true, passive: true });
+    window.addEventListener('resize', scheduleUpdate);
+    return () => {
+      document.removeEventListener('scroll', scheduleUpdate, { capture: true });
+      window.removeEventListener('resize', scheduleUpdate);
+      if (frameRef.current !== null) {
+        cancelAnimationFrame(frameRef.current);
+        frameRef.current = null;
+      }
+    };
+  }, [scheduleUpdate]);
+
+  // Recompute the window before paint when the list or measurements change
+  useIsomorphicLayoutEffect(() => {
+    updateRange();
+  }, [offsets, updateRange]);
+
+  // Item height measurement
+  useEffect(() => {
+    if (typeof ResizeObserver === 'undefined') return;
+    const observer = new ResizeObserver(entries => {
+      let changed = false;
+      for (const entry of entries) {
+        const key = keyByElementRef.current.get(entry.target);
+        if (key === undefined) continue;
+        const height = (entry.target as HTMLElement).offsetHeight;
+        if (heightsRef.current.get(key) !== height) {
+          heightsRef.current.set(key, height);
+          changed = true;
+        }
+      }
+      if (changed) setMeasureVersion(v => v + 1);
+    });
+    observerRef.current = observer;
+    elementByKeyRef.current.forEach(el => observer.observe(el));
+    return () => {
+      observer.disconnect();
+      observerRef.current = null;
+    };
+  }, []);
+
+  // One stable ref callback per key, so React doesn't re-invoke it on every render
+  const measureItem = useCallback((key: string) => {
+    let callback = refCallbacksRef.current.get(key);
+    if (!callback) {
+      callback = (el: HTMLElement | null) => {
+        const prev = elementByKeyRef.current.get(key);
+        if (prev && prev !== el) {
+          observerRef.current?.unobserve(prev);
+          elementByKeyRef.current.delete(key);
+        }
+        if (el) {
+          keyByElementRef.current.set(el, key);
+          elementByKeyRef.current.set(key, el);
+          observerRef.current?.observe(el);
+        } else {
+          refCallbacksRef.current.delete(key);
+        }
+      };
+      refCallbacksRef.current.set(key, callback);
+    }
+    return callback;
+  }, []);
+
+  const start = Math.min(range.start, keys.length);
+  const end = Math.min(range.end, keys.length);
+  const total = offsets[keys.length];
+
+  return {
+    listRef,
+    start,
+    end,
+    paddingTop: offsets[start],
+    paddingBottom: total - offsets[end],
+    measureItem,
+  };
+}
@@ -2,7 +2,7 @@
 
 import React from 'react';
 import { ScreenData } from '../../types';
-import { ScreenProvider, useScreen } from './context/ScreenContext';
+import { ScreenProvider, useScreen, useScreenEntities } from './context/ScreenContext';
 import { ScreenHeader } from './components/ScreenHeader';
 import { SpecDrawer } from './components/SpecDrawer';
 import { WbsTab } from './components/WbsTab';
@@ -81,28 +81,33 @@ interface MainContentProps {
 }
 
 function MainContent({ activeTab, activeScreen, isMasterView }: MainContentProps) {
+  const { currentUser, setCurrentUser, getScreenNameById } = useScreen();
   const {
+    wbsTaskIds,
+    wbsTasksById,
     wbsTasks,
+    testCaseIds,
+    testCasesById,
     testCases,
     qaProgress,
-    currentUser,
-    setCurrentUser,
     updateWbsTask,
     updateTestCase,
     addWbsTask,
     addTestCase,
     deleteWbsTask,
     deleteTestCase,
-    getScreenNameById,
-  } = useScreen();
+  } = useScreenEntities();
 
   return (
     <div className="w-full flex flex-col bg-white overflow-hidden">
       <div className="flex-1 overflow-y-auto custom-scrollbar p-6">
         {activeTab === 'wbs' && (
           <WbsTab
+            wbsTaskIds={wbsTaskIds}
+            wbsTasksById={wbsTasksById}
             wbsTasks={wbsTasks}
             testCases={testCases}
+            testCasesById={testCasesById}
             isMasterView={isMasterView}
             activeScreen={activeScreen}
             getScreenNameById={getScreenNameById}
@@ -113,7 +118,8 @@ function MainContent({ activeTab, activeScreen, isMasterView }: MainContentProps
         )}
         {activeTab === 'qa' && (
           <QaTab
-            testCases={testCases}
+            testCaseIds={testCaseIds}
+            testCasesById={testCasesById}
             wbsTasks={wbsTasks}
             isMasterView={isMasterView}
             qaProgress={qaProgress}
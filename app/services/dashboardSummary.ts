@@ -0,0 +1,149 @@
+import { WbsTask, TestCase, QAStatus, QAPriority, QAProgress } from '../types';
+
+/**
+ * Aggregates behind the QA and developer dashboards
+ * Kept up to date on every TC/WBS write, so dashboards don't need to read every record
+ */
+export interface AssigneeTcStats {
+  total: number;
+  resolved: number;
+  inProgress: number;
+  errors: number;
+  byProgress: Record<QAProgress, number>;
+}
+
+export interface AssigneeWbsStats {
+  total: number;
+  inProgress: number;
+  done: number;
+}
+
+export interface ScreenTcStats {
+  total: number;
+  resolved: number;
+  errors: number;
+}
+
+export interface DashboardSummary {
+  tc: {
+    total: number;
+    byStatus: Record<QAStatus, number>;
+    byPriority: Record<QAPriority, number>;
+    byDate: Record<string, number>;
+    byAssignee: Record<string, AssigneeTcStats>;
+    byScreen: Record<string, ScreenTcStats>;
+  };
+  wbs: {
+    total: number;
+    byAssignee: Record<string, AssigneeWbsStats>;
+  };
+  screenNames: Record<string, string>; // figmaId → screen name
+  updatedAt: string;
+}
+
+const isResolved = (status: QAStatus) => status === 'DevDone' || status === 'ProdDone';
+const isError = (status: QAStatus) => status === 'DevError' || status === 'ProdError';
+
+export const createEmptyProgressCounts = (): Record<QAProgress, number> => ({
+  'Waiting': 0,
+  'Checking': 0,
+  'Working': 0,
+  'DevDeployed': 0,
+  'ProdDeployed': 0,
+});
+
+export const createEmptySummary = (screenNames: Record<string, string> = {}): DashboardSummary => ({
+  tc: {
+    total: 0,
+    byStatus: {
+      'Reviewing': 0,
+      'DevError': 0,
+      'ProdError': 0,
+      'DevDone': 0,
+      'ProdDone': 0,
+      'Hold': 0,
+      'Rejected': 0,
+      'Duplicate': 0,
+    },
+    byPriority: {
+      'High': 0,
+      'Medium': 0,
+      'Low': 0,
+    },
+    byDate: {},
+    byAssignee: {},
+    byScreen: {},
+  },
+  wbs: {
+    total: 0,
+    byAssignee: {},
+  },
+  screenNames,
+  updatedAt: new Date().toISOString(),
+});
+
+// Adds delta to a counter map, dropping keys that fall back to zero
+const bump = (counts: Record<string, number>, key: string, delta: number) => {
+  const next = (counts[key] || 0) + delta;
+  if (next === 0) delete counts[key];
+  else counts[key] = next;
+};
+
+/**
+ * Adds (sign = 1) or removes (sign = -1) one test case's contribution
+ */
+export const applyTestCase = (summary: DashboardSummary, tc: TestCase, sign: 1 | -1) => {
+  const { tc: stats } = summary;
+  stats.total += sign;
+  stats.byStatus[tc.status] = (stats.byStatus[tc.status] || 0) + sign;
+  stats.byPriority[tc.priority] = (stats.byPriority[tc.priority] || 0) + sign;
+  bump(stats.byDate, tc.date, sign);
+
+  const assignee = stats.byAssignee[tc.assignee] ||
+    (stats.byAssignee[tc.assignee] = { total: 0, resolved: 0, inProgress: 0, errors: 0, byProgress: createEmptyProgressCounts() });
+  assignee.total += sign;
+  if (isResolved(tc.status)) {
+    assignee.resolved += sign;
+  } else if (tc.progress === 'Working' || tc.progress === 'Checking') {
+    assignee.inProgress += sign;
+  }
+  if (isError(tc.status)) assignee.errors += sign;
+  assignee.byProgress[tc.progress] = (assignee.byProgress[tc.progress] || 0) + sign;
+  if (assignee.total === 0) delete stats.byAssignee[tc.assignee];
+
+  const screenId = tc.originScreenId || 'unknown';
+  const screen = stats.byScreen[screenId] || (stats.byScreen[screenId] = { total: 0, resolved: 0, errors: 0 });
+  screen.total += sign;
+  if (isResolved(tc.status)) screen.resolved += sign;
+  if (isError(tc.status)) screen.errors += sign;
+  if (screen.total === 0) delete stats.byScreen[screenId];
+};
+
+/**
+ * Adds (sign = 1) or removes (sign = -1) one WBS task's contribution
+ */
+export const applyWbsTask = (summary: DashboardSummary, task: WbsTask, sign: 1 | -1) => {
+  const { wbs: stats } = summary;
+  stats.total += sign;
+
+  const assignee = stats.byAssignee[task.assignee] ||
+    (stats.byAssignee[task.assignee] = { total: 0, inProgress: 0, done: 0 });
+  assignee.total += sign;
+  if (task.status === 'In Progress') assignee.inProgress += sign;
+  if (task.status === 'Done') assignee.done += sign;
+  if (assignee.total === 0) delete stats.byAssignee[task.assignee];
+};
+
+/**
+ * Full recomputation, used to build the summary the first time or repair drift
+ */
+export const computeSummary = (
+  tasks: WbsTask[],
+  cases: TestCase[],
+  screenNames: Record<string, string> = {}
+): DashboardSummary => {
+  const summary = createEmptySummary(screenNames);
+  tasks.forEach(task => applyWbsTask(summary, task, 1));
+  cases.forEach(tc => applyTestCase(summary, tc, 1));
+  return summary;
+};
@@ -0,0 +1,231 @@
+import type { FigmaNode, PrefixGroup } from '../types';
+
+export const FIGMA_API_BASE = 'https://api.figma.com/v1';
+
+// Top-level children of a page that can hold screens; anything else is already complete in the skeleton
+const CONTAINER_TYPES = new Set(['SECTION', 'FRAME', 'GROUP', 'COMPONENT', 'COMPONENT_SET', 'INSTANCE']);
+
+const DEFAULT_CONCURRENCY = 4;
+const DEFAULT_MAX_RETRIES = 4;
+const NODE_BATCH_SIZE = 20;
+const IMAGE_BATCH_SIZE = 50;
+const THUMBNAIL_SCALE = 0.5;
+const BASE_RETRY_DELAY_MS = 1000;
+const MAX_RETRY_DELAY_MS = 30000;
+
+export interface FigmaApiOptions {
+  baseUrl?: string; // e.g. a local mock server serving test.json-shaped responses
+  fetchImpl?: typeof fetch;
+  concurrency?: number;
+  maxRetries?: number;
+}
+
+export interface FigmaClient {
+  get: <T = any>(path: string, params?: Record<string, string | number | undefined>) => Promise<T>;
+}
+
+/**
+ * File loaded from the API; `data` is undefined when the file still matches `knownVersion`
+ */
+export interface FigmaFileResult {
+  version: string;
+  lastModified?: string;
+  data?: any;
+}
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+const chunk = <T>(items: T[], size: number): T[][] => {
+  const chunks: T[][] = [];
+  for (let i = 0; i < items.length; i += size) chunks.push(items.slice(i, i + size));
+  return chunks;
+};
+
+/**
+ * Runs at most `max` tasks at once; the rest wait in FIFO order
+ * A finishing task hands its slot straight to the next waiter, so a new caller can't take it in between
+ */
+const createLimiter = (max: number) => {
+  let active = 0;
+  const waiting: (() => void)[] = [];
+
+  return async <T>(task: () => Promise<T>): Promise<T> => {
+    if (active < max) active++;
+    else await new Promise<void>(resolve => waiting.push(resolve));
+    try {
+      return await task();
+    } finally {
+      const next = waiting.shift();
+      if (next) next();
+      else active--;
+    }
+  };
+};
+
+/**
+ * Delay before the next attempt: Retry-After when the API sends one, otherwise exponential backoff with jitter
+ * Network errors have no response and always back off
+ */
+const getRetryDelay = (response: Response | undefined, attempt: number): number => {
+  const retryAfter = Number(response?.headers.get('Retry-After'));
+  if (retryAfter > 0) return Math.min(retryAfter * 1000, MAX_RETRY_DELAY_MS);
+  const backoff = BASE_RETRY_DELAY_MS * 2 ** attempt;
+  return Math.min(backoff / 2 + Math.random() * backoff / 2, MAX_RETRY_DELAY_MS);
+};
+
+/**
+ * REST client for one personal access token
+ * All requests share one concurrency limit, and 429/5xx responses and network errors are retried with backoff
+ */
+export const createFigmaClient = (token: string, options: FigmaApiOptions = {}): FigmaClient => {
+  const baseUrl = (options.baseUrl || process.env.NEXT_PUBLIC_FIGMA_API_BASE || FIGMA_API_BASE).replace(/\/$/, '');
+  const fetchImpl = options.fetchImpl || fetch;
+  const maxRetries = options.maxRetries ?? DEFAULT_MAX_RETRIES;
+  const limit = createLimiter(options.concurrency ?? DEFAULT_CONCURRENCY);
+
+  const get = async <T = any>(path: string, params: Record<string, string | number | undefined> = {}): Promise<T> => {
+    const query = new URLSearchParams();
+    Object.entries(params).forEach(([key, value]) => {
+      if (value !== undefined && value !== '') query.set(key, String(value));
+    });
+    const url = `${baseUrl}${path}${query.toString() ? `?${query}` : ''}`;
+
+    for (let attempt = 0; ; attempt++) {
+      // The slot is released while backing off, so other requests keep flowing
+      let response: Response;
+      try {
+        response = await limit(() => fetchImpl(url, { headers: { 'X-Figma-Token': token } }));
+      } catch (error) {
+        // Network error: retried like a 5xx
+        if (attempt >= maxRetries) throw error;
+        const delay = getRetryDelay(undefined, attempt);
+        console.warn(`⏳ Figma API request for ${path} failed, retrying in ${Math.round(delay)}ms (${attempt + 1}/${maxRetries})`, error);
+        await sleep(delay);
+        continue;
+      }
+      if (response.ok) return response.json();
+
+      const retryable = response.status === 429 || response.status >= 500;
+      if (!retryable || attempt >= maxRetries) {
+        const body = await response.json().catch(() => undefined);
+        throw new Error(`Figma API ${response.status} for ${path}: ${body?.err || body?.message || response.statusText}`);
+      }
+
+      const delay = getRetryDelay(response, attempt);
+      console.warn(`⏳ Figma API ${response.status} for ${path}, retrying in ${Math.round(delay)}ms (${attempt + 1}/${maxRetries})`);
+      await sleep(delay);
+    }
+  };
+
+  return { get };
+};
+
+/**
+ * Fetches the nodes' full subtrees in batches
+ * Ids Figma can't find come back as null and are left out
+ */
+const fetchNodeSubtrees = async (
+  client: FigmaClient,
+  fileKey: string,
+  ids: string[],
+  version: string
+): Promise<Record<string, FigmaNode>> => {
+  const subtrees: Record<string, FigmaNode> = {};
+  await Promise.all(chunk(ids, NODE_BATCH_SIZE).map(async batch => {
+    const response = await client.get(`/files/${fileKey}/nodes`, { ids: batch.join(','), version });
+    Object.entries(response.nodes || {}).forEach(([id, entry]: [string, any]) => {
+      if (entry?.document) subtrees[id] = entry.document;
+    });
+  }));
+  return subtrees;
+};
+
+/**
+ * Loads a file in the shape parseFigmaFile expects
+ * - a shallow skeleton (document → pages → top-level children) doubles as the version probe,
+ *   so an unchanged file costs one small request
+ * - each top-level container is then pulled through /nodes, pinned to the skeleton's version,
+ *   and grafted back into its page
+ * - with `nodeId`, only that node is pulled (same shape as test.json)
+ */
+export const fetchFigmaFileTree = async (
+  client: FigmaClient,
+  fileKey: string,
+  nodeId?: string | null,
+  knownVersion?: string
+): Promise<FigmaFileResult> => {
+  const skeleton = await client.get(`/files/${fileKey}`, { depth: nodeId ? 1 : 2 });
+  const version: string = skeleton.version || '';
+  const lastModified: string | undefined = skeleton.lastModified;
+
+  if (knownVersion && version === knownVersion) {
+    return { version, lastModified };
+  }
+
+  if (nodeId) {
+    const nodes = await client.get(`/files/${fileKey}/nodes`, { ids: nodeId, version });
+    return { version, lastModified, data: { ...nodes, version, lastModified } };
+  }
+
+  const pages: FigmaNode[] = skeleton.document?.children || [];
+  const containerIds = pages.flatMap(page =>
+    (page.children || []).filter(child => CONTAINER_TYPES.has(child.type)).map(child => child.id)
+  );
+  const subtrees = await fetchNodeSubtrees(client, fileKey, containerIds, version);
+  console.log(`📥 Fetched ${Object.keys(subtrees).length}/${containerIds.length} top-level containers across ${pages.length} pages`);
+
+  const document: FigmaNode = {
+    ...skeleton.document,
+    children: pages.map(page => ({
+      ...page,
+      children: (page.children || []).map(child => subtrees[child.id] || child),
+    })),
+  };
+
+  return { version, lastModified, data: { ...skeleton, document } };
+};
+
+/**
+ * Renders every screen through batched /images calls and sets its thumbnailUrl in place
+ * A failed batch only leaves its screens without thumbnails
+ */
+export const resolveScreenThumbnails = async (
+  client: FigmaClient,
+  fileKey: string,
+  pages: Record<string, Record<string, PrefixGroup>>,
+  version?: string
+): Promise<number> => {
+  const screensById = new Map<string, { thumbnailUrl?: string }[]>();
+  Object.values(pages).forEach(groups => {
+    Object.values(groups).forEach(group => {
+      Object.values(group.baseIds).flat().forEach(screen => {
+        if (!screen.figmaId) return;
+        const screens = screensById.get(screen.figmaId);
+        if (screens) screens.push(screen);
+        else screensById.set(screen.figmaId, [screen]);
+      });
+    });
+  });
+
+  let resolved = 0;
+  await Promise.all(chunk([...screensById.keys()], IMAGE_BATCH_SIZE).map(async batch => {
+    try {
+      const response = await client.get(`/images/${fileKey}`, {
+        ids: batch.join(','),
+        format: 'png',
+        scale: THUMBNAIL_SCALE,
+        version,
+      });
+      Object.entries(response.images || {}).forEach(([id, url]) => {
+        if (typeof url !== 'string') return;
+        screensById.get(id)?.forEach(screen => { screen.thumbnailUrl = url; });
+        resolved++;
+      });
+    } catch (error) {
+      console.warn(`⚠️ Failed to render ${batch.length} thumbnails`, error);
+    }
+  }));
+
+  console.log(`🖼️ Resolved ${resolved}/${screensById.size} screen thumbnails`);
+  return resolved;
+};
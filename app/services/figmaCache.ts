@@ -0,0 +1,238 @@
+import { FigmaAuth, PrefixGroup } from '../types';
+import {
+  extractFigmaInfo,
+  fetchFigmaFileData,
+  parseFigmaFile,
+  resolveThumbnails,
+  FigmaParseProgressHandler,
+  FigmaParseSnapshot,
+} from './figmaService';
+import type { FigmaFileResult } from './figmaApi';
+import { openDatabase, requestToPromise, transactionDone } from '../utils/indexedDb';
+import { updateSummaryScreenNames } from './screenDataStore';
+
+type FigmaPages = Record<string, Record<string, PrefixGroup>>;
+
+const DB_NAME = 'eureka-figma-cache';
+const DB_VERSION = 2;
+const FILES_STORE = 'files';
+// Figma image URLs expire after 30 days, so cached thumbnails are re-rendered before that
+const THUMBNAIL_MAX_AGE_MS = 25 * 24 * 60 * 60 * 1000;
+
+/**
+ * Parsed output of one file version, plus the snapshot used to re-parse the next version incrementally
+ */
+interface CachedFigmaFile {
+  fileKey: string;
+  nodeId: string; // '' for the whole file; a node-id URL only loads that node
+  version: string;
+  lastModified?: string;
+  pages: FigmaPages;
+  snapshot: FigmaParseSnapshot;
+  cachedAt: string;
+}
+
+const openCacheDb = () =>
+  openDatabase(DB_NAME, DB_VERSION, (db, oldVersion) => {
+    // v1 was keyed by file only, so a node-id load could stand in for the whole file; start over
+    if (oldVersion < 2 && db.objectStoreNames.contains(FILES_STORE)) db.deleteObjectStore(FILES_STORE);
+    const store = db.createObjectStore(FILES_STORE, { keyPath: ['fileKey', 'nodeId', 'version'] });
+    store.createIndex('source', ['fileKey', 'nodeId']);
+  });
+
+/**
+ * Most recently cached version of a file, or of one node of it (older versions are pruned on write)
+ */
+const getLatestCachedFile = async (fileKey: string, nodeId: string | null): Promise<CachedFigmaFile | undefined> => {
+  const db = await openCacheDb();
+  const store = db.transaction(FILES_STORE, 'readonly').objectStore(FILES_STORE);
+  const files: CachedFigmaFile[] = await requestToPromise(store.index('source').getAll([fileKey, nodeId || '']));
+  return files.sort((a, b) => b.cachedAt.localeCompare(a.cachedAt))[0];
+};
+
+const putCachedFile = async (file: CachedFigmaFile): Promise<void> => {
+  const db = await openCacheDb();
+  const tx = db.transaction(FILES_STORE, 'readwrite');
+  const store = tx.objectStore(FILES_STORE);
+
+  // Replace any previous version of the same file (or node)
+  const keysRequest = store.index('source').getAllKeys([file.fileKey, file.nodeId]);
+  keysRequest.onsuccess = () => {
+    keysRequest.result.forEach(key => store.delete(key));
+    store.put(file);
+  };
+
+  await transactionDone(tx);
+};
+
+const writeCache = async (file: CachedFigmaFile): Promise<void> => {
+  try {
+    await putCachedFile(file);
+  } catch (error) {
+    console.warn('⚠️ Failed to write Figma cache', error);
+  }
+};
+
+/**
+ * Pages available now, plus the background version check that follows a cache hit
+ * `revalidation` never rejects; it resolves with new pages only when they changed
+ */
+export interface FigmaLoadResult {
+  pages: FigmaPages;
+  revalidation?: Promise<FigmaPages | undefined>;
+}
+
+/**
+ * Parses a downloaded version, renders its thumbnails and caches it
+ * With `previous`, only screens in changed CANVAS/SECTION units are re-extracted
+ */
+const parseAndCache = async (
+  auth: FigmaAuth,
+  source: { fileKey: string; nodeId: string },
+  result: FigmaFileResult,
+  previous?: CachedFigmaFile,
+  onProgress?: FigmaParseProgressHandler
+): Promise<FigmaPages> => {
+  const snapshot: FigmaParseSnapshot = { units: {} };
+  const pages = parseFigmaFile(result.data, onProgress, { previous: previous?.snapshot, next: snapshot });
+  await resolveThumbnails(auth, pages, result.version);
+
+  await writeCache({
+    fileKey: source.fileKey,
+    nodeId: source.nodeId,
+    version: result.version,
+    lastModified: result.lastModified,
+    pages,
+    snapshot,
+    cachedAt: new Date().toISOString(),
+  });
+
+  return pages;
+};
+
+/**
+ * Checks a cache hit against the current version; offline or rate-limited probes keep the cached pages
+ */
+const revalidate = async (auth: FigmaAuth, cached: CachedFigmaFile): Promise<FigmaPages | undefined> => {
+  try {
+    const result = await fetchFigmaFileData(auth, cached.version);
+
+    if (!result.data) {
+      if (Date.now() - new Date(cached.cachedAt).getTime() < THUMBNAIL_MAX_AGE_MS) return undefined;
+      await resolveThumbnails(auth, cached.pages, result.version);
+      await writeCache({ ...cached, cachedAt: new Date().toISOString() });
+      // New object, so the UI picks up the re-rendered thumbnails
+      return { ...cached.pages };
+    }
+
+    console.log(`🔄 ${cached.fileKey} changed (${cached.version} → ${result.version}), re-parsing`);
+    return await parseAndCache(auth, cached, result, cached);
+  } catch (error) {
+    console.warn('⚠️ Figma revalidation failed, keeping cached data', error);
+    return undefined;
+  }
+};
+
+/**
+ * Loads a Figma file, reusing cached parse results:
+ * - cached → the cached groups are returned right away and the version is checked in the background;
+ *   a new version is re-parsed there, re-extracting only screens in changed CANVAS/SECTION units
+ * - not cached → the file is downloaded and parsed
+ */
+export const fetchFigmaFileCached = async (
+  auth: FigmaAuth,
+  onProgress?: FigmaParseProgressHandler
+): Promise<FigmaLoadResult> => {
+  const { fileKey, nodeId } = extractFigmaInfo(auth.fileKey);
+
+  let cached: CachedFigmaFile | undefined;
+  try {
+    cached = await getLatestCachedFile(fileKey, nodeId);
+  } catch (error) {
+    console.warn('⚠️ Figma cache unavailable, parsing without cache', error);
+  }
+
+  if (cached) {
+    console.log(`⚡ Cache hit for ${fileKey}@${cached.version}, revalidating in background`);
+    return { pages: cached.pages, revalidation: revalidate(auth, cached) };
+  }
+
+  const result = await fetchFigmaFileData(auth);
+  const pages = await parseAndCache(auth, { fileKey, nodeId: nodeId || '' }, result, undefined, onProgress);
+  return { pages };
+};
+
+// ============================================
+// Main-thread access to the loaded groups
+// ============================================
+
+// Groups from the last sync in this tab; client-side navigation keeps module state,
+// so the detail page can read them without any serialization
+let loadedPages: FigmaPages | null = null;
+
+/**
+ * figmaId → screen name for every screen in the groups
+ */
+const collectScreenNames = (pages: FigmaPages): Record<string, string> => {
+  const names: Record<string, string> = {};
+  Object.values(pages).forEach(groups => {
+    Object.values(groups).forEach(group => {
+      Object.values(group.baseIds).flat().forEach(screen => {
+        if (screen.figmaId && screen.name) {
+          names[screen.figmaId] = screen.name;
+        }
+      });
+    });
+  });
+  return names;
+};
+
+/**
+ * Keeps the synced groups in memory, records screen names for the dashboards,
+ * and drops the per-prefix copies older builds wrote to localStorage on every card click
+ */
+export const rememberLoadedPages = (pages: FigmaPages) => {
+  loadedPages = pages;
+
+  updateSummaryScreenNames(collectScreenNames(pages)).catch(error => {
+    console.error('Failed to update screen names:', error);
+  });
+
+  const legacyKeys: string[] = [];
+  for (let i = 0; i < localStorage.length; i++) {
+    const key = localStorage.key(i);
+    if (key?.startsWith('group_')) legacyKeys.push(key);
+  }
+  legacyKeys.forEach(key => localStorage.removeItem(key));
+};
+
+/**
+ * Groups of the current file: in-memory after a sync, otherwise from the cache (e.g. after a reload)
+ */
+const getCurrentPages = async (): Promise<FigmaPages | null> => {
+  if (loadedPages) return loadedPages;
+
+  const input = localStorage.getItem('figma_file_key');
+  if (!input) return null;
+
+  try {
+    const { fileKey, nodeId } = extractFigmaInfo(input);
+    const cached = await getLatestCachedFile(fileKey, nodeId);
+    if (cached) loadedPages = cached.pages;
+    return loadedPages;
+  } catch (error) {
+    console.error('Failed to read Figma cache:', error);
+    return null;
+  }
+};
+
+export const getPrefixGroup = async (prefix: string): Promise<PrefixGroup | null> => {
+  const pages = await getCurrentPages();
+  for (const groups of Object.values(pages || {})) {
+    if (groups[prefix]) return groups[prefix];
+  }
+
+  // Copy left behind by an older build
+  const legacy = localStorage.getItem(`group_${prefix}`);
+  return legacy ? JSON.parse(legacy) : null;
+};
@@ -0,0 +1,72 @@
+/**
+ * Opt-in diagnostics for the Figma parser
+ * - log: per-screen console output (containers, descriptions, covers)
+ * - marks: performance.mark/measure around each parse phase, visible in the
+ *   DevTools Performance panel or through performance.getEntriesByName
+ *
+ * Both are off by default. Call sites check the flag before building any message,
+ * so a disabled build pays one property read per site.
+ * Enable at build time with NEXT_PUBLIC_FIGMA_DEBUG=log,marks (or "all"),
+ * or at runtime with setFigmaDebug / localStorage 'figma_debug'.
+ */
+export interface FigmaDebugFlags {
+  log: boolean;
+  marks: boolean;
+}
+
+export const MEASURE_PREFIX = 'figma:';
+
+const parseFlags = (value: string | null | undefined): FigmaDebugFlags => {
+  const flags = (value || '').split(',').map(flag => flag.trim());
+  const all = flags.includes('all') || flags.includes('1');
+  return {
+    log: all || flags.includes('log'),
+    marks: all || flags.includes('marks'),
+  };
+};
+
+// Read directly by call sites: `if (figmaDebug.log) console.log(...)`
+export const figmaDebug: FigmaDebugFlags = parseFlags(process.env.NEXT_PUBLIC_FIGMA_DEBUG);
+
+export const setFigmaDebug = (flags: Partial<FigmaDebugFlags>) => {
+  Object.assign(figmaDebug, flags);
+};
+
+/**
+ * Flags requested from the browser for on-demand profiling of production parses,
+ * e.g. localStorage.setItem('figma_debug', 'marks') then re-sync
+ */
+export const getStoredFigmaDebug = (): Partial<FigmaDebugFlags> | undefined => {
+  if (typeof localStorage === 'undefined') return undefined;
+  const stored = localStorage.getItem('figma_debug');
+  return stored ? parseFlags(stored) : undefined;
+};
+
+const noop = () => {};
+
+/**
+ * Starts the named phase; call the returned function when it ends
+ * With marks on, the phase is recorded as a `figma:<phase>` measure
+ */
+export const startPhase = (phase: string): (() => void) => {
+  if (!figmaDebug.marks || typeof performance === 'undefined' || !performance.mark) return noop;
+
+  const startMark = `${MEASURE_PREFIX}${phase}:start`;
+  performance.mark(startMark);
+  return () => {
+    performance.measure(`${MEASURE_PREFIX}${phase}`, startMark);
+    performance.clearMarks(startMark);
+  };
+};
+
+/**
+ * Runs `fn` as the named phase
+ */
+export const measurePhase = <T>(phase: string, fn: () => T): T => {
+  const endPhase = startPhase(phase);
+  try {
+    return fn();
+  } finally {
+    endPhase();
+  }
+};
@@ -0,0 +1,94 @@
+import { FigmaAuth, PrefixGroup } from '../types';
+import { FigmaParseProgressHandler } from './figmaService';
+import { fetchFigmaFileCached } from './figmaCache';
+import { getStoredFigmaDebug, setFigmaDebug } from './figmaDebug';
+import type { FigmaWorkerRequest, FigmaWorkerResponse } from './figmaParser.worker';
+
+type FigmaPages = Record<string, Record<string, PrefixGroup>>;
+
+/**
+ * Main-thread load; a newer version found after a cache hit is passed to `onUpdate`
+ */
+const loadOnMainThread = async (
+  auth: FigmaAuth,
+  onProgress?: FigmaParseProgressHandler,
+  onUpdate?: (pages: FigmaPages) => void
+): Promise<FigmaPages> => {
+  const { pages, revalidation } = await fetchFigmaFileCached(auth, onProgress);
+  revalidation?.then(updated => {
+    if (updated) onUpdate?.(updated);
+  });
+  return pages;
+};
+
+/**
+ * Loads and parses a Figma file in a Web Worker, streaming progress back to the caller.
+ * Falls back to parsing on the main thread when workers are unavailable
+ * or the worker script fails to start.
+ * A cache hit resolves right away; if the background version check finds a newer
+ * version, its groups are passed to `onUpdate`.
+ */
+export const loadFigmaFile = (
+  auth: FigmaAuth,
+  onProgress?: FigmaParseProgressHandler,
+  onUpdate?: (pages: FigmaPages) => void
+): Promise<FigmaPages> => {
+  // Debug flags requested through localStorage apply to this thread and the worker
+  const debug = getStoredFigmaDebug();
+  if (debug) setFigmaDebug(debug);
+
+  if (typeof window === 'undefined' || typeof Worker === 'undefined') {
+    return loadOnMainThread(auth, onProgress, onUpdate);
+  }
+
+  let worker: Worker;
+  try {
+    worker = new Worker(new URL('./figmaParser.worker.ts', import.meta.url));
+  } catch (error) {
+    console.warn('⚠️ Figma worker unavailable, parsing on main thread', error);
+    return loadOnMainThread(auth, onProgress, onUpdate);
+  }
+
+  return new Promise((resolve, reject) => {
+    let settled = false;
+
+    worker.onmessage = (event: MessageEvent<FigmaWorkerResponse>) => {
+      const message = event.data;
+      switch (message.type) {
+        case 'progress':
+          onProgress?.(message.progress);
+          return;
+        case 'done':
+          // After a cache hit the worker stays up for the background version check
+          if (!message.revalidating) worker.terminate();
+          settled = true;
+          resolve(message.pages);
+          return;
+        case 'revalidated':
+          worker.terminate();
+          if (message.pages) onUpdate?.(message.pages);
+          return;
+        case 'error':
+          worker.terminate();
+          settled = true;
+          reject(new Error(message.message));
+      }
+    };
+
+    worker.onerror = (event) => {
+      event.preventDefault();
+      worker.terminate();
+      if (settled) {
+        // Failed during the background check: the cached groups are already shown
+        console.warn('⚠️ Figma worker failed while revalidating', event.message);
+        return;
+      }
+      // Script load or uncaught worker error: retry on the main thread
+      console.warn('⚠️ Figma worker failed, parsing on main thread', event.message);
+      loadOnMainThread(auth, onProgress, onUpdate).then(resolve, reject);
+    };
+
+    const request: FigmaWorkerRequest = { type: 'load', auth, debug };
+    worker.postMessage(request);
+  });
+};
@@ -0,0 +1,44 @@
+import { FigmaAuth, PrefixGroup } from '../types';
+import { FigmaParseProgress } from './figmaService';
+import { fetchFigmaFileCached } from './figmaCache';
+import { setFigmaDebug, FigmaDebugFlags } from './figmaDebug';
+
+export interface FigmaWorkerRequest {
+  type: 'load';
+  auth: FigmaAuth;
+  debug?: Partial<FigmaDebugFlags>;
+}
+
+export type FigmaWorkerResponse =
+  | { type: 'progress'; progress: FigmaParseProgress }
+  | { type: 'done'; pages: Record<string, Record<string, PrefixGroup>>; revalidating: boolean }
+  // Last message after a cache hit; `pages` only when the file changed
+  | { type: 'revalidated'; pages?: Record<string, Record<string, PrefixGroup>> }
+  | { type: 'error'; message: string };
+
+// Typed view of the dedicated worker scope (tsconfig only ships the DOM lib)
+const workerScope = self as unknown as {
+  postMessage: (message: FigmaWorkerResponse) => void;
+  addEventListener: (type: 'message', listener: (event: MessageEvent<FigmaWorkerRequest>) => void) => void;
+};
+
+workerScope.addEventListener('message', async (event) => {
+  if (event.data.type !== 'load') return;
+  if (event.data.debug) setFigmaDebug(event.data.debug);
+
+  try {
+    workerScope.postMessage({ type: 'progress', progress: { phase: 'fetching', pages: {}, screenCount: 0 } });
+    // response.json(), the cache lookup and the whole parse run here, off the UI thread
+    const { pages, revalidation } = await fetchFigmaFileCached(event.data.auth, progress => {
+      workerScope.postMessage({ type: 'progress', progress });
+    });
+    // Structured clone keeps shared references, so each prefix's coverData is sent once
+    workerScope.postMessage({ type: 'done', pages, revalidating: !!revalidation });
+    if (revalidation) {
+      workerScope.postMessage({ type: 'revalidated', pages: await revalidation });
+    }
+  } catch (err: unknown) {
+    const message = err instanceof Error ? err.message : '동기화 실패';
+    workerScope.postMessage({ type: 'error', message });
+  }
+});
@@ -1,6 +1,9 @@
-import { FigmaAuth, FigmaNode, ScreenData, ScreenGroup, PrefixGroup, CoverData, TextStyleData } from '../types';
-
-const FIGMA_API_BASE = 'https://api.figma.com/v1';
+import type { FigmaAuth, FigmaNode, ScreenData, ScreenGroup, PrefixGroup, CoverData, TextStyleData } from '../types';
+import { createFigmaClient, fetchFigmaFileTree, resolveScreenThumbnails } from './figmaApi';
+import type { FigmaFileResult } from './figmaApi';
+import { figmaDebug, measurePhase, startPhase } from './figmaDebug';
+import { createHasher } from '../utils/hash';
+import type { Hasher } from '../utils/hash';
 
 // Label patterns for field extraction
 const LABEL_PATTERNS = {
@@ -152,16 +155,13 @@ const extractFieldValue = (
 };
 
 /**
- * Extract all descriptions from the container
+ * Extract all descriptions from the container's text nodes
  * Each screen ID has its own container with full_list descriptions
  */
-const findDescriptionText = (node: FigmaNode, suffix?: string): string => {
-  // Collect all text nodes
-  const textNodes = collectAllTextNodes(node);
-
+const findDescriptionText = (textNodes: TextNodeInfo[]): string => {
   if (textNodes.length === 0) return '';
 
-  console.log(`🔍 [findDescriptionText] Extracting descriptions for container`);
+  if (figmaDebug.log) console.log(`🔍 [findDescriptionText] Extracting descriptions for container`);
 
   // Find all full_list nodes
   const fullListNodes = textNodes.filter(node =>
@@ -169,7 +169,7 @@ const findDescriptionText = (node: FigmaNode, suffix?: string): string => {
     node.parentName.toLowerCase().includes('full_list')
   );
 
-  console.log(`🔍 [findDescriptionText] Found ${fullListNodes.length} full_list nodes`);
+  if (figmaDebug.log) console.log(`🔍 [findDescriptionText] Found ${fullListNodes.length} full_list nodes`);
 
   // Extract all descriptions with their labels
   const descriptionParts: string[] = [];
@@ -203,13 +203,13 @@ const findDescriptionText = (node: FigmaNode, suffix?: string): string => {
   // If we found structured descriptions, join them
   if (descriptionParts.length > 0) {
     const result = descriptionParts.join('\n\n');
-    console.log(`✅ [findDescriptionText] Extracted ${descriptionParts.length} label-description pairs`);
-    console.log(`✅ [findDescriptionText] Labels found: ${descriptionParts.map(d => d.split('.')[0]).join(', ')}`);
+    if (figmaDebug.log) console.log(`✅ [findDescriptionText] Extracted ${descriptionParts.length} label-description pairs`);
+    if (figmaDebug.log) console.log(`✅ [findDescriptionText] Labels found: ${descriptionParts.map(d => d.split('.')[0]).join(', ')}`);
     return result;
   }
 
   // Fallback: try label-value extraction
-  console.log(`⚠️ [findDescriptionText] No structured descriptions found, trying label-value extraction`);
+  if (figmaDebug.log) console.log(`⚠️ [findDescriptionText] No structured descriptions found, trying label-value extraction`);
   const labelValuePairs = extractLabelValuePairs(textNodes);
   const description = extractFieldValue(
     labelValuePairs,
@@ -221,13 +221,10 @@ const findDescriptionText = (node: FigmaNode, suffix?: string): string => {
 };
 
 /**
- * Extracts screen information from node using label-value pairs
+ * Extracts screen information from the container's text nodes using label-value pairs
  * Returns undefined if value is "-" or empty
  */
-const findScreenInformation = (node: FigmaNode): string | undefined => {
-  // Collect all text nodes
-  const textNodes = collectAllTextNodes(node);
-
+const findScreenInformation = (textNodes: TextNodeInfo[]): string | undefined => {
   if (textNodes.length === 0) return undefined;
 
   // Extract label-value pairs
@@ -333,74 +330,333 @@ const extractCoverData = (node: FigmaNode): CoverData | undefined => {
   };
 };
 
+// Screen ID pattern: allows Korean characters and special characters in suffix
+// Examples: AUTO_0004_5, AUTO_0004_ㅅ, AUTO_0004_가
+const SCREEN_NAME_REGEX = /^([A-Z]+_[0-9]+)(_(.+))?$/;
+const COVER_SCREEN_ID_REGEX = /^([A-Z]+)_[0-9]+(_(.+))?$/;
+const MATCHABLE_TYPES = new Set(['FRAME', 'COMPONENT', 'INSTANCE', 'SECTION', 'GROUP', 'TEXT']);
+const COVER_NAME = '표지';
+const COVER_SEARCH_DEPTH = 5;
+
+interface ParseContext {
+  page: string;
+  section?: string;
+  date?: string;
+}
+
 /**
- * Searches for a cover node ("표지") associated with a screen's prefix section
- * E.g., AGRE_0001 → finds 표지 that contains AGRE_XXXX screen IDs
+ * A "표지" FRAME with the screen IDs it references (up to COVER_SEARCH_DEPTH levels deep)
  */
-const findCoverForScreen = (document: FigmaNode, screenName: string): CoverData | undefined => {
-  // Extract prefix from screen name (e.g., AGRE_0001 → AGRE)
-  const prefix = screenName.split('_')[0];
+interface CoverCandidate {
+  node: FigmaNode;
+  screenIdPrefixes: Set<string>; // from node names, e.g. AGRE_0001 → AGRE
+  texts: string[];               // trimmed TEXT contents, e.g. "AUTO_0004 / LINK_0001"
+  unit?: ParseUnit;
+}
 
-  // Search for a FRAME named "표지" that contains screen IDs with matching prefix
-  const searchForCover = (node: any): FigmaNode | undefined => {
-    if ((node.name || '').trim() === '표지' && node.type === 'FRAME') {
-      // Check if this cover contains any screen ID with matching prefix
-      // Method 1: Check node names (e.g., AGRE_0001 as child node)
-      const hasMatchingScreenIdNode = (n: any, depth = 0): boolean => {
-        if (depth > 5) return false;
+/**
+ * A node whose name matches the screen ID pattern, recorded during the walk
+ */
+interface ScreenMatch {
+  node: FigmaNode;
+  name: string;
+  baseId: string;
+  suffix?: string;
+  grandparent?: FigmaNode;
+  unitDepth: number; // 0 = the unit node itself
+  context: ParseContext;
+}
 
-        const nodeName = (n.name || '').trim();
-        const match = /^([A-Z]+)_[0-9]+(_(.+))?$/.exec(nodeName);
+/**
+ * A top-level child of a page (usually a SECTION) — the granularity at which
+ * a re-parse reuses the previous version's screens
+ */
+interface ParseUnit {
+  node: FigmaNode;
+  hash: string;
+  indexed: boolean;       // screens and text ranges collected
+  matches: ScreenMatch[]; // screen nodes in pre-order
+  // Walk arguments at the unit node, to index it later
+  parentName: string;
+  context: ParseContext;
+  parent?: FigmaNode;
+  grandparent?: FigmaNode;
+}
 
-        if (match && match[1] === prefix) {
-          console.log(`✅ Found cover for prefix "${prefix}": screen ID node "${nodeName}"`);
-          return true;
-        }
+/**
+ * Indexes built by a single walk over the document tree.
+ * Container, description, screenInformation and cover extraction are lookups against these
+ * instead of repeated full-document searches per screen.
+ */
+interface FigmaTreeIndex {
+  framesByName: Map<string, FigmaNode>;          // first FRAME (pre-order) for each name
+  frameUnits: Map<FigmaNode, ParseUnit>;         // indexed FRAME → enclosing unit
+  covers: CoverCandidate[];                      // "표지" frames in pre-order
+  textNodes: TextNodeInfo[];                     // TEXT nodes of indexed units
+  textRanges: Map<FigmaNode, [number, number]>;  // node → [start, end) slice of textNodes
+  units: ParseUnit[];                            // in pre-order
+  textCache: Map<FigmaNode, TextNodeInfo[]>;
+  coverByPrefix: Map<string, CoverCandidate | undefined>;
+  coverData: Map<FigmaNode, CoverData | undefined>;
+  indexUnit: (unit: ParseUnit) => void;          // collects screens and text ranges for a unit the first walk only hashed
+}
 
-        if (n.children) {
-          return n.children.some((child: any) => hasMatchingScreenIdNode(child, depth + 1));
-        }
+const indexCover = (node: FigmaNode, unit?: ParseUnit): CoverCandidate => {
+  const screenIdPrefixes = new Set<string>();
+  const texts: string[] = [];
 
-        return false;
-      };
+  const visit = (n: FigmaNode, depth: number) => {
+    if (depth > COVER_SEARCH_DEPTH) return;
 
-      // Method 2: Check TEXT content (e.g., "AUTO_0004 / LINK_0001" in text)
-      const hasMatchingTextContent = (n: any, depth = 0): boolean => {
-        if (depth > 5) return false;
-
-        if (n.type === 'TEXT' && n.characters) {
-          const text = n.characters.trim();
-          const regex = new RegExp(`${prefix}_[0-9]+`, 'i');
-          if (regex.test(text)) {
-            console.log(`✅ Found cover for prefix "${prefix}": in text content "${text.substring(0, 50)}"`);
-            return true;
-          }
-        }
+    const match = COVER_SCREEN_ID_REGEX.exec((n.name || '').trim());
+    if (match) screenIdPrefixes.add(match[1]);
 
-        if (n.children) {
-          return n.children.some((child: any) => hasMatchingTextContent(child, depth + 1));
-        }
+    if (n.type === 'TEXT' && n.characters) {
+      texts.push(n.characters.trim());
+    }
 
-        return false;
-      };
+    if (n.children) {
+      for (const child of n.children) visit(child, depth + 1);
+    }
+  };
+
+  visit(node, 0);
+  return { node, screenIdPrefixes, texts, unit };
+};
+
+/**
+ * Walks the document once, collecting every index the parser needs, and hashes each unit on the way.
+ * Units the previous snapshot knows about are only hashed and scanned for frames and covers;
+ * index.indexUnit fills in the rest for the ones that turn out to have changed.
+ * Screen matching stops descending at a matched node (same as before), but indexing
+ * continues through the whole tree so containers and covers can be found anywhere.
+ */
+const buildTreeIndex = (root: FigmaNode, rootContext: ParseContext, previous?: FigmaParseSnapshot): FigmaTreeIndex => {
+  const index: FigmaTreeIndex = {
+    framesByName: new Map(),
+    frameUnits: new Map(),
+    covers: [],
+    textNodes: [],
+    textRanges: new Map(),
+    units: [],
+    textCache: new Map(),
+    coverByPrefix: new Map(),
+    coverData: new Map(),
+    indexUnit: (unit) => {
+      unit.indexed = true;
+      walk(unit.node, unit.parentName, unit.context, unit.parent, unit.grandparent, false, unit, 0, false);
+    },
+  };
+
+  let hasher: Hasher | undefined;
+
+  const walk = (
+    node: FigmaNode,
+    parentName: string,
+    context: ParseContext,
+    parent: FigmaNode | undefined,
+    grandparent: FigmaNode | undefined,
+    insideScreen: boolean,
+    unit: ParseUnit | undefined,
+    unitDepth: number,
+    scan: boolean // first pass: hash, frames and covers
+  ) => {
+    const textStart = index.textNodes.length;
+    // Text ranges only cover indexed units; nodes above them fall back to collectAllTextNodes
+    const indexing = !!unit && unit.indexed;
+
+    if (scan && unit) {
+      hasher!.update(`${node.id}\u0001${node.type}\u0001${node.name}\u0001${node.characters ?? ''}\u0001${node.children?.length ?? -1}\u0002`);
+    }
+
+    if (indexing && node.type === 'TEXT' && node.characters) {
+      index.textNodes.push({
+        name: node.name,
+        characters: node.characters,
+        type: node.type,
+        parentName,
+      });
+    }
+
+    if (scan && node.type === 'FRAME') {
+      if (!index.framesByName.has(node.name)) {
+        index.framesByName.set(node.name, node);
+        if (unit) index.frameUnits.set(node, unit);
+      }
+      if ((node.name || '').trim() === COVER_NAME) {
+        index.covers.push(indexCover(node, unit));
+        // Cover extraction also reads fills, bounds and text styles
+        hasher?.update(JSON.stringify(node));
+      }
+    }
+
+    let nextContext = context;
+    let childrenInsideScreen = insideScreen;
+
+    if (!insideScreen && (indexing || !unit)) {
+      const nodeName = (node.name || '').trim();
+      nextContext = { ...context };
+
+      // Try to find a date in the current container's name
+      const foundDate = extractDate(nodeName);
+      if (foundDate) nextContext.date = foundDate;
+
+      const match = nodeName.match(SCREEN_NAME_REGEX);
+
+      if (node.type === 'CANVAS') {
+        nextContext.page = nodeName;
+      } else if (node.type === 'SECTION') {
+        if (!match) nextContext.section = nodeName;
+      }
 
-      if (hasMatchingScreenIdNode(node) || hasMatchingTextContent(node)) {
-        return node;
+      if (match && MATCHABLE_TYPES.has(node.type) && indexing) {
+        unit!.matches.push({
+          node,
+          name: nodeName,
+          baseId: match[1],
+          suffix: match[3],
+          grandparent,
+          unitDepth,
+          context: nextContext,
+        });
+        childrenInsideScreen = true;
       }
     }
 
     if (node.children) {
+      // Children of the root, DOCUMENT and CANVAS nodes are units
+      const holdsUnits = !unit && (node === root || node.type === 'DOCUMENT' || node.type === 'CANVAS');
       for (const child of node.children) {
-        const found = searchForCover(child);
-        if (found) return found;
+        if (holdsUnits && child.type !== 'CANVAS') {
+          walkUnit(child, node.name, nextContext, node, parent);
+        } else {
+          walk(child, node.name, nextContext, node, parent, childrenInsideScreen, unit, unitDepth + 1, scan);
+        }
       }
     }
 
-    return undefined;
+    if (indexing) index.textRanges.set(node, [textStart, index.textNodes.length]);
   };
 
-  const coverNode = searchForCover(document);
-  return coverNode ? extractCoverData(coverNode) : undefined;
+  const walkUnit = (
+    node: FigmaNode,
+    parentName: string,
+    context: ParseContext,
+    parent?: FigmaNode,
+    grandparent?: FigmaNode
+  ) => {
+    const unit: ParseUnit = {
+      node,
+      hash: '',
+      // Units the previous version didn't keep have to be parsed anyway, so index them right away
+      indexed: !previous?.units?.[node.id],
+      matches: [],
+      parentName,
+      context,
+      parent,
+      grandparent,
+    };
+    index.units.push(unit);
+
+    hasher = createHasher();
+    hasher.update(`${context.page}\u0001${context.section ?? ''}\u0001${context.date ?? ''}\u0002`);
+    walk(node, parentName, context, parent, grandparent, false, unit, 0, true);
+    unit.hash = hasher.digest();
+    hasher = undefined;
+  };
+
+  // A root that is itself a screen is the only unit
+  const rootName = (root.name || '').trim();
+  if (SCREEN_NAME_REGEX.test(rootName) && MATCHABLE_TYPES.has(root.type)) {
+    walkUnit(root, '', rootContext);
+  } else {
+    walk(root, '', rootContext, undefined, undefined, false, undefined, 0, true);
+  }
+  return index;
+};
+
+/**
+ * Returns the TEXT nodes under a node (same result as collectAllTextNodes), sliced from the index
+ */
+const getTextNodes = (index: FigmaTreeIndex, node: FigmaNode): TextNodeInfo[] => {
+  const cached = index.textCache.get(node);
+  if (cached) return cached;
+
+  const range = index.textRanges.get(node);
+  let texts: TextNodeInfo[];
+  if (range) {
+    texts = index.textNodes.slice(range[0], range[1]);
+    // collectAllTextNodes starts with an empty parentName for the node itself
+    if (node.type === 'TEXT' && node.characters) {
+      texts[0] = { ...texts[0], parentName: '' };
+    }
+  } else {
+    texts = collectAllTextNodes(node);
+  }
+
+  index.textCache.set(node, texts);
+  return texts;
+};
+
+/**
+ * Parse results carried from one version of a file to the next: each unit's screens,
+ * reused as they are when the unit's content hash is unchanged.
+ * Units whose screens read text from outside the unit are not kept.
+ */
+export interface FigmaParseSnapshot {
+  units: Record<string, {        // unit node id →
+    hash: string;
+    screens: UnitScreen[];
+  }>;
+}
+
+interface UnitScreen {
+  screen: ScreenData;
+  containerFrameId?: string; // screen FRAME the text came from (framesByName lookup)
+  coverId?: string;          // 표지 frame the cover data came from
+}
+
+/**
+ * Looks up the cover node ("표지") associated with a screen's prefix section
+ * E.g., AGRE_0001 → finds 표지 that contains AGRE_XXXX screen IDs
+ * Resolved once per prefix; every screen with the same prefix shares the result.
+ */
+const findCoverForScreen = (index: FigmaTreeIndex, screenName: string): CoverCandidate | undefined => {
+  // Extract prefix from screen name (e.g., AGRE_0001 → AGRE)
+  const prefix = screenName.split('_')[0];
+  if (index.coverByPrefix.has(prefix)) return index.coverByPrefix.get(prefix);
+
+  const textRegex = new RegExp(`${prefix}_[0-9]+`, 'i');
+  let found: CoverCandidate | undefined;
+
+  for (const cover of index.covers) {
+    // Method 1: Check node names (e.g., AGRE_0001 as child node)
+    if (cover.screenIdPrefixes.has(prefix)) {
+      if (figmaDebug.log) console.log(`✅ Found cover for prefix "${prefix}": screen ID node`);
+      found = cover;
+      break;
+    }
+
+    // Method 2: Check TEXT content (e.g., "AUTO_0004 / LINK_0001" in text)
+    const text = cover.texts.find(t => textRegex.test(t));
+    if (text !== undefined) {
+      if (figmaDebug.log) console.log(`✅ Found cover for prefix "${prefix}": in text content "${text.substring(0, 50)}"`);
+      found = cover;
+      break;
+    }
+  }
+
+  index.coverByPrefix.set(prefix, found);
+  return found;
+};
+
+/**
+ * Cover data of a 표지 frame, extracted once and shared by every screen that uses it
+ */
+const getCoverData = (index: FigmaTreeIndex, cover: CoverCandidate | undefined): CoverData | undefined => {
+  if (!cover) return undefined;
+  if (!index.coverData.has(cover.node)) index.coverData.set(cover.node, extractCoverData(cover.node));
+  return index.coverData.get(cover.node);
 };
 
 /**
@@ -431,188 +687,312 @@ const findPrefixParentScreen = (documentRoot: FigmaNode, prefix: string): FigmaN
  * Find the FRAME with exact screen name (e.g., AUTO_0004_1) and return its container
  * Each screen ID has its own independent container
  */
-const getScreenContainer = (documentRoot: FigmaNode, screenName: string): FigmaNode | null => {
-  console.log(`🔍 [getScreenContainer] Looking for screen "${screenName}"`);
-
-  // Recursively find the FRAME with exact matching name
-  const findScreenFrame = (node: FigmaNode): FigmaNode | null => {
-    if (node.type === 'FRAME' && node.name === screenName) {
-      console.log(`✅ [getScreenContainer] Found exact screen FRAME: "${node.name}"`);
-      return node;
-    }
-
-    if (node.children) {
-      for (const child of node.children) {
-        const found = findScreenFrame(child);
-        if (found) return found;
-      }
-    }
-
-    return null;
-  };
-
-  const screenFrame = findScreenFrame(documentRoot);
+const getScreenContainer = (index: FigmaTreeIndex, screenName: string): FigmaNode | null => {
+  const screenFrame = index.framesByName.get(screenName);
 
   if (screenFrame) {
     // The screen FRAME itself is the container (contains full_list nodes)
-    console.log(`✅ [getScreenContainer] Using screen FRAME as container: "${screenFrame.name}"`);
+    if (figmaDebug.log) console.log(`✅ [getScreenContainer] Using screen FRAME as container: "${screenFrame.name}"`);
     return screenFrame;
   }
 
-  console.log(`⚠️ [getScreenContainer] Screen "${screenName}" not found`);
+  if (figmaDebug.log) console.log(`⚠️ [getScreenContainer] Screen "${screenName}" not found`);
   return null;
 };
 
-const parseFrames = (
-  node: FigmaNode,
-  screens: ScreenData[],
-  context: { page: string; section?: string; date?: string } = { page: 'Default' },
-  documentRoot?: FigmaNode,
-  ancestors: FigmaNode[] = []
-) => {
-  // Updated REGEX to allow Korean characters and special characters in suffix
-  // Examples: AUTO_0004_5, AUTO_0004_ㅅ, AUTO_0004_가
-  const REGEX = /^([A-Z]+_[0-9]+)(_(.+))?$/;
-  const nodeName = (node.name || '').trim();
-  const nextContext = { ...context };
-
-  // Try to find a date in the current container's name
-  const foundDate = extractDate(nodeName);
-  if (foundDate) nextContext.date = foundDate;
-
-
-  if (node.type === 'CANVAS') {
-    nextContext.page = nodeName;
-  } else if (node.type === 'SECTION') {
-    if (!nodeName.match(REGEX)) nextContext.section = nodeName;
-  }
-
-  const match = nodeName.match(REGEX);
-  const isMatchableType = ['FRAME', 'COMPONENT', 'INSTANCE', 'SECTION', 'GROUP', 'TEXT'].includes(node.type);
+/**
+ * Extracts the screens of one indexed unit
+ * Returns whether every screen's text came from inside the unit, i.e. whether the
+ * unit's hash alone decides if the result can be reused
+ */
+const extractUnitScreens = (index: FigmaTreeIndex, unit: ParseUnit, entries: UnitScreen[]): boolean => {
+  let selfContained = true;
 
-  if (isMatchableType && match) {
-    const baseId = match[1];
-    const suffix = match[3];
+  for (const match of unit.matches) {
+    const { node, name: nodeName, baseId, suffix, grandparent, unitDepth, context: nextContext } = match;
 
     // Get container for this specific screen ID
     // Each screen ID has its own independent container
     let containerNode = node; // fallback to the node itself
-    const container = getScreenContainer(documentRoot!, nodeName);
+    const container = getScreenContainer(index, nodeName);
     if (container) {
       containerNode = container;
-      console.log(`[${nodeName}] Using screen-specific container: ${container.type} - "${container.name}"`);
-    } else {
+      if (index.frameUnits.get(container) !== unit) selfContained = false;
+      if (figmaDebug.log) console.log(`[${nodeName}] Using screen-specific container: ${container.type} - "${container.name}"`);
+    } else if (grandparent) {
       // Fallback to own grandparent
-      if (ancestors.length >= 2) {
-        containerNode = ancestors[ancestors.length - 2];
-        console.log(`[${nodeName}] ⚠️ No prefix parent found, using own grandparent: ${containerNode.type} - "${containerNode.name}"`);
+      containerNode = grandparent;
+      if (unitDepth < 2) selfContained = false;
+      if (figmaDebug.log) console.log(`[${nodeName}] ⚠️ No prefix parent found, using own grandparent: ${containerNode.type} - "${containerNode.name}"`);
+    } else if (figmaDebug.log) {
+      console.log(`[${nodeName}] ⚠️ No container found, using node itself`);
+    }
+
+    const textNodes = getTextNodes(index, containerNode);
+    if (figmaDebug.log) console.log(`[${nodeName}] Found ${textNodes.length} text nodes in container (type: ${containerNode.type}, name: ${containerNode.name})`);
+
+    const description = findDescriptionText(textNodes);
+    const screenInfo = findScreenInformation(textNodes);
+
+    if (figmaDebug.log) {
+      if (description) {
+        console.log(`[${nodeName}] Description: ${description.substring(0, 100)}...`);
       } else {
-        console.log(`[${nodeName}] ⚠️ No container found, using node itself`);
+        console.log(`[${nodeName}] ⚠️ No description found`);
       }
+
+      if (screenInfo) {
+        console.log(`[${nodeName}] Screen Info: ${screenInfo}`);
+      } else {
+        console.log(`[${nodeName}] ℹ️ Screen Info: empty or "-"`);
+      }
+    }
+
+    // Try to find cover data for this screen
+    const cover = findCoverForScreen(index, nodeName);
+    const coverData = getCoverData(index, cover);
+    if (coverData && figmaDebug.log) {
+      console.log(`[${nodeName}] ✅ Found cover with ${coverData.textNodes.length} text nodes`);
     }
 
-    // Collect text nodes for debugging
-    const textNodes = collectAllTextNodes(containerNode);
-    console.log(`[${nodeName}] Found ${textNodes.length} text nodes in container (type: ${containerNode.type}, name: ${containerNode.name})`);
+    entries.push({
+      screen: {
+        id: node.id,
+        figmaId: node.id,
+        name: nodeName,
+        description,
+        screenInformation: screenInfo,
+        baseId: baseId,
+        suffix: suffix,
+        isParent: !suffix,
+        pageName: nextContext.page,
+        sectionName: nextContext.section,
+        createdDate: nextContext.date,
+        coverData
+      },
+      containerFrameId: container?.id,
+      coverId: cover?.node.id,
+    });
+  }
 
-    // Pass suffix to findDescriptionText for matching numbered descriptions
-    const description = findDescriptionText(containerNode, suffix);
-    const screenInfo = findScreenInformation(containerNode);
+  return selfContained;
+};
 
-    if (description) {
-      console.log(`[${nodeName}] Description: ${description.substring(0, 100)}...`);
-    } else {
-      console.log(`[${nodeName}] ⚠️ No description found`);
+/**
+ * The previous version's screens for an unchanged unit, or undefined when the unit has to be re-extracted
+ * Same unit hash means the same screens and texts; container and cover lookups span the whole
+ * document, so they are re-checked, and cover data is re-extracted if its 표지 changed
+ */
+const reuseUnitScreens = (
+  index: FigmaTreeIndex,
+  unit: ParseUnit,
+  previous: FigmaParseSnapshot | undefined
+): UnitScreen[] | undefined => {
+  const cached = previous?.units?.[unit.node.id];
+  if (!cached || cached.hash !== unit.hash) return undefined;
+  if (cached.screens.some(entry => index.framesByName.get(entry.screen.name)?.id !== entry.containerFrameId)) {
+    return undefined;
+  }
+
+  return cached.screens.map(entry => {
+    const cover = findCoverForScreen(index, entry.screen.name);
+    const coverUnchanged = cover?.node.id === entry.coverId &&
+      (!cover || (!!cover.unit && previous?.units?.[cover.unit.node.id]?.hash === cover.unit.hash));
+    if (coverUnchanged) {
+      // Later screens of the prefix share the same object
+      if (cover && !index.coverData.has(cover.node)) index.coverData.set(cover.node, entry.screen.coverData);
+      if (!cover || index.coverData.get(cover.node) === entry.screen.coverData) return entry;
     }
+    return {
+      ...entry,
+      screen: { ...entry.screen, coverData: getCoverData(index, cover) },
+      coverId: cover?.node.id,
+    };
+  });
+};
 
-    if (screenInfo) {
-      console.log(`[${nodeName}] Screen Info: ${screenInfo}`);
+const parseFrames = (
+  root: FigmaNode,
+  screens: ScreenData[],
+  context: ParseContext = { page: 'Default' },
+  onScreen?: (screen: ScreenData) => void,
+  incremental?: { previous?: FigmaParseSnapshot; next: FigmaParseSnapshot }
+) => {
+  // Snapshots written by older builds have no `units` and are ignored
+  const previous = incremental?.previous;
+  const index = measurePhase('index', () => buildTreeIndex(root, context, previous));
+  let reusedCount = 0;
+  let screenCount = 0;
+
+  const endExtract = startPhase('extract');
+  for (const unit of index.units) {
+    let entries = reuseUnitScreens(index, unit, previous);
+    let reusable = true;
+    if (entries) {
+      reusedCount += entries.length;
     } else {
-      console.log(`[${nodeName}] ℹ️ Screen Info: empty or "-"`);
+      if (!unit.indexed) measurePhase('reindex', () => index.indexUnit(unit));
+      entries = [];
+      reusable = extractUnitScreens(index, unit, entries);
     }
 
-    // Try to find cover data for this screen
-    let coverData: CoverData | undefined;
-    if (documentRoot) {
-      coverData = findCoverForScreen(documentRoot, nodeName);
-      if (coverData) {
-        console.log(`[${nodeName}] ✅ Found cover with ${coverData.textNodes.length} text nodes`);
-      }
+    if (incremental && reusable) {
+      incremental.next.units[unit.node.id] = { hash: unit.hash, screens: entries };
     }
 
-    screens.push({
-      id: node.id,
-      figmaId: node.id,
-      name: nodeName,
-      description,
-      screenInformation: screenInfo,
-      baseId: baseId,
-      suffix: suffix,
-      isParent: !suffix,
-      pageName: nextContext.page,
-      sectionName: nextContext.section,
-      createdDate: nextContext.date,
-      coverData
-    });
-    return;
+    for (const { screen } of entries) {
+      screens.push(screen);
+      onScreen?.(screen);
+    }
+    screenCount += entries.length;
   }
+  endExtract();
 
-  if (node.children && Array.isArray(node.children)) {
-    const nextAncestors = [...ancestors, node];
-    node.children.forEach(child => parseFrames(child, screens, nextContext, documentRoot, nextAncestors));
+  if (previous && figmaDebug.log) {
+    console.log(`♻️ Reused ${reusedCount}/${screenCount} screens from unchanged sections`);
   }
 };
 
-export const fetchFigmaFile = async (auth: FigmaAuth): Promise<Record<string, Record<string, PrefixGroup>>> => {
-  // Use test.json as dummy data instead of Figma API
-  console.log('📦 Using test.json as dummy data');
-  const response = await fetch('/test.json');
-  if (!response.ok) {
-    throw new Error(`Failed to load test.json: ${response.statusText}`);
+/**
+ * Progress reported while a file is loaded and parsed
+ * `pages` maps each page found so far to the prefixes found on it
+ */
+export interface FigmaParseProgress {
+  phase: 'fetching' | 'parsing' | 'grouping';
+  pages: Record<string, string[]>;
+  screenCount: number;
+}
+
+export type FigmaParseProgressHandler = (progress: FigmaParseProgress) => void;
+
+/**
+ * Downloads the raw Figma file JSON
+ */
+// Set NEXT_PUBLIC_FIGMA_SOURCE=test-json to load public/test.json instead of calling the API
+const USE_TEST_JSON = process.env.NEXT_PUBLIC_FIGMA_SOURCE === 'test-json';
+
+/**
+ * Loads the raw file JSON for `auth`
+ * When the file is still at `knownVersion`, only the version probe is made and `data` is undefined
+ */
+export const fetchFigmaFileData = async (auth: FigmaAuth, knownVersion?: string): Promise<FigmaFileResult> => {
+  if (USE_TEST_JSON) {
+    console.log('📦 Using test.json as dummy data');
+    // HEAD first: the ETag stands in for the file version, so a cached parse skips the download
+    const head = await fetch('/test.json', { method: 'HEAD' });
+    const tag = head.ok ? head.headers.get('ETag') || head.headers.get('Last-Modified') : null;
+    const probedVersion = tag ? `test-json:${tag}` : undefined;
+    if (knownVersion && probedVersion === knownVersion) return { version: probedVersion };
+
+    const response = await fetch('/test.json');
+    if (!response.ok) {
+      throw new Error(`Failed to load test.json: ${response.statusText}`);
+    }
+    const data = await response.json();
+    const version: string = probedVersion || data.version || '';
+    return { version, lastModified: data.lastModified, data: knownVersion && version === knownVersion ? undefined : data };
   }
-  const data = await response.json();
+
+  const { fileKey, nodeId } = extractFigmaInfo(auth.fileKey);
+  const client = createFigmaClient(auth.personalAccessToken);
+  return fetchFigmaFileTree(client, fileKey, nodeId, knownVersion);
+};
+
+/**
+ * Sets each screen's thumbnailUrl from the Images API (no-op for test.json)
+ */
+export const resolveThumbnails = async (
+  auth: FigmaAuth,
+  pages: Record<string, Record<string, PrefixGroup>>,
+  version?: string
+): Promise<void> => {
+  if (USE_TEST_JSON) return;
+  const { fileKey } = extractFigmaInfo(auth.fileKey);
+  await resolveScreenThumbnails(createFigmaClient(auth.personalAccessToken), fileKey, pages, version);
+};
+
+/**
+ * Parses raw Figma file JSON into prefix groups per page
+ * Pure and synchronous, so it can run on the main thread or inside a worker
+ * With `incremental`, screens of sections unchanged since `previous` are reused
+ * instead of extracted again, and `next` is filled in for the following version
+ */
+export const parseFigmaFile = (
+  data: any,
+  onProgress?: FigmaParseProgressHandler,
+  incremental?: { previous?: FigmaParseSnapshot; next: FigmaParseSnapshot }
+): Record<string, Record<string, PrefixGroup>> =>
+  // The phase also ends when no screens are found
+  measurePhase('parse', () => parseFile(data, onProgress, incremental));
+
+const parseFile = (
+  data: any,
+  onProgress: FigmaParseProgressHandler | undefined,
+  incremental: { previous?: FigmaParseSnapshot; next: FigmaParseSnapshot } | undefined
+): Record<string, Record<string, PrefixGroup>> => {
   const rawScreens: ScreenData[] = [];
 
-  // test.json has nodes structure with nodeId "34:2749"
-  const testNodeId = '34:2749';
-  if (data.nodes && data.nodes[testNodeId]) {
-    const nodeEntry = data.nodes[testNodeId];
-    if (nodeEntry && nodeEntry.document) {
+  // Report only when a new page or prefix shows up, so progress stays cheap
+  const foundPages: Record<string, string[]> = {};
+  const report = (phase: FigmaParseProgress['phase']) => {
+    const pages: Record<string, string[]> = {};
+    Object.entries(foundPages).forEach(([pageName, prefixes]) => {
+      pages[pageName] = [...prefixes];
+    });
+    onProgress?.({ phase, pages, screenCount: rawScreens.length });
+  };
+  const reportScreen = (screen: ScreenData) => {
+    const prefix = screen.baseId.split('_')[0];
+    const prefixes = foundPages[screen.pageName] || (foundPages[screen.pageName] = []);
+    if (prefixes.includes(prefix)) return;
+    prefixes.push(prefix);
+    report('parsing');
+  };
+  if (onProgress) report('parsing');
+
+  if (data.nodes) {
+    // /nodes response (test.json or a node-id URL): each requested node is parsed as its own page
+    Object.entries(data.nodes).forEach(([nodeId, nodeEntry]: [string, any]) => {
+      if (!nodeEntry?.document) {
+        console.warn(`⚠️ Node ${nodeId} not found in file`);
+        return;
+      }
       parseFrames(
         nodeEntry.document,
         rawScreens,
         { page: nodeEntry.document.name || 'Synced Node', date: extractDate(nodeEntry.document.name || '') },
-        nodeEntry.document, // Pass document root for container search
-        [] // Start with empty ancestors array
+        onProgress ? reportScreen : undefined,
+        incremental
       );
-    } else {
-      throw new Error(`Node ${testNodeId} not found in test.json.`);
-    }
+    });
+  } else if (data.document) {
+    // Whole-file response: CANVAS nodes set the page name as the tree is walked
+    parseFrames(
+      data.document,
+      rawScreens,
+      { page: data.name || 'Default' },
+      onProgress ? reportScreen : undefined,
+      incremental
+    );
   }
 
   if (rawScreens.length === 0) throw new Error("No screens found matching pattern (e.g., AUTO_0001).");
 
-  console.log('✅ Parsed screens from test.json:', rawScreens.length);
+  if (figmaDebug.log) console.log('✅ Parsed screens:', rawScreens.length);
 
-  // Extract file-level thumbnailUrl and propagate to all screens
-  const fileThumbnailUrl = data.thumbnailUrl as string | undefined;
-  if (fileThumbnailUrl) {
-    console.log('🖼️ Found file-level thumbnailUrl, propagating to all screens');
-    rawScreens.forEach(screen => {
-      if (!screen.thumbnailUrl) {
-        screen.thumbnailUrl = fileThumbnailUrl;
-      }
+  // Debug: Check first few screens
+  if (figmaDebug.log) {
+    console.log('🔍 First 5 screens:');
+    rawScreens.slice(0, 5).forEach(s => {
+      console.log(`  - name: "${s.name}", baseId: "${s.baseId}", suffix: "${s.suffix || 'none'}"`);
     });
   }
 
-  // Debug: Check first few screens
-  console.log('🔍 First 5 screens:');
-  rawScreens.slice(0, 5).forEach(s => {
-    console.log(`  - name: "${s.name}", baseId: "${s.baseId}", suffix: "${s.suffix || 'none'}", hasThumb: ${!!s.thumbnailUrl}`);
-  });
+  // Thumbnails are rendered per screen by resolveThumbnails after parsing,
+  // so parsing stays free of network calls
 
-  // Skip image API call when using test.json
-  // Thumbnails will use coverData instead
+  if (onProgress) report('grouping');
+  const endGroup = startPhase('group');
 
   // Group by PREFIX (AUTO, PSET, LINK, etc.)
   // Each prefix becomes a separate card
@@ -664,7 +1044,15 @@ export const fetchFigmaFile = async (auth: FigmaAuth): Promise<Record<string, Re
     });
   });
 
-  console.log('📦 Prefix groups:', prefixGroups);
+  if (figmaDebug.log) console.log('📦 Prefix groups:', prefixGroups);
 
+  endGroup();
   return prefixGroups;
 };
+
+export const fetchFigmaFile = async (auth: FigmaAuth): Promise<Record<string, Record<string, PrefixGroup>>> => {
+  const { version, data } = await fetchFigmaFileData(auth);
+  const pages = parseFigmaFile(data);
+  await resolveThumbnails(auth, pages, version);
+  return pages;
+};
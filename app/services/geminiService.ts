@@ -1,34 +1,263 @@
-import { GoogleGenAI, Type } from "@google/genai";
+import type { GoogleGenAI } from "@google/genai";
+import { openDatabase, requestToPromise, transactionDone } from "../utils/indexedDb";
+import { hashString } from "../utils/hash";
 
-export const refineSpecifications = async (rawText: string): Promise<string[]> => {
-  if (!rawText || rawText.trim().length < 5) return [];
+const MODEL = "gemini-3-flash-preview";
+// Bump when the prompt or response format changes, so older cached results are not reused
+const PROMPT_VERSION = 1;
+
+const MAX_BATCH_SIZE = 8; // descriptions per prompt
+const MAX_BATCH_CHARS = 12000; // keeps one prompt within a comfortable input size
+const MAX_CONCURRENT_BATCHES = 2;
+const BATCH_DELAY_MS = 20; // lets callers in the same tick share a batch
+
+const DB_NAME = "eureka-gemini-cache";
+const DB_VERSION = 1;
+const RESULTS_STORE = "refinements";
+
+/**
+ * Turns a batch of raw specification texts into checklist items
+ * Entries left undefined fall back to the raw lines and are not cached
+ */
+export interface RefinementBackend {
+  name: string;
+  refineBatch: (texts: string[]) => Promise<(string[] | undefined)[]>;
+}
+
+interface CachedRefinement {
+  key: string;
+  items: string[];
+  cachedAt: string;
+}
+
+interface QueuedRefinement {
+  key: string;
+  text: string;
+  backend: RefinementBackend;
+  resolve: (items: string[]) => void;
+}
+
+const splitLines = (text: string): string[] =>
+  text.split('\n').filter(line => line.trim().length > 0);
 
-  const ai = new GoogleGenAI({ apiKey: process.env.NEXT_PUBLIC_GEMINI_API_KEY || '' });
-  const prompt = `Convert the following raw design specification into a clean, concise list of QA test cases or checklist items in Korean.
+// ============================================
+// Backends
+// ============================================
+
+// The SDK is loaded on first use, so the stub backend and pages that never refine don't pull it in
+const loadGeminiSdk = () => import("@google/genai");
+
+// One client for the whole session
+let geminiClient: GoogleGenAI | null = null;
+const getGeminiClient = async (): Promise<GoogleGenAI> => {
+  if (!geminiClient) {
+    const { GoogleGenAI } = await loadGeminiSdk();
+    geminiClient = new GoogleGenAI({ apiKey: process.env.NEXT_PUBLIC_GEMINI_API_KEY || '' });
+  }
+  return geminiClient;
+};
+
+const buildBatchPrompt = (texts: string[]): string =>
+  `Convert each of the following raw design specifications into a clean, concise list of QA test cases or checklist items in Korean.
   Ensure the tone is professional and actionable for a QA engineer.
-  Raw Text: "${rawText}"`;
+  Return one entry per specification, with "index" set to the specification's number.
+${texts.map((text, i) => `[${i}] Raw Text: "${text}"`).join('\n')}`;
 
-  try {
-    const response = await ai.models.generateContent({
-      model: "gemini-3-flash-preview",
-      contents: prompt,
+/**
+ * Maps a batched response back onto the request order; missing or malformed entries stay undefined
+ */
+export const splitBatchResponse = (parsed: unknown, count: number): (string[] | undefined)[] => {
+  const results: (string[] | undefined)[] = new Array(count).fill(undefined);
+  if (!Array.isArray(parsed)) return results;
+
+  parsed.forEach((entry) => {
+    const index = entry?.index;
+    const items = entry?.items;
+    if (!Number.isInteger(index) || index < 0 || index >= count) return;
+    if (!Array.isArray(items) || !items.every(item => typeof item === 'string')) return;
+    results[index] = items;
+  });
+  return results;
+};
+
+export const geminiBackend: RefinementBackend = {
+  name: `gemini:${MODEL}`,
+  refineBatch: async (texts) => {
+    const [{ Type }, client] = await Promise.all([loadGeminiSdk(), getGeminiClient()]);
+    const response = await client.models.generateContent({
+      model: MODEL,
+      contents: buildBatchPrompt(texts),
       config: {
         responseMimeType: "application/json",
         responseSchema: {
           type: Type.ARRAY,
-          items: { type: Type.STRING },
-          description: "A list of checklist items in Korean."
+          items: {
+            type: Type.OBJECT,
+            properties: {
+              index: { type: Type.INTEGER },
+              items: {
+                type: Type.ARRAY,
+                items: { type: Type.STRING },
+                description: "A list of checklist items in Korean."
+              }
+            },
+            required: ["index", "items"]
+          }
         }
       }
     });
 
-    const text = response.text;
-    if (text) {
-      return JSON.parse(text);
+    return splitBatchResponse(response.text ? JSON.parse(response.text) : [], texts.length);
+  }
+};
+
+/**
+ * Offline backend for local development and tests: no network, returns the non-empty lines
+ */
+export const stubBackend: RefinementBackend = {
+  name: "stub",
+  refineBatch: async (texts) => texts.map(splitLines)
+};
+
+let activeBackend: RefinementBackend =
+  process.env.NEXT_PUBLIC_GEMINI_BACKEND === "stub" ? stubBackend : geminiBackend;
+
+export const setRefinementBackend = (backend: RefinementBackend) => {
+  activeBackend = backend;
+};
+
+// ============================================
+// Result Cache (memory + IndexedDB)
+// ============================================
+const memoryCache = new Map<string, string[]>();
+
+const openResultsDb = () =>
+  openDatabase(DB_NAME, DB_VERSION, (db) => {
+    db.createObjectStore(RESULTS_STORE, { keyPath: "key" });
+  });
+
+// Content hash of the normalized text; backend and prompt version are part of the key
+const getCacheKey = (backend: RefinementBackend, text: string): string =>
+  `${backend.name}:${PROMPT_VERSION}:${hashString(text)}:${text.length}`;
+
+const getCachedRefinement = async (key: string): Promise<string[] | undefined> => {
+  const cached = memoryCache.get(key);
+  if (cached) return cached;
+
+  try {
+    const db = await openResultsDb();
+    const store = db.transaction(RESULTS_STORE, "readonly").objectStore(RESULTS_STORE);
+    const record: CachedRefinement | undefined = await requestToPromise(store.get(key));
+    if (record) {
+      memoryCache.set(key, record.items);
+      return record.items;
     }
+  } catch {
+    // No IndexedDB (SSR, tests, private mode): memory cache only
+  }
+  return undefined;
+};
+
+const putCachedRefinement = async (key: string, items: string[]) => {
+  memoryCache.set(key, items);
+  try {
+    const db = await openResultsDb();
+    const tx = db.transaction(RESULTS_STORE, "readwrite");
+    tx.objectStore(RESULTS_STORE).put({ key, items, cachedAt: new Date().toISOString() } as CachedRefinement);
+    await transactionDone(tx);
+  } catch {
+    // Persisting is best effort; the memory cache still serves this session
+  }
+};
+
+// ============================================
+// Batch Queue
+// ============================================
+const queue: QueuedRefinement[] = [];
+let activeBatches = 0;
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+
+// Next run of queued items for one backend, bounded by count and prompt size
+const takeBatch = (): QueuedRefinement[] => {
+  const batch: QueuedRefinement[] = [];
+  let chars = 0;
+  while (queue.length > 0 && batch.length < MAX_BATCH_SIZE) {
+    const next = queue[0];
+    if (batch.length > 0 && (next.backend !== batch[0].backend || chars + next.text.length > MAX_BATCH_CHARS)) break;
+    batch.push(queue.shift()!);
+    chars += next.text.length;
+  }
+  return batch;
+};
+
+const runBatch = async (batch: QueuedRefinement[]) => {
+  let results: (string[] | undefined)[] = [];
+  try {
+    results = await batch[0].backend.refineBatch(batch.map(item => item.text));
   } catch (error) {
     console.error("Gemini refinement failed", error);
   }
 
-  return rawText.split('\n').filter(line => line.trim().length > 0);
+  batch.forEach((item, i) => {
+    const items = results[i];
+    if (items) {
+      putCachedRefinement(item.key, items);
+      item.resolve(items);
+    } else {
+      item.resolve(splitLines(item.text));
+    }
+  });
+};
+
+const pumpQueue = () => {
+  while (activeBatches < MAX_CONCURRENT_BATCHES && queue.length > 0) {
+    const batch = takeBatch();
+    activeBatches++;
+    runBatch(batch).finally(() => {
+      activeBatches--;
+      pumpQueue();
+    });
+  }
+};
+
+const scheduleQueue = () => {
+  if (flushTimer !== null) return;
+  flushTimer = setTimeout(() => {
+    flushTimer = null;
+    pumpQueue();
+  }, BATCH_DELAY_MS);
+};
+
+// ============================================
+// Public API
+// ============================================
+const inFlightRefinements = new Map<string, Promise<string[]>>();
+
+/**
+ * Refines one raw specification into checklist items:
+ * - cached result for the same text → no request
+ * - same text already being refined → shares that request
+ * - otherwise queued and sent together with other pending texts in one prompt
+ */
+export const refineSpecifications = async (rawText: string): Promise<string[]> => {
+  if (!rawText || rawText.trim().length < 5) return [];
+
+  const text = rawText.trim();
+  const backend = activeBackend;
+  const key = getCacheKey(backend, text);
+
+  const inFlight = inFlightRefinements.get(key);
+  if (inFlight) return inFlight;
+
+  const request = (async () => {
+    const cached = await getCachedRefinement(key);
+    if (cached) return cached;
+    return new Promise<string[]>((resolve) => {
+      queue.push({ key, text, backend, resolve });
+      scheduleQueue();
+    });
+  })().finally(() => inFlightRefinements.delete(key));
+
+  inFlightRefinements.set(key, request);
+  return request;
 };
@@ -0,0 +1,359 @@
+import { WbsTask, TestCase } from '../types';
+import { openDatabase, requestToPromise, transactionDone } from '../utils/indexedDb';
+import { DashboardSummary, applyTestCase, applyWbsTask, computeSummary, createEmptySummary } from './dashboardSummary';
+
+/**
+ * IndexedDB store for WBS tasks and test cases
+ * - one record per item, keyed by id, so an edit writes only that item
+ * - secondary indexes for the common filters (screen, status, assignee, ...)
+ * - writes are coalesced per id and flushed asynchronously in one transaction
+ * - the dashboard summary is updated by delta in that same transaction
+ */
+
+const DB_NAME = 'eureka-data';
+const DB_VERSION = 1;
+const WBS_STORE = 'wbsTasks';
+const TC_STORE = 'testCases';
+const META_STORE = 'meta';
+const LEGACY_MIGRATION_KEY = 'legacyLocalStorageMigrated';
+const SUMMARY_KEY = 'dashboardSummary';
+const FLUSH_DELAY_MS = 100;
+const MAX_FLUSH_RETRY_DELAY_MS = 30000;
+
+export type WbsIndex = 'originScreenId' | 'status' | 'assignee';
+export type TcIndex = 'originScreenId' | 'status' | 'assignee' | 'priority' | 'relatedWbsId';
+
+const WBS_INDEXES: WbsIndex[] = ['originScreenId', 'status', 'assignee'];
+const TC_INDEXES: TcIndex[] = ['originScreenId', 'status', 'assignee', 'priority', 'relatedWbsId'];
+
+type StoreName = typeof WBS_STORE | typeof TC_STORE;
+
+// Persisted records carry a sort key so reads keep creation order
+type Stored<T> = T & { sortKey: number };
+
+let sortKeyCounter = 0;
+const nextSortKey = () => Date.now() * 1000 + (sortKeyCounter++ % 1000);
+
+const stripSortKey = <T extends { id: string }>(record: Stored<T>): T => {
+  const { sortKey, ...item } = record;
+  return item as unknown as T;
+};
+
+const openDataDb = () =>
+  openDatabase(DB_NAME, DB_VERSION, (db) => {
+    const wbsStore = db.createObjectStore(WBS_STORE, { keyPath: 'id' });
+    WBS_INDEXES.forEach(name => wbsStore.createIndex(name, name));
+
+    const tcStore = db.createObjectStore(TC_STORE, { keyPath: 'id' });
+    TC_INDEXES.forEach(name => tcStore.createIndex(name, name));
+
+    db.createObjectStore(META_STORE);
+  });
+
+// ============================================
+// One-time migration from localStorage
+// ============================================
+
+/**
+ * Moves every legacy `wbs_{screenId}` / `qa_{screenId}` array into the store,
+ * then removes the keys once the transaction has committed
+ */
+const migrateLegacyStorage = async (db: IDBDatabase): Promise<void> => {
+  const meta = db.transaction(META_STORE, 'readonly').objectStore(META_STORE);
+  if (await requestToPromise(meta.get(LEGACY_MIGRATION_KEY))) return;
+
+  const legacyKeys: string[] = [];
+  for (let i = 0; i < localStorage.length; i++) {
+    const key = localStorage.key(i);
+    if (key?.startsWith('wbs_') || key?.startsWith('qa_')) legacyKeys.push(key);
+  }
+
+  const tx = db.transaction([WBS_STORE, TC_STORE, META_STORE], 'readwrite');
+  legacyKeys.forEach(key => {
+    const isWbs = key.startsWith('wbs_');
+    const screenId = key.slice(isWbs ? 'wbs_'.length : 'qa_'.length);
+    const store = tx.objectStore(isWbs ? WBS_STORE : TC_STORE);
+    try {
+      const items: Array<WbsTask | TestCase> = JSON.parse(localStorage.getItem(key) || '[]');
+      items.forEach(item => store.put({ ...item, originScreenId: screenId, sortKey: nextSortKey() }));
+    } catch (error) {
+      console.error(`Failed to migrate ${key}:`, error);
+    }
+  });
+  tx.objectStore(META_STORE).put(true, LEGACY_MIGRATION_KEY);
+  await transactionDone(tx);
+
+  legacyKeys.forEach(key => localStorage.removeItem(key));
+  if (legacyKeys.length > 0) {
+    console.log(`📦 Migrated ${legacyKeys.length} localStorage keys to IndexedDB`);
+  }
+};
+
+let dbPromise: Promise<IDBDatabase> | null = null;
+
+const getDb = (): Promise<IDBDatabase> => {
+  if (!dbPromise) {
+    dbPromise = openDataDb().then(async (db) => {
+      await migrateLegacyStorage(db);
+      return db;
+    });
+    dbPromise.catch(() => {
+      dbPromise = null;
+    });
+  }
+  return dbPromise;
+};
+
+// ============================================
+// Write-behind queue
+// ============================================
+
+// id → latest record, or null for a delete
+const pendingWrites: Record<StoreName, Map<string, WbsTask | TestCase | null>> = {
+  [WBS_STORE]: new Map(),
+  [TC_STORE]: new Map(),
+};
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+let flushing: Promise<void> = Promise.resolve();
+let failedFlushes = 0;
+
+const applyToSummary = (summary: DashboardSummary, storeName: StoreName, record: WbsTask | TestCase, sign: 1 | -1) => {
+  if (storeName === WBS_STORE) applyWbsTask(summary, record as WbsTask, sign);
+  else applyTestCase(summary, record as TestCase, sign);
+};
+
+/**
+ * Applies one flush worth of changes in a single transaction.
+ * Each item's previous version is read first, so the summary can swap its old
+ * contribution for the new one.
+ */
+const writeBatches = async (
+  batches: ReadonlyArray<readonly [StoreName, Map<string, WbsTask | TestCase | null>]>
+): Promise<void> => {
+  const db = await getDb();
+  const tx = db.transaction([WBS_STORE, TC_STORE, META_STORE], 'readwrite');
+  const meta = tx.objectStore(META_STORE);
+
+  const summaryRequest = meta.get(SUMMARY_KEY);
+  summaryRequest.onsuccess = () => {
+    // No summary yet: it is built from scratch on the next read
+    const summary: DashboardSummary | undefined = summaryRequest.result;
+    let outstanding = 0;
+
+    batches.forEach(([storeName, batch]) => {
+      const store = tx.objectStore(storeName);
+      batch.forEach((record, id) => {
+        outstanding++;
+        const existing = store.get(id);
+        existing.onsuccess = () => {
+          const previous = existing.result;
+          if (summary && previous) applyToSummary(summary, storeName, previous, -1);
+
+          if (record === null) {
+            store.delete(id);
+          } else {
+            // Keep the original sort key so an edit doesn't move the item
+            store.put({ ...record, sortKey: previous?.sortKey ?? nextSortKey() });
+            if (summary) applyToSummary(summary, storeName, record, 1);
+          }
+
+          outstanding--;
+          if (outstanding === 0 && summary) {
+            meta.put({ ...summary, updatedAt: new Date().toISOString() }, SUMMARY_KEY);
+          }
+        };
+      });
+    });
+  };
+
+  await transactionDone(tx);
+};
+
+/**
+ * Writes every queued change now (also called before reads, so reads see them)
+ */
+export const flushPendingWrites = (): Promise<void> => {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+
+  flushing = flushing.then(async () => {
+    if (pendingWrites[WBS_STORE].size === 0 && pendingWrites[TC_STORE].size === 0) return;
+
+    const batches = ([WBS_STORE, TC_STORE] as StoreName[]).map(storeName => {
+      const batch = new Map(pendingWrites[storeName]);
+      pendingWrites[storeName].clear();
+      return [storeName, batch] as const;
+    });
+
+    try {
+      await writeBatches(batches);
+      failedFlushes = 0;
+    } catch (error) {
+      // Put the batch back (unless a newer change is already queued) and retry it with backoff,
+      // so the edits are written even if nothing else is queued
+      batches.forEach(([storeName, batch]) => {
+        batch.forEach((record, id) => {
+          if (!pendingWrites[storeName].has(id)) pendingWrites[storeName].set(id, record);
+        });
+      });
+      failedFlushes++;
+      const delay = Math.min(FLUSH_DELAY_MS * 2 ** failedFlushes, MAX_FLUSH_RETRY_DELAY_MS);
+      console.error(`Failed to persist WBS/TC changes, retrying in ${delay}ms:`, error);
+      if (!flushTimer) flushTimer = setTimeout(flushPendingWrites, delay);
+    }
+  });
+
+  return flushing;
+};
+
+const queueWrite = (storeName: StoreName, id: string, record: WbsTask | TestCase | null) => {
+  pendingWrites[storeName].set(id, record);
+  if (!flushTimer) {
+    flushTimer = setTimeout(flushPendingWrites, FLUSH_DELAY_MS);
+  }
+};
+
+// Don't lose queued edits when the tab is hidden or closed
+if (typeof window !== 'undefined') {
+  window.addEventListener('pagehide', () => {
+    flushPendingWrites();
+  });
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') flushPendingWrites();
+  });
+}
+
+export const putWbsTask = (task: WbsTask) => queueWrite(WBS_STORE, task.id, task);
+export const removeWbsTask = (id: string) => queueWrite(WBS_STORE, id, null);
+export const putTestCase = (tc: TestCase) => queueWrite(TC_STORE, tc.id, tc);
+export const removeTestCase = (id: string) => queueWrite(TC_STORE, id, null);
+
+// ============================================
+// Reads
+// ============================================
+
+const readAll = async <T extends { id: string }>(
+  storeName: StoreName,
+  query?: { index: string; value: IDBValidKey }
+): Promise<T[]> => {
+  await flushPendingWrites();
+  const db = await getDb();
+  const store = db.transaction(storeName, 'readonly').objectStore(storeName);
+  const records: Stored<T>[] = await requestToPromise(
+    query ? store.index(query.index).getAll(query.value) : store.getAll()
+  );
+  return records.sort((a, b) => a.sortKey - b.sortKey).map(stripSortKey);
+};
+
+/**
+ * Items of the given screens, grouped in screen order (same order the old per-screen keys produced)
+ */
+const readByScreens = async <T extends { id: string }>(storeName: StoreName, screenIds: string[]): Promise<T[]> => {
+  await flushPendingWrites();
+  const db = await getDb();
+  const index = db.transaction(storeName, 'readonly').objectStore(storeName).index('originScreenId');
+  const perScreen: Stored<T>[][] = await Promise.all(
+    screenIds.map(screenId => requestToPromise(index.getAll(screenId)))
+  );
+  return perScreen.flatMap(records => records.sort((a, b) => a.sortKey - b.sortKey).map(stripSortKey));
+};
+
+export const getWbsTasksByScreens = (screenIds: string[]) => readByScreens<WbsTask>(WBS_STORE, screenIds);
+export const getTestCasesByScreens = (screenIds: string[]) => readByScreens<TestCase>(TC_STORE, screenIds);
+
+export const queryWbsTasks = (index: WbsIndex, value: string) => readAll<WbsTask>(WBS_STORE, { index, value });
+export const queryTestCases = (index: TcIndex, value: string) => readAll<TestCase>(TC_STORE, { index, value });
+
+export const getAllWbsTasks = () => readAll<WbsTask>(WBS_STORE);
+export const getAllTestCases = () => readAll<TestCase>(TC_STORE);
+
+// ============================================
+// Dashboard summary
+// ============================================
+
+/**
+ * Recomputes the summary from every record (keeps the known screen names)
+ */
+export const rebuildDashboardSummary = async (): Promise<DashboardSummary> => {
+  await flushPendingWrites();
+  const db = await getDb();
+  const tx = db.transaction([WBS_STORE, TC_STORE, META_STORE], 'readwrite');
+  const meta = tx.objectStore(META_STORE);
+
+  const [tasks, cases, previous] = await Promise.all([
+    requestToPromise<Stored<WbsTask>[]>(tx.objectStore(WBS_STORE).getAll()),
+    requestToPromise<Stored<TestCase>[]>(tx.objectStore(TC_STORE).getAll()),
+    requestToPromise<DashboardSummary | undefined>(meta.get(SUMMARY_KEY)),
+  ]);
+  const summary = computeSummary(tasks, cases, previous?.screenNames);
+  meta.put(summary, SUMMARY_KEY);
+  await transactionDone(tx);
+
+  console.log(`📊 Rebuilt dashboard summary (${tasks.length} WBS, ${cases.length} TC)`);
+  return summary;
+};
+
+/**
+ * Compares a stored summary with counts read from the store's indexes:
+ * totals, TC counts per status / priority / assignee, and WBS counts per assignee and status.
+ * Unlike the totals alone, this also catches a missed delta that only moved an item
+ * between statuses or assignees.
+ */
+const isSummaryInSync = async (tx: IDBTransaction, summary: DashboardSummary): Promise<boolean> => {
+  const count = (storeName: StoreName, index?: string, value?: IDBValidKey): Promise<number> => {
+    const store = tx.objectStore(storeName);
+    return requestToPromise(index ? store.index(index).count(value) : store.count());
+  };
+  const wbsAssignees = Object.values(summary.wbs.byAssignee);
+
+  // [actual count, count the summary claims]
+  const checks: Array<[Promise<number>, number]> = [
+    [count(TC_STORE), summary.tc.total],
+    [count(WBS_STORE), summary.wbs.total],
+    ...Object.entries(summary.tc.byStatus).map(([status, n]): [Promise<number>, number] => [count(TC_STORE, 'status', status), n]),
+    ...Object.entries(summary.tc.byPriority).map(([priority, n]): [Promise<number>, number] => [count(TC_STORE, 'priority', priority), n]),
+    ...Object.entries(summary.tc.byAssignee).map(([assignee, stats]): [Promise<number>, number] => [count(TC_STORE, 'assignee', assignee), stats.total]),
+    ...Object.entries(summary.wbs.byAssignee).map(([assignee, stats]): [Promise<number>, number] => [count(WBS_STORE, 'assignee', assignee), stats.total]),
+    [count(WBS_STORE, 'status', 'In Progress'), wbsAssignees.reduce((sum, stats) => sum + stats.inProgress, 0)],
+    [count(WBS_STORE, 'status', 'Done'), wbsAssignees.reduce((sum, stats) => sum + stats.done, 0)],
+  ];
+
+  const actual = await Promise.all(checks.map(([counted]) => counted));
+  return actual.every((n, i) => n === checks[i][1]);
+};
+
+/**
+ * Reads the stored summary. If it is missing, or its counts disagree with the
+ * store (e.g. written by an older build, or a delta was missed), it is rebuilt first.
+ */
+export const getDashboardSummary = async (): Promise<DashboardSummary> => {
+  await flushPendingWrites();
+  const db = await getDb();
+  const tx = db.transaction([WBS_STORE, TC_STORE, META_STORE], 'readonly');
+
+  const summary = await requestToPromise<DashboardSummary | undefined>(tx.objectStore(META_STORE).get(SUMMARY_KEY));
+  if (!summary || !(await isSummaryInSync(tx, summary))) {
+    return rebuildDashboardSummary();
+  }
+  return summary;
+};
+
+/**
+ * Merges figmaId → screen name entries from a Figma sync into the summary
+ */
+export const updateSummaryScreenNames = async (names: Record<string, string>): Promise<void> => {
+  const db = await getDb();
+  const tx = db.transaction(META_STORE, 'readwrite');
+  const meta = tx.objectStore(META_STORE);
+
+  const request = meta.get(SUMMARY_KEY);
+  request.onsuccess = () => {
+    // A fresh summary has zero totals; if records exist, the count check rebuilds it (keeping these names)
+    const summary: DashboardSummary = request.result || createEmptySummary();
+    meta.put({ ...summary, screenNames: { ...summary.screenNames, ...names } }, SUMMARY_KEY);
+  };
+
+  await transactionDone(tx);
+};
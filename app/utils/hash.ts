@@ -0,0 +1,41 @@
+/**
+ * 문자열 해시 (cyrb53: 빠른 비암호화 53비트 해시)
+ * 캐시 키 생성용 — 메인 스레드와 Web Worker 양쪽에서 사용 가능
+ */
+
+export interface Hasher {
+  update: (str: string) => void;
+  digest: () => string;
+}
+
+/**
+ * 점진적 해시: 문자열 조각을 차례로 넣으면 이어 붙인 문자열의 hashString과 같은 값
+ * 큰 문자열을 만들지 않고 트리 순회 중에 바로 해시할 때 사용
+ */
+export const createHasher = (): Hasher => {
+  let h1 = 0xdeadbeef;
+  let h2 = 0x41c6ce57;
+
+  return {
+    update: (str: string) => {
+      for (let i = 0; i < str.length; i++) {
+        const ch = str.charCodeAt(i);
+        h1 = Math.imul(h1 ^ ch, 2654435761);
+        h2 = Math.imul(h2 ^ ch, 1597334677);
+      }
+    },
+    digest: () => {
+      let a = Math.imul(h1 ^ (h1 >>> 16), 2246822507);
+      a ^= Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+      let b = Math.imul(h2 ^ (h2 >>> 16), 2246822507);
+      b ^= Math.imul(a ^ (a >>> 13), 3266489909);
+      return (4294967296 * (2097151 & b) + (a >>> 0)).toString(36);
+    },
+  };
+};
+
+export const hashString = (str: string): string => {
+  const hasher = createHasher();
+  hasher.update(str);
+  return hasher.digest();
+};
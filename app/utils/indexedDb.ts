@@ -0,0 +1,64 @@
+/**
+ * IndexedDB 최소 헬퍼 (Promise 래퍼)
+ * 메인 스레드와 Web Worker 양쪽에서 사용 가능
+ */
+
+export type UpgradeHandler = (db: IDBDatabase, oldVersion: number, transaction: IDBTransaction) => void;
+
+const connections = new Map<string, Promise<IDBDatabase>>();
+
+export const isIndexedDbAvailable = (): boolean => typeof indexedDB !== 'undefined';
+
+/**
+ * 데이터베이스 열기 (이름별로 연결 재사용)
+ */
+export const openDatabase = (name: string, version: number, upgrade: UpgradeHandler): Promise<IDBDatabase> => {
+  const existing = connections.get(name);
+  if (existing) return existing;
+
+  const connection = new Promise<IDBDatabase>((resolve, reject) => {
+    if (!isIndexedDbAvailable()) {
+      reject(new Error('IndexedDB is not available'));
+      return;
+    }
+
+    const request = indexedDB.open(name, version);
+    request.onupgradeneeded = (event) => {
+      upgrade(request.result, event.oldVersion, request.transaction!);
+    };
+    request.onsuccess = () => {
+      const db = request.result;
+      // 다른 탭에서 버전을 올리면 연결을 닫고 다음 요청 때 다시 연다
+      db.onversionchange = () => {
+        db.close();
+        connections.delete(name);
+      };
+      resolve(db);
+    };
+    request.onerror = () => reject(request.error);
+    request.onblocked = () => reject(new Error(`IndexedDB "${name}" upgrade blocked by another tab`));
+  });
+
+  connections.set(name, connection);
+  connection.catch(() => connections.delete(name));
+  return connection;
+};
+
+/**
+ * IDBRequest → Promise
+ */
+export const requestToPromise = <T>(request: IDBRequest<T>): Promise<T> =>
+  new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+
+/**
+ * 트랜잭션 완료 대기
+ */
+export const transactionDone = (transaction: IDBTransaction): Promise<void> =>
+  new Promise((resolve, reject) => {
+    transaction.oncomplete = () => resolve();
+    transaction.onerror = () => reject(transaction.error);
+    transaction.onabort = () => reject(transaction.error || new Error('Transaction aborted'));
+  });
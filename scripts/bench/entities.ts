@@ -0,0 +1,103 @@
+/**
+ * Single-row edit benchmark for the screen detail page's TC state at master-view scale:
+ * the state work done per edit before React renders (the new record, the derived
+ * ordered list and qaProgress), for the normalized { ids, byId } state against the
+ * previous whole-array map.
+ *
+ *   npm run bench:entities
+ *   npm run bench:entities -- --items 5000,20000 --edits 2000
+ *
+ * Render cost is not covered: with windowing, one edit re-renders only the edited row
+ * (React.memo per row) and the table renders viewport + overscan rows, not all of them.
+ */
+import { performance } from 'node:perf_hooks';
+import type { TestCase } from '../../app/types';
+import { toEntityState, updateEntity } from '../../app/screen/[prefix]/context/entityState';
+
+const parseArgs = (argv: string[]) => {
+  const args = { items: [5000], edits: 1000 };
+  for (let i = 0; i < argv.length; i++) {
+    const value = argv[i + 1];
+    switch (argv[i]) {
+      case '--items': args.items = value.split(',').map(Number); i++; break;
+      case '--edits': args.edits = Math.max(1, Number(value)); i++; break;
+      default: throw new Error(`Unknown argument: ${argv[i]}`);
+    }
+  }
+  return args;
+};
+
+const STATUSES: TestCase['status'][] = ['Reviewing', 'DevError', 'ProdError', 'DevDone', 'ProdDone', 'Hold'];
+
+const generateTestCases = (count: number): TestCase[] =>
+  Array.from({ length: count }, (_, i) => ({
+    id: `tc-${i}`,
+    scenario: `Scenario ${i}`,
+    issueContent: `Issue ${i}`,
+    date: '2024-03-15',
+    status: STATUSES[i % STATUSES.length],
+    reporter: 'QA',
+    priority: 'Medium',
+    position: 'Front-end',
+    assignee: `dev-${i % 12}`,
+    progress: 'Waiting',
+    comments: [],
+    originScreenId: `1:${i % 200}`,
+  } as TestCase));
+
+// Same derivations ScreenContext recomputes after an edit
+const qaProgress = (testCases: TestCase[]) => {
+  if (testCases.length === 0) return 0;
+  const done = testCases.filter(t => t.status === 'ProdDone' || t.status === 'DevDone').length;
+  return Math.round((done / testCases.length) * 100);
+};
+
+const round = (n: number) => Math.round(n * 1000) / 1000;
+const percentile = (values: number[], p: number) => [...values].sort((a, b) => a - b)[Math.floor(values.length * p)];
+
+const timeEdits = (edits: number, count: number, edit: (id: string, status: TestCase['status']) => void) => {
+  const samples: number[] = [];
+  for (let i = 0; i < edits; i++) {
+    const id = `tc-${(i * 7919) % count}`;
+    const start = performance.now();
+    edit(id, STATUSES[i % STATUSES.length]);
+    samples.push(performance.now() - start);
+  }
+  return { median: round(percentile(samples, 0.5)), p99: round(percentile(samples, 0.99)) };
+};
+
+const benchItems = (count: number, edits: number) => {
+  const items = generateTestCases(count);
+
+  // Normalized: one record replaced, then the ordered list and qaProgress derived
+  let state = toEntityState(items);
+  const normalized = timeEdits(edits, count, (id, status) => {
+    state = updateEntity(state, id, { status });
+    const list = state.ids.map(key => state.byId[key]);
+    qaProgress(list);
+  });
+
+  // Previous: map over the whole array, then qaProgress
+  let list = items;
+  const mapped = timeEdits(edits, count, (id, status) => {
+    list = list.map(tc => (tc.id === id ? { ...tc, status } : tc));
+    qaProgress(list);
+  });
+
+  return {
+    items: count,
+    editMedianMs: normalized.median,
+    editP99Ms: normalized.p99,
+    arrayMapMedianMs: mapped.median,
+    arrayMapP99Ms: mapped.p99,
+  };
+};
+
+const main = () => {
+  const args = parseArgs(process.argv.slice(2));
+  const rows = args.items.map(count => benchItems(count, args.edits));
+  console.log(`edits=${args.edits} (ms per single-row edit, state work only)`);
+  console.table(rows);
+};
+
+main();
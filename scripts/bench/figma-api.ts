@@ -0,0 +1,185 @@
+/**
+ * Checks the Figma REST loader against a local mock server, without network access or a token.
+ * The server serves a /files-shaped file (synthetic, or --file) the way the API does:
+ * depth-limited /files skeletons, /nodes subtrees (test.json shape) and /images URLs,
+ * answering the first request per endpoint with a 429 (or a dropped connection, for /images).
+ *
+ * Checked: retries, the concurrency limit, the version skip, /nodes batching, /images batching,
+ * and that the tree assembled from the skeleton and /nodes subtrees parses to the same groups
+ * as the file itself (whole file and node-id loads).
+ *
+ *   npm run check:figma-api
+ *   npm run check:figma-api -- --screens 2000
+ *   npm run check:figma-api -- --file recorded-file.json   # a /files response
+ */
+import assert from 'node:assert/strict';
+import { createServer } from 'node:http';
+import type { AddressInfo } from 'node:net';
+import { readFileSync } from 'node:fs';
+import { createFigmaClient, fetchFigmaFileTree, resolveScreenThumbnails } from '../../app/services/figmaApi';
+import { parseFigmaFile } from '../../app/services/figmaService';
+import type { FigmaNode } from '../../app/types';
+import { generateFigmaFile } from './synthetic';
+
+const CONCURRENCY = 2;
+const NODE_BATCH_SIZE = 20;
+const IMAGE_BATCH_SIZE = 50;
+
+const parseArgs = (argv: string[]) => {
+  const args: { screens: number; file?: string } = { screens: 600 };
+  for (let i = 0; i < argv.length; i++) {
+    const value = argv[i + 1];
+    switch (argv[i]) {
+      case '--screens': args.screens = Number(value); i++; break;
+      case '--file': args.file = value; i++; break;
+      default: throw new Error(`Unknown argument: ${argv[i]}`);
+    }
+  }
+  return args;
+};
+
+// /files?depth=N: nodes deeper than N come back without children
+const prune = (node: FigmaNode, depth: number): FigmaNode => {
+  const { children, ...rest } = node;
+  if (!children || depth === 0) return rest as FigmaNode;
+  return { ...rest, children: children.map(child => prune(child, depth - 1)) } as FigmaNode;
+};
+
+const indexNodes = (root: FigmaNode, byId = new Map<string, FigmaNode>()) => {
+  byId.set(root.id, root);
+  root.children?.forEach(child => indexNodes(child, byId));
+  return byId;
+};
+
+/**
+ * Mock api.figma.com over HTTP; every endpoint fails its first request
+ */
+const startMockServer = (file: any) => {
+  const nodesById = indexNodes(file.document);
+  const requests: { endpoint: string; params: URLSearchParams }[] = [];
+  const failed = new Set<string>();
+  let inFlight = 0;
+  let maxInFlight = 0;
+
+  const server = createServer((req, res) => {
+    const url = new URL(req.url || '/', 'http://mock');
+    const path = url.pathname.replace(/^\/v1/, '');
+    const endpoint = path.startsWith('/images/') ? 'images' : path.endsWith('/nodes') ? 'nodes' : 'files';
+    requests.push({ endpoint, params: url.searchParams });
+
+    inFlight++;
+    maxInFlight = Math.max(maxInFlight, inFlight);
+    const send = (status: number, body: unknown, headers: Record<string, string> = {}) => {
+      setTimeout(() => {
+        inFlight--;
+        res.writeHead(status, { 'Content-Type': 'application/json', ...headers });
+        res.end(JSON.stringify(body));
+      }, 2);
+    };
+
+    if (req.headers['x-figma-token'] !== 'mock-token') return send(403, { status: 403, err: 'Invalid token' });
+
+    if (!failed.has(endpoint)) {
+      failed.add(endpoint);
+      if (endpoint === 'images') {
+        inFlight--;
+        req.socket.destroy(); // network error on the client side
+        return;
+      }
+      return send(429, { status: 429, err: 'Rate limit exceeded' }, { 'Retry-After': '0.01' });
+    }
+
+    const ids = url.searchParams.get('ids')?.split(',') || [];
+    if (endpoint === 'files') {
+      const depth = Number(url.searchParams.get('depth') || Infinity);
+      return send(200, { ...file, document: prune(file.document, depth) });
+    }
+    if (endpoint === 'nodes') {
+      const nodes = Object.fromEntries(ids.map(id => {
+        const node = nodesById.get(id);
+        return [id, node ? { document: node, components: {}, styles: {} } : null];
+      }));
+      return send(200, { name: file.name, version: file.version, lastModified: file.lastModified, nodes });
+    }
+    return send(200, { err: null, images: Object.fromEntries(ids.map(id => [id, `https://images.mock/${id}.png`])) });
+  });
+
+  return new Promise<{ baseUrl: string; requests: typeof requests; maxInFlight: () => number; close: () => void }>(resolve => {
+    server.listen(0, '127.0.0.1', () => {
+      const { port } = server.address() as AddressInfo;
+      resolve({ baseUrl: `http://127.0.0.1:${port}/v1`, requests, maxInFlight: () => maxInFlight, close: () => server.close() });
+    });
+  });
+};
+
+const countScreens = (pages: ReturnType<typeof parseFigmaFile>) =>
+  Object.values(pages).flatMap(groups => Object.values(groups).flatMap(group => Object.values(group.baseIds).flat()));
+
+const main = async () => {
+  const args = parseArgs(process.argv.slice(2));
+  const file = args.file
+    ? JSON.parse(readFileSync(args.file, 'utf8'))
+    : generateFigmaFile({ screens: args.screens, depth: 3, textsPerFrame: 12, covers: true });
+  assert.ok(file.document, '--file must be a /files response (with a document)');
+  const version: string = file.version || '';
+
+  const mock = await startMockServer(file);
+  const client = createFigmaClient('mock-token', { baseUrl: mock.baseUrl, concurrency: CONCURRENCY });
+  const count = (endpoint: string) => mock.requests.filter(request => request.endpoint === endpoint).length;
+
+  const { warn, log } = console;
+  let warnings = 0;
+  console.warn = () => { warnings++; };
+  console.log = () => {};
+  try {
+    // Whole file: skeleton (429 → retry), then /nodes batches pinned to the skeleton's version
+    const result = await fetchFigmaFileTree(client, 'FILEKEY');
+    assert.equal(result.version, version);
+    assert.equal(count('files'), 2, 'skeleton retried once after 429');
+    const containers = file.document.children.flatMap((page: FigmaNode) => page.children || []).length;
+    assert.equal(count('nodes'), Math.ceil(containers / NODE_BATCH_SIZE) + 1, `/nodes batches of ${NODE_BATCH_SIZE}, one 429 retry`);
+    assert.ok(mock.requests.filter(request => request.endpoint === 'nodes').every(request => request.params.get('version') === version));
+
+    // Grafted tree parses to the same groups as the file itself
+    const pages = parseFigmaFile(result.data);
+    assert.deepEqual(pages, parseFigmaFile(file), 'assembled tree parses like the original file');
+
+    // Node-id load (test.json shape) parses like a /nodes response for that node
+    const page = file.document.children[0];
+    const nodeResult = await fetchFigmaFileTree(client, 'FILEKEY', page.id);
+    assert.deepEqual(
+      parseFigmaFile(nodeResult.data),
+      parseFigmaFile({ nodes: { [page.id]: { document: page } } }),
+      'node-id load parses like the node itself'
+    );
+
+    // Version skip: one skeleton request, no data
+    const before = mock.requests.length;
+    const skipped = await fetchFigmaFileTree(client, 'FILEKEY', null, version);
+    assert.equal(skipped.data, undefined);
+    assert.equal(mock.requests.length - before, 1, 'unchanged version costs one request');
+
+    // Thumbnails: /images batches, the first retried after a dropped connection
+    const screens = countScreens(pages);
+    const ids = new Set(screens.map(screen => screen.figmaId));
+    const resolved = await resolveScreenThumbnails(client, 'FILEKEY', pages, version);
+    assert.equal(resolved, ids.size);
+    assert.equal(count('images'), Math.ceil(ids.size / IMAGE_BATCH_SIZE) + 1, `/images batches of ${IMAGE_BATCH_SIZE}, one network-error retry`);
+    assert.ok(screens.every(screen => screen.thumbnailUrl === `https://images.mock/${screen.figmaId}.png`));
+
+    assert.ok(mock.maxInFlight() <= CONCURRENCY, `at most ${CONCURRENCY} requests in flight (saw ${mock.maxInFlight()})`);
+    assert.equal(warnings, 3, 'one retry warning per endpoint');
+
+    console.log = log;
+    console.log(`✅ Figma API checks passed (${screens.length} screens, ${mock.requests.length} requests, max ${mock.maxInFlight()} in flight)`);
+  } finally {
+    console.warn = warn;
+    console.log = log;
+    mock.close();
+  }
+};
+
+main().catch(error => {
+  console.error('❌', error);
+  process.exit(1);
+});
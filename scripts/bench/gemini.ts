@@ -0,0 +1,131 @@
+/**
+ * Checks the spec refinement pipeline against a recording stub backend, without the
+ * Gemini SDK or network: in-flight dedupe, the result cache, the 8-text / 12k-char batch
+ * split, the concurrency limit and splitBatchResponse's handling of mismatched responses.
+ *
+ *   npm run check:gemini
+ */
+import assert from 'node:assert/strict';
+import {
+  refineSpecifications,
+  setRefinementBackend,
+  splitBatchResponse,
+} from '../../app/services/geminiService';
+import type { RefinementBackend } from '../../app/services/geminiService';
+
+const lines = (text: string) => text.split('\n').filter(line => line.trim().length > 0);
+
+/**
+ * Stub that records every batch; `respond` decides what comes back per text
+ */
+const createRecordingBackend = (name: string, respond: (text: string) => string[] | undefined = text => [`✔ ${text}`]) => {
+  const batches: string[][] = [];
+  let inFlight = 0;
+  let maxInFlight = 0;
+
+  const backend: RefinementBackend = {
+    name,
+    refineBatch: async (texts) => {
+      batches.push(texts);
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      try {
+        await new Promise(resolve => setTimeout(resolve, 10));
+        return texts.map(respond);
+      } finally {
+        inFlight--;
+      }
+    },
+  };
+
+  return { backend, batches, maxInFlight: () => maxInFlight };
+};
+
+const checkDedupeAndCache = async () => {
+  const stub = createRecordingBackend('check-dedupe');
+  setRefinementBackend(stub.backend);
+
+  // Identical texts in flight share one request; surrounding whitespace doesn't matter
+  const text = '로그인 버튼을 누르면 인증 화면으로 이동한다';
+  const results = await Promise.all([refineSpecifications(text), refineSpecifications(text), refineSpecifications(`  ${text}\n`)]);
+  assert.deepEqual(stub.batches, [[text]], 'one backend call for identical in-flight texts');
+  assert.ok(results.every(items => items === results[0]), 'callers share the same result');
+
+  // Resolved results are served from the cache
+  await refineSpecifications(text);
+  assert.equal(stub.batches.length, 1, 'cached result needs no backend call');
+
+  // Too short to refine
+  assert.deepEqual(await refineSpecifications('abc'), []);
+  assert.equal(stub.batches.length, 1);
+};
+
+const checkBatchSplit = async () => {
+  // 20 short texts → 8 + 8 + 4, at most 2 batches at once
+  const byCount = createRecordingBackend('check-count');
+  setRefinementBackend(byCount.backend);
+  const texts = Array.from({ length: 20 }, (_, i) => `화면 설명 ${i} 필수 항목을 입력하지 않으면 저장 버튼이 비활성화된다`);
+  const results = await Promise.all(texts.map(refineSpecifications));
+  assert.deepEqual(byCount.batches.map(batch => batch.length), [8, 8, 4], '8 texts per prompt');
+  assert.deepEqual(byCount.batches.flat(), texts, 'queue order is kept');
+  assert.ok(results.every((items, i) => items[0] === `✔ ${texts[i]}`), 'each result goes back to its own caller');
+  assert.ok(byCount.maxInFlight() <= 2, `at most 2 batches in flight (saw ${byCount.maxInFlight()})`);
+
+  // 5 texts of 5,000 chars → 2 + 2 + 1, since a third would pass 12k chars
+  const byChars = createRecordingBackend('check-chars');
+  setRefinementBackend(byChars.backend);
+  const long = Array.from({ length: 5 }, (_, i) => `${i}`.padEnd(5000, '가'));
+  await Promise.all(long.map(refineSpecifications));
+  assert.deepEqual(byChars.batches.map(batch => batch.length), [2, 2, 1], '12k chars per prompt');
+};
+
+const checkMismatchedResponses = async () => {
+  // splitBatchResponse keeps only well-formed, in-range entries
+  assert.deepEqual(splitBatchResponse({ index: 0, items: ['a'] }, 2), [undefined, undefined], 'non-array response');
+  assert.deepEqual(
+    splitBatchResponse([
+      { index: 1, items: ['b'] },
+      { index: 2, items: ['out of range'] },
+      { index: -1, items: ['negative'] },
+      { index: 0.5, items: ['not an integer'] },
+      { index: 0, items: ['a', 3] },
+      null,
+    ], 2),
+    [undefined, ['b']],
+    'out-of-range, non-integer and malformed entries are dropped'
+  );
+  assert.deepEqual(splitBatchResponse([{ index: 0, items: ['x'] }, { index: 0, items: ['y'] }], 1), [['y']], 'later duplicates win');
+
+  // Entries the backend leaves out fall back to the raw lines and are not cached
+  const partial = createRecordingBackend('check-partial', text => (text.startsWith('ok') ? ['refined'] : undefined));
+  setRefinementBackend(partial.backend);
+  const missing = 'missing\n첫 줄\n\n둘째 줄';
+  const [ok, fallback] = await Promise.all([refineSpecifications('ok 약관 동의 후 다음 단계'), refineSpecifications(missing)]);
+  assert.deepEqual(ok, ['refined']);
+  assert.deepEqual(fallback, lines(missing), 'missing entry falls back to the raw lines');
+  await refineSpecifications(missing);
+  assert.equal(partial.batches.length, 2, 'fallback results are retried, not cached');
+
+  // A failed batch resolves every caller with its raw lines
+  const failing: RefinementBackend = { name: 'check-failing', refineBatch: async () => { throw new Error('quota'); } };
+  setRefinementBackend(failing);
+  assert.deepEqual(await refineSpecifications('네트워크 오류\n재시도 안내'), ['네트워크 오류', '재시도 안내']);
+};
+
+const main = async () => {
+  const { error } = console;
+  console.error = () => {};
+  try {
+    await checkDedupeAndCache();
+    await checkBatchSplit();
+    await checkMismatchedResponses();
+  } finally {
+    console.error = error;
+  }
+  console.log('✅ Gemini refinement checks passed');
+};
+
+main().catch(error => {
+  console.error('❌', error);
+  process.exit(1);
+});
@@ -0,0 +1,196 @@
+/**
+ * Parser benchmark: runs the real figmaService parse over synthetic (or recorded) Figma files
+ * and reports per-phase timings and memory.
+ *
+ *   npm run bench:parse
+ *   npm run bench:parse -- --screens 200,2000 --depth 6 --texts 30 --no-covers --runs 7
+ *   npm run bench:parse -- --file public/test.json
+ *   npm run bench:parse -- --log      # include the per-screen debug logging cost
+ *   npm run bench:parse -- --json     # machine-readable rows for regression tracking
+ *
+ * Phases come from the parser's own performance marks (see figmaDebug.ts):
+ * index = tree walk and unit hashing, reindex = indexing a changed unit on a re-parse,
+ * extract = per-screen text/cover extraction, group = prefix grouping,
+ * parse = the whole parseFigmaFile call.
+ */
+import { performance } from 'node:perf_hooks';
+import { readFileSync } from 'node:fs';
+import { getHeapStatistics } from 'node:v8';
+import { parseFigmaFile } from '../../app/services/figmaService';
+import type { FigmaParseSnapshot } from '../../app/services/figmaService';
+import type { FigmaNode } from '../../app/types';
+import { setFigmaDebug, MEASURE_PREFIX } from '../../app/services/figmaDebug';
+import { generateFigmaFile, countNodes, editOneScreen } from './synthetic';
+
+interface BenchArgs {
+  screens: number[];
+  depth: number;
+  texts: number;
+  covers: boolean;
+  runs: number;
+  log: boolean;
+  json: boolean;
+  file?: string;
+}
+
+const parseArgs = (argv: string[]): BenchArgs => {
+  const args: BenchArgs = { screens: [100, 1000, 5000], depth: 4, texts: 20, covers: true, runs: 5, log: false, json: false };
+  for (let i = 0; i < argv.length; i++) {
+    const value = argv[i + 1];
+    switch (argv[i]) {
+      case '--screens': args.screens = value.split(',').map(Number); i++; break;
+      case '--depth': args.depth = Number(value); i++; break;
+      case '--texts': args.texts = Number(value); i++; break;
+      case '--runs': args.runs = Math.max(1, Number(value)); i++; break;
+      case '--file': args.file = value; i++; break;
+      case '--no-covers': args.covers = false; break;
+      case '--log': args.log = true; break;
+      case '--json': args.json = true; break;
+      default: throw new Error(`Unknown argument: ${argv[i]}`);
+    }
+  }
+  return args;
+};
+
+const gc = (globalThis as { gc?: () => void }).gc;
+const MB = 1024 * 1024;
+const round = (n: number) => Math.round(n * 100) / 100;
+const median = (values: number[]) => [...values].sort((a, b) => a - b)[Math.floor(values.length / 2)];
+
+const time = <T>(fn: () => T): [T, number] => {
+  const start = performance.now();
+  const result = fn();
+  return [result, performance.now() - start];
+};
+
+/**
+ * Runs `fn` with console output swallowed, returning its result, the parser's
+ * phase durations (summed per phase, since parseFrames runs once per root) and the log line count
+ */
+const runMeasured = <T>(fn: () => T) => {
+  performance.clearMeasures();
+  let logLines = 0;
+  const { log, warn } = console;
+  console.log = () => { logLines++; };
+  console.warn = () => { logLines++; };
+  try {
+    const result = fn();
+    const phases: Record<string, number> = {};
+    performance.getEntriesByType('measure').forEach(entry => {
+      if (!entry.name.startsWith(MEASURE_PREFIX)) return;
+      const phase = entry.name.slice(MEASURE_PREFIX.length);
+      phases[phase] = (phases[phase] || 0) + entry.duration;
+    });
+    return { result, phases, logLines };
+  } finally {
+    console.log = log;
+    console.warn = warn;
+  }
+};
+
+/**
+ * Median of each phase over `runs` parses
+ */
+const benchParse = (runs: number, parse: () => unknown) => {
+  const samples: Record<string, number[]> = {};
+  let logLines = 0;
+  for (let run = 0; run < runs; run++) {
+    const measured = runMeasured(parse);
+    logLines = measured.logLines;
+    Object.entries(measured.phases).forEach(([phase, duration]) => {
+      (samples[phase] || (samples[phase] = [])).push(duration);
+    });
+  }
+  const phases: Record<string, number> = {};
+  Object.entries(samples).forEach(([phase, durations]) => { phases[phase] = round(median(durations)); });
+  return { phases, logLines };
+};
+
+const heapUsed = () => {
+  gc?.();
+  return getHeapStatistics().used_heap_size;
+};
+
+const benchFile = (label: string, data: any, runs: number) => {
+  const nodeCount = data.document
+    ? countNodes(data.document)
+    : Object.values(data.nodes || {}).reduce((sum: number, entry: any) => sum + (entry?.document ? countNodes(entry.document) : 0), 0);
+
+  // response.json() cost in the worker
+  const [json, stringifyMs] = time(() => JSON.stringify(data));
+  const [parsed, jsonParseMs] = time(() => JSON.parse(json));
+
+  // First sync: full parse that also records the snapshot, as figmaCache does
+  const full = benchParse(runs, () => parseFigmaFile(parsed, undefined, { next: { units: {} } }));
+
+  // Memory of one full parse. The heap is sampled at every progress report (each new prefix,
+  // then grouping) and at the end; garbage collected between samples is missed, so the
+  // sampled peak is a lower bound
+  const before = heapUsed();
+  let sampledPeak = before;
+  const sampleHeap = () => {
+    sampledPeak = Math.max(sampledPeak, getHeapStatistics().used_heap_size);
+  };
+  const snapshot: FigmaParseSnapshot = { units: {} };
+  const { result: pages } = runMeasured(() => parseFigmaFile(parsed, sampleHeap, { next: snapshot }));
+  sampleHeap();
+  const afterParse = getHeapStatistics().used_heap_size;
+  const retained = heapUsed();
+
+  // Next version with one edited description: only the changed unit is indexed and re-extracted
+  // (/nodes responses such as test.json are edited in their first node that has text)
+  const roots: FigmaNode[] = parsed.document
+    ? [parsed.document]
+    : Object.values(parsed.nodes || {}).flatMap((entry: any) => (entry?.document ? [entry.document] : []));
+  if (!roots.some(editOneScreen)) {
+    throw new Error(`${label}: no TEXT node to edit, so reparseMs would time an unchanged file`);
+  }
+  const edited = benchParse(runs, () => parseFigmaFile(parsed, undefined, { previous: snapshot, next: { units: {} } }));
+
+  const screenCount = Object.values(pages).reduce((sum, groups) =>
+    sum + Object.values(groups).reduce((n, group) => n + Object.values(group.baseIds).flat().length, 0), 0);
+
+  return {
+    label,
+    screens: screenCount,
+    nodes: nodeCount,
+    jsonMB: round(json.length / MB),
+    stringifyMs: round(stringifyMs),
+    jsonParseMs: round(jsonParseMs),
+    indexMs: full.phases.index,
+    extractMs: full.phases.extract,
+    groupMs: full.phases.group,
+    parseMs: full.phases.parse,
+    reparseMs: edited.phases.parse,
+    reparseExtractMs: edited.phases.extract,
+    logLines: full.logLines,
+    sampledPeakMB: round((sampledPeak - before) / MB),
+    heapGrowthMB: round((afterParse - before) / MB), // right after the parse, before GC
+    retainedMB: round((retained - before) / MB),
+    rssMB: round(process.memoryUsage().rss / MB),
+  };
+};
+
+const main = () => {
+  const args = parseArgs(process.argv.slice(2));
+  setFigmaDebug({ marks: true, log: args.log });
+  if (!gc && !args.json) {
+    console.warn('⚠️ Run node with --expose-gc for stable memory numbers');
+  }
+
+  const rows = args.file
+    ? [benchFile(args.file, JSON.parse(readFileSync(args.file, 'utf8')), args.runs)]
+    : args.screens.map(screens => {
+        const file = generateFigmaFile({ screens, depth: args.depth, textsPerFrame: args.texts, covers: args.covers });
+        return benchFile(`${screens} screens`, file, args.runs);
+      });
+
+  if (args.json) {
+    console.log(JSON.stringify({ args, rows }, null, 2));
+  } else {
+    console.log(`depth=${args.depth} texts=${args.texts} covers=${args.covers} runs=${args.runs} log=${args.log} (median ms)`);
+    console.table(rows);
+  }
+};
+
+main();
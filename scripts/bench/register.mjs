@@ -0,0 +1,4 @@
+// Loaded with `node --import` before the benchmark so app modules resolve without a bundler
+import { register } from 'node:module';
+
+register('./resolve-ts.mjs', import.meta.url);
@@ -0,0 +1,10 @@
+// App sources use extensionless relative imports (bundler resolution); map them to .ts files
+export async function resolve(specifier, context, nextResolve) {
+  try {
+    return await nextResolve(specifier, context);
+  } catch (error) {
+    const isRelative = specifier.startsWith('./') || specifier.startsWith('../');
+    if (error?.code !== 'ERR_MODULE_NOT_FOUND' || !isRelative || /\.[cm]?[jt]sx?$/.test(specifier)) throw error;
+    return nextResolve(`${specifier}.ts`, context);
+  }
+}
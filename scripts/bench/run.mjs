@@ -0,0 +1,29 @@
+// Runs a bench/check script with type stripping. The Node version is checked here, since
+// older Node rejects --experimental-strip-types before any script (or register.mjs) runs.
+//   node scripts/bench/run.mjs [node flags] <script.ts> [script args]
+import { spawnSync } from 'node:child_process';
+
+const MIN_NODE = [22, 6];
+
+const [major, minor] = process.versions.node.split('.').map(Number);
+if (major < MIN_NODE[0] || (major === MIN_NODE[0] && minor < MIN_NODE[1])) {
+  console.error(`❌ Bench and check scripts need Node ${MIN_NODE.join('.')}+ (--experimental-strip-types); this is ${process.version}`);
+  process.exit(1);
+}
+
+const args = process.argv.slice(2);
+const scriptIndex = args.findIndex(arg => !arg.startsWith('--'));
+if (scriptIndex === -1) {
+  console.error('Usage: node scripts/bench/run.mjs [node flags] <script.ts> [script args]');
+  process.exit(1);
+}
+
+const register = new URL('./register.mjs', import.meta.url).href;
+const { status, signal } = spawnSync(process.execPath, [
+  '--experimental-strip-types',
+  '--no-warnings',
+  '--import', register,
+  ...args,
+], { stdio: 'inherit' });
+
+process.exit(status ?? (signal ? 1 : 0));
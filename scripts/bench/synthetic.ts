@@ -0,0 +1,188 @@
+import type { FigmaNode } from '../../app/types';
+
+/**
+ * Shape of a synthetic Figma file; every size knob the parser's cost depends on
+ */
+export interface SyntheticOptions {
+  screens: number;           // screen frames, variants included
+  depth: number;             // GROUP nesting inside each screen frame
+  textsPerFrame: number;     // TEXT nodes per screen frame
+  covers: boolean;           // one "표지" frame per prefix
+  screensPerPrefix?: number;
+  prefixesPerPage?: number;
+  variantRatio?: number;     // share of screens that are `_N` variants of the previous one
+  seed?: number;
+}
+
+type Box = { x: number; y: number; width: number; height: number };
+
+// Deterministic PRNG (mulberry32), so every run of a size parses the same tree
+const createRandom = (seed: number) => () => {
+  seed = (seed + 0x6d2b79f5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+// 0 → A, 25 → Z, 26 → AA; screen IDs only allow [A-Z]+ prefixes
+const toLetters = (n: number): string => {
+  let letters = '';
+  do {
+    letters = String.fromCharCode(65 + (n % 26)) + letters;
+    n = Math.floor(n / 26) - 1;
+  } while (n >= 0);
+  return letters;
+};
+
+const pad = (n: number) => String(n).padStart(4, '0');
+
+const SENTENCES = [
+  '로그인 버튼을 누르면 인증 화면으로 이동한다',
+  '필수 항목을 입력하지 않으면 저장 버튼이 비활성화된다',
+  '목록은 최신순으로 정렬되며 20개씩 더 불러온다',
+  '약관 동의 후 다음 단계로 진행할 수 있다',
+  '네트워크 오류 시 재시도 안내 팝업을 노출한다',
+];
+const FILLERS = ['확인', '취소', '다음', '이전', '저장', '닫기', '검색', '더보기'];
+
+/**
+ * Generates a /files-shaped response: DOCUMENT → CANVAS pages → SECTION per prefix →
+ * optional 표지 cover + screen FRAMEs with nested GROUPs and full_list / 화면 정보 texts
+ */
+export const generateFigmaFile = (options: SyntheticOptions) => {
+  const {
+    screens,
+    depth,
+    textsPerFrame,
+    covers,
+    screensPerPrefix = 20,
+    prefixesPerPage = 5,
+    variantRatio = 0.3,
+    seed = 1,
+  } = options;
+  const random = createRandom(seed);
+  let nextId = 0;
+  const id = () => `${Math.floor(nextId / 1000)}:${nextId++ % 1000}`;
+
+  const box = (x: number, y: number, width: number, height: number): Box => ({ x, y, width, height });
+  const color = () => ({ r: random(), g: random(), b: random(), a: 1 });
+
+  const text = (name: string, characters: string, at: Box): FigmaNode => ({
+    id: id(),
+    name,
+    type: 'TEXT',
+    characters,
+    absoluteBoundingBox: at,
+    fills: [{ type: 'SOLID', color: color() }],
+    style: { fontFamily: 'Pretendard', fontWeight: 400, fontSize: 14, textAlignHorizontal: 'LEFT' },
+  } as FigmaNode);
+
+  const container = (type: string, name: string, at: Box, children: FigmaNode[]): FigmaNode => ({
+    id: id(),
+    name,
+    type,
+    absoluteBoundingBox: at,
+    fills: [{ type: 'SOLID', color: color() }],
+    children,
+  } as FigmaNode);
+
+  const buildScreen = (name: string, at: Box): FigmaNode => {
+    const pairCount = Math.max(1, Math.floor((textsPerFrame - 2) / 4));
+    const fillerCount = Math.max(0, textsPerFrame - 2 - pairCount * 2);
+
+    const fullList: FigmaNode[] = [];
+    for (let i = 0; i < pairCount; i++) {
+      fullList.push(text('full_list_label', String(i + 1), box(at.x, at.y + i * 40, 20, 20)));
+      fullList.push(text('full_list_desc', `${SENTENCES[Math.floor(random() * SENTENCES.length)]} (${name}-${i + 1})`, box(at.x + 24, at.y + i * 40, 300, 36)));
+    }
+
+    // Fillers are spread over the nesting levels; the description block sits innermost
+    const fillersPerLevel = Math.ceil(fillerCount / Math.max(1, depth));
+    let fillersLeft = fillerCount;
+    let inner: FigmaNode[] = [
+      container('FRAME', 'full_list', at, fullList),
+      text('label', '화면 정보', box(at.x, at.y + 600, 80, 20)),
+      text('value', random() < 0.2 ? '-' : `${name} 화면 정보`, box(at.x + 90, at.y + 600, 200, 20)),
+    ];
+    for (let level = depth; level > 0; level--) {
+      const fillers: FigmaNode[] = [];
+      for (let i = 0; i < fillersPerLevel && fillersLeft > 0; i++, fillersLeft--) {
+        fillers.push(text('button', FILLERS[Math.floor(random() * FILLERS.length)], box(at.x + i * 60, at.y + level * 30, 56, 24)));
+      }
+      inner = [container('GROUP', `Group ${level}`, at, [...fillers, ...inner])];
+    }
+    for (; fillersLeft > 0; fillersLeft--) {
+      inner.push(text('button', FILLERS[Math.floor(random() * FILLERS.length)], box(at.x, at.y + 700, 56, 24)));
+    }
+
+    return container('FRAME', name, at, inner);
+  };
+
+  const buildCover = (prefix: string, count: number, at: Box): FigmaNode =>
+    container('FRAME', '표지', at, [
+      text('title', `${prefix} 서비스 기획서`, box(at.x + 80, at.y + 400, 800, 80)),
+      text('range', `${prefix}_0001 ~ ${prefix}_${pad(count)}`, box(at.x + 80, at.y + 500, 600, 40)),
+      text('date', '24.03.15', box(at.x + 80, at.y + 560, 200, 30)),
+    ]);
+
+  const pages: FigmaNode[] = [];
+  let remaining = screens;
+  let prefixIndex = 0;
+  while (remaining > 0) {
+    const sections: FigmaNode[] = [];
+    for (let p = 0; p < prefixesPerPage && remaining > 0; p++, prefixIndex++) {
+      const prefix = `PFX${toLetters(prefixIndex)}`;
+      const count = Math.min(screensPerPrefix, remaining);
+      remaining -= count;
+
+      const children: FigmaNode[] = [];
+      if (covers) children.push(buildCover(prefix, count, box(0, p * 2000, 1920, 1080)));
+      let baseNumber = 0;
+      let variant = 0;
+      for (let s = 0; s < count; s++) {
+        if (baseNumber === 0 || random() >= variantRatio) {
+          baseNumber++;
+          variant = 0;
+        } else {
+          variant++;
+        }
+        const name = variant ? `${prefix}_${pad(baseNumber)}_${variant}` : `${prefix}_${pad(baseNumber)}`;
+        children.push(buildScreen(name, box(2000 + s * 400, p * 2000, 375, 812)));
+      }
+      sections.push(container('SECTION', `${prefix} 영역`, box(0, p * 2000, 2000 + count * 400, 1200), children));
+    }
+    pages.push(container('CANVAS', `Page ${pages.length + 1} 24.03.${String(pages.length + 1).padStart(2, '0')}`, box(0, 0, 0, 0), sections));
+  }
+
+  return {
+    name: `Synthetic ${screens} screens`,
+    version: `synthetic-${seed}-${screens}`,
+    lastModified: new Date(0).toISOString(),
+    document: { id: '0:0', name: 'Document', type: 'DOCUMENT', children: pages } as FigmaNode,
+  };
+};
+
+export const countNodes = (node: FigmaNode): number =>
+  1 + (node.children || []).reduce((sum, child) => sum + countNodes(child), 0);
+
+/**
+ * Edits one description in place, like a single change between two file versions
+ * Recorded files without synthetic names get their first TEXT node edited instead.
+ * Returns false when the tree has no text to edit
+ */
+export const editOneScreen = (document: FigmaNode): boolean => {
+  const find = (node: FigmaNode, matches: (n: FigmaNode) => boolean): FigmaNode | undefined => {
+    if (matches(node)) return node;
+    for (const child of node.children || []) {
+      const found = find(child, matches);
+      if (found) return found;
+    }
+    return undefined;
+  };
+
+  const target = find(document, n => n.name === 'full_list_desc' && !!n.characters)
+    || find(document, n => n.type === 'TEXT' && !!n.characters);
+  if (!target) return false;
+  target.characters = `${target.characters} (수정)`;
+  return true;
+};